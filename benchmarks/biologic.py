@@ -0,0 +1,141 @@
+"""Data path benchmark for the Biologic driver on a simulated EClib.
+
+Channels of a :class:`~nupylab.drivers.eclib_simulator.SimulatedEClib` run an OCV
+followed by a PEIS, as the NUPyLab Biologic instrument does, on a manual clock. Their
+memory is read with :meth:`~nupylab.drivers.biologic.BiologicPotentiostat.get_data_bulk`
+and the decoded data are checked:
+
+* OCV points are complete and evenly spaced in time, to within one timebase tick,
+* impedance points match the impedance of the simulated cell.
+
+Points and blocks decoded per second are reported, excluding the time the simulator
+spends generating data.
+
+Run from the repository root with:
+
+.. code-block:: bash
+
+    python benchmarks/biologic.py
+
+The exit code is 1 if any check fails.
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+# Import NUPyLab from this checkout, even if it is not installed
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nupylab.drivers.biologic import OCV, PEIS, BiologicPotentiostat  # noqa: E402
+from nupylab.drivers.eclib_simulator import TIME_BASE, SimulatedEClib  # noqa: E402
+
+#: Allowed relative deviation of decoded impedance, stored as float32.
+IMPEDANCE_ERROR: float = 1e-5
+
+
+def run(
+    channels: int = 4,
+    duration: float = 3600.0,
+    interval: float = 0.01,
+    poll: float = 10.0,
+    model: str = "SP300",
+) -> List[str]:
+    """Benchmark and check reading OCV and PEIS data from simulated channels.
+
+    Args:
+        channels: number of channels measuring.
+        duration: OCV duration in seconds.
+        interval: time between OCV points in seconds.
+        poll: simulated time between reads in seconds.
+        model: simulated device model.
+
+    Returns:
+        list of failure messages, empty if all checks pass.
+    """
+    now = [0.0]
+    sim = SimulatedEClib(model, channels, noise=0, clock=lambda: now[0])
+    biologic = BiologicPotentiostat(model, "USB0", eclib=sim)
+    biologic.connect()
+    biologic.load_firmware([1] * channels)
+    for c in range(channels):
+        biologic.load_techniques(
+            c,
+            (
+                OCV(duration=duration, record_every_dt=interval),
+                PEIS(duration_step=0, record_every_dt=interval, frequency_number=71),
+            ),
+        )
+    biologic.start_channels([1] * channels)
+
+    blocks = {c: [] for c in range(channels)}
+    elapsed = 0.0
+    running = True
+    while running:
+        now[0] += poll
+        # Let the simulator write the data to channel memory before timing the read
+        for c in range(channels):
+            biologic.get_channel_infos(c)
+        start = time.perf_counter()
+        for c, data in biologic.get_data_bulk(range(channels)).items():
+            blocks[c].extend(data)
+        elapsed += time.perf_counter() - start
+        running = any(biologic.channel_states.values())
+    biologic.disconnect()
+
+    failures: List[str] = []
+    points = sum(block.number_of_points for data in blocks.values() for block in data)
+    number = sum(len(data) for data in blocks.values())
+    print(f"{model}: {channels} channels, {points} points in {number} blocks")
+    print(f"    {'points /s':<20} {points / elapsed:12.3e}")
+    print(f"    {'blocks /s':<20} {number / elapsed:12.3e}")
+    for c, data in blocks.items():
+        ocv = [block for block in data if block.technique == "KBIO_TECHID_OCV"]
+        t = np.concatenate([block.time_numpy for block in ocv])
+        # Technique parameters are passed to the instrument as float32
+        if len(t) != int(np.float32(duration) / np.float32(interval)) + 1:
+            failures.append(f"channel {c} OCV has {len(t)} points")
+        spacing = float(np.max(np.abs(np.diff(t) - interval)))
+        if not spacing <= TIME_BASE + 1e-9:
+            failures.append(f"channel {c} OCV time spacing error {spacing:.3g}")
+        eis = [block for block in data if block.process == 1]
+        freq = np.concatenate([block.freq_numpy for block in eis])
+        abs_z = np.concatenate([b.abs_Ewe_numpy / b.abs_I_numpy for b in eis])
+        phase = np.concatenate([block.Phase_Zwe_numpy for block in eis])
+        expected = sim.impedance(freq)
+        error = np.abs(abs_z * np.exp(1j * phase) - expected) / np.abs(expected)
+        error = float(np.max(error))
+        if not error <= IMPEDANCE_ERROR:
+            failures.append(f"channel {c} impedance error {error:.3g}")
+    return failures
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run Biologic benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-c", "--channels", type=int, default=4, help="number of channels"
+    )
+    parser.add_argument(
+        "-d", "--duration", type=float, default=3600.0, help="OCV duration in s"
+    )
+    parser.add_argument(
+        "-i", "--interval", type=float, default=0.01, help="OCV point interval in s"
+    )
+    parser.add_argument(
+        "-p", "--poll", type=float, default=10.0, help="time between reads in s"
+    )
+    parser.add_argument("-m", "--model", default="SP300", help="device model")
+    args = parser.parse_args(argv)
+    failures = run(args.channels, args.duration, args.interval, args.poll, args.model)
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
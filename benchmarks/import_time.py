@@ -0,0 +1,120 @@
+"""Import-time regression benchmark for NUPyLab GUI entry points.
+
+Each GUI module is imported in a fresh interpreter, repeatedly, and the fastest import
+time is compared to a budget. Importing a GUI must also not load instrument drivers,
+PyVISA, or the Qt display stack, which are only needed once a measurement starts or
+the window opens.
+
+Run from the repository root with:
+
+.. code-block:: bash
+
+    python benchmarks/import_time.py
+
+The exit code is 1 if any entry point exceeds its budget or imports a deferred module.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional, Sequence
+
+#: GUI entry point modules and their import-time budgets in seconds.
+ENTRY_POINTS: Dict[str, float] = {
+    "nupylab.gui.s4_gui": 1.5,
+    "nupylab.gui.s8_gui": 1.5,
+    "nupylab.gui.safc_gui": 1.5,
+}
+
+#: Module prefixes that must not be imported by importing a GUI module.
+DEFERRED_MODULES: Sequence[str] = (
+    "nupylab.drivers",
+    "nupylab.utilities.nupylab_window",
+    "pymeasure.display",
+    "pymeasure.instruments",
+    "pyqtgraph",
+    "pyvisa",
+)
+
+_MEASURE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"time": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure(module: str) -> dict:
+    """Import `module` in a fresh interpreter.
+
+    Args:
+        module: name of module to import.
+
+    Returns:
+        dict with import time in seconds under `time` and names of all loaded modules
+        under `modules`.
+    """
+    env = dict(os.environ)
+    env.pop("READTHEDOCS", None)  # drivers must not be imported, even on Linux
+    output = subprocess.run(
+        [sys.executable, "-c", _MEASURE.format(module=module)],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def run(repeat: int = 5, scale: float = 1.0) -> List[str]:
+    """Benchmark all GUI entry points.
+
+    Args:
+        repeat: number of fresh interpreters to time each import in.
+        scale: factor applied to all budgets, e.g. for slow machines.
+
+    Returns:
+        list of failure messages, empty if all entry points are within budget.
+    """
+    failures: List[str] = []
+    for module, budget in ENTRY_POINTS.items():
+        results = [measure(module) for _ in range(repeat)]
+        best = min(result["time"] for result in results)
+        deferred = sorted(
+            name
+            for name in results[0]["modules"]
+            if name.startswith(tuple(DEFERRED_MODULES))
+        )
+        status = "ok" if best <= budget * scale and not deferred else "FAIL"
+        print(
+            f"{module:<24} {best * 1e3:8.1f} ms  (budget {budget * scale * 1e3:.0f} "
+            f"ms)  {status}"
+        )
+        if best > budget * scale:
+            failures.append(f"{module} took {best:.3f} s, over {budget * scale:.3f} s")
+        if deferred:
+            failures.append(f"{module} imported deferred modules: {deferred}")
+    return failures
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run import-time benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-n", "--repeat", type=int, default=5, help="imports timed per entry point"
+    )
+    parser.add_argument(
+        "-s", "--scale", type=float, default=1.0, help="factor applied to budgets"
+    )
+    args = parser.parse_args(argv)
+    failures = run(args.repeat, args.scale)
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""Round trip check of :mod:`nupylab.utilities.resistance_thermometers`.
+
+RTDs and a thermistor are converted from temperature to resistance and back:
+
+* over arrays spanning their full temperature range, including below 0 C,
+* for scalars, which must come back as 0-d arrays,
+
+and conversions per second of arrays are reported alongside.
+
+Run from the repository root with:
+
+.. code-block:: bash
+
+    python benchmarks/resistance_thermometers.py
+
+The exit code is 1 if any check fails.
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, List, Optional, Sequence, Union
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nupylab.utilities.resistance_thermometers import (  # noqa: E402
+    PT100,
+    PT1000,
+    RTD,
+    Thermistor,
+)
+
+#: Allowed round trip error in Celsius.
+ROUND_TRIP_ERROR: float = 1e-9
+
+#: Scalar temperatures in Celsius checked, including below 0 C.
+SCALAR_TEMPERATURES: Sequence[float] = (-200, -100, -0.5, 0, 25, 100, 850)
+
+#: Steinhart-Hart coefficients of a 10 kOhm NTC thermistor.
+THERMISTOR: Thermistor = Thermistor(1.125e-3, 2.347e-4, 8.566e-8)
+
+
+def _throughput(func: Callable[[np.ndarray], np.ndarray], values: np.ndarray) -> float:
+    """Get conversions per second of an array conversion."""
+    start = time.perf_counter()
+    func(values)
+    return len(values) / (time.perf_counter() - start)
+
+
+def check(
+    name: str, thermometer: Union[RTD, Thermistor], low: float, high: float, size: int
+) -> List[str]:
+    """Check round trips of a resistance thermometer and report throughput.
+
+    Args:
+        name: name of thermometer in report.
+        thermometer: RTD or thermistor to check.
+        low: lowest temperature checked in Celsius.
+        high: highest temperature checked in Celsius.
+        size: number of values converted per throughput measurement.
+
+    Returns:
+        list of failure messages, empty if all checks pass.
+    """
+    failures: List[str] = []
+    temperature = np.linspace(low, high, size)
+    resistance = thermometer.to_resistance(temperature)
+    error = float(np.max(np.abs(thermometer.to_temperature(resistance) - temperature)))
+    if not error <= ROUND_TRIP_ERROR:
+        failures.append(f"{name} array round trip error {error:.3g}")
+
+    for t in SCALAR_TEMPERATURES:
+        if not low <= t <= high:
+            continue
+        try:
+            r = thermometer.to_resistance(t)
+            round_trip = thermometer.to_temperature(float(r))
+        except Exception as e:
+            failures.append(f"{name} scalar {t} C failed: {e!r}")
+            continue
+        if not (isinstance(round_trip, np.ndarray) and round_trip.ndim == 0):
+            failures.append(f"{name} scalar {t} C returned {type(round_trip)}")
+        elif not abs(float(round_trip) - t) <= ROUND_TRIP_ERROR:
+            failures.append(f"{name} scalar {t} C round trip gave {float(round_trip)}")
+
+    print(f"{name}: {'ok' if not failures else 'FAIL'}")
+    print(f"    {'round trip error':<20} {error:12.3e}")
+    forward = _throughput(thermometer.to_resistance, temperature)
+    inverse = _throughput(thermometer.to_temperature, resistance)
+    print(f"    {'to_resistance /s':<20} {forward:12.3e}")
+    print(f"    {'to_temperature /s':<20} {inverse:12.3e}")
+    return failures
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run resistance thermometer check from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-n",
+        "--size",
+        type=int,
+        default=1_000_000,
+        help="values per array round trip and throughput measurement",
+    )
+    args = parser.parse_args(argv)
+    failures = check("Pt100", PT100, -200, 850, args.size)
+    failures += check("Pt1000", PT1000, -200, 850, args.size)
+    failures += check("NTC thermistor", THERMISTOR, -40, 150, args.size)
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
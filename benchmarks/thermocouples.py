@@ -0,0 +1,275 @@
+"""Accuracy and throughput benchmark for :mod:`nupylab.utilities.thermocouples`.
+
+All thermocouple types are checked across their full forward (temperature to voltage)
+and inverse (voltage to temperature) ranges:
+
+* forward conversions against NIST ITS-90 table values, and against the NIST reference
+  polynomials evaluated term by term in exact rational arithmetic,
+* inverse conversions against the temperatures of reference voltages, within the error
+  bands NIST states for its inverse polynomials,
+* lookup tables against the polynomials they approximate, within the table
+  tolerances, at grid and random values,
+* round trips from temperature to voltage and back,
+
+for the scalar, vectorized and lookup table paths. Conversions per second of each path
+are reported alongside.
+
+Run from the repository root with:
+
+.. code-block:: bash
+
+    python benchmarks/thermocouples.py
+
+The exit code is 1 if any error exceeds its limit, so optimizations cannot silently
+break accuracy.
+"""
+
+import argparse
+import os
+import sys
+import time
+from fractions import Fraction
+from math import exp
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Import NUPyLab from this checkout, even if it is not installed
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nupylab.utilities import thermocouples as tc  # noqa: E402
+
+#: NIST ITS-90 table values as (temperature in Celsius, voltage in millivolts), with
+#: voltages rounded to 1 microvolt.
+NIST_TABLE: Dict[str, Sequence[Tuple[float, float]]] = {
+    "B": ((100, 0.033), (500, 1.242), (1000, 4.834), (1820, 13.820)),
+    "E": ((-200, -8.825), (100, 6.319), (500, 37.005), (1000, 76.373)),
+    "J": ((-210, -8.095), (100, 5.269), (500, 27.393), (1000, 57.953), (1200, 69.553)),
+    "K": (
+        (-200, -5.891),
+        (-100, -3.554),
+        (100, 4.096),
+        (200, 8.138),
+        (500, 20.644),
+        (1000, 41.276),
+        (1372, 54.886),
+    ),
+    "N": ((-200, -3.990), (100, 2.774), (500, 16.748), (1000, 36.256), (1300, 47.513)),
+    "R": ((100, 0.647), (500, 4.471), (1000, 10.506), (1768, 21.101)),
+    "S": ((100, 0.646), (500, 4.233), (1000, 9.587), (1768, 18.693)),
+    "T": ((-270, -6.258), (-200, -5.603), (100, 4.279), (400, 20.872)),
+}
+
+#: Largest error in Celsius NIST states for each type's inverse polynomials.
+INVERSE_ERROR: Dict[str, float] = {
+    "B": 0.03,
+    "E": 0.03,
+    "J": 0.05,
+    "K": 0.06,
+    "N": 0.04,
+    "R": 0.02,
+    "S": 0.02,
+    "T": 0.04,
+}
+
+#: Allowed deviation in millivolts of NIST table values, which are rounded.
+TABLE_ROUNDING: float = 0.0005
+#: Allowed deviation in millivolts of forward conversions from exact evaluation.
+FORWARD_ERROR: float = 1e-9
+
+
+def reference_voltage(temperature: float, tc_type: str) -> float:
+    """Evaluate NIST reference polynomial in exact rational arithmetic.
+
+    Args:
+        temperature: temperature in Celsius.
+        tc_type: thermocouple type.
+
+    Returns:
+        voltage in millivolts.
+    """
+    table = getattr(tc, f"TYPE_{tc_type}")
+    subset = next(subset for subset in table if temperature <= subset[1])
+    coefficients = subset[2:-3] if tc_type == "K" else subset[2:]
+    x = Fraction(temperature)
+    result = float(sum(Fraction(c) * x**i for i, c in enumerate(coefficients)))
+    if tc_type == "K":
+        a0, a1, a2 = subset[-3:]
+        result += a0 * exp(a1 * (temperature - a2) ** 2)
+    return result
+
+
+def _throughput(function: Callable, values: np.ndarray, scalar: bool) -> float:
+    """Get conversions per second of `function` on `values`."""
+    start = time.perf_counter()
+    if scalar:
+        for value in values.tolist():
+            function(value)
+    else:
+        function(values)
+    return values.size / (time.perf_counter() - start)
+
+
+def check_type(tc_type: str, step: float, size: int) -> Tuple[dict, List[str]]:
+    """Check accuracy and measure throughput of one thermocouple type.
+
+    Args:
+        tc_type: thermocouple type.
+        step: temperature grid spacing in Celsius.
+        size: number of values converted per vectorized throughput measurement.
+
+    Returns:
+        dict of maximum errors and conversion rates, and list of failure messages.
+    """
+    converter = tc.get_converter(tc_type)
+    failures: List[str] = []
+    result: dict = {}
+
+    def check(name: str, error: float, limit: float) -> None:
+        result[name] = error
+        if not error <= limit:
+            failures.append(f"type {tc_type} {name} error {error:.3g} over {limit:.3g}")
+
+    anchors = np.array(NIST_TABLE[tc_type], dtype=float)
+    check(
+        "NIST table",
+        float(
+            np.max(np.abs(converter.to_voltage_array(anchors[:, 0]) - anchors[:, 1]))
+        ),
+        TABLE_ROUNDING,
+    )
+
+    # Forward conversions over full temperature range
+    low, high = converter.temperature_range
+    temperature = np.append(np.arange(low, high, step), high)
+    voltage = np.array([reference_voltage(t, tc_type) for t in temperature.tolist()])
+    forward = {
+        "scalar": np.array([converter.to_voltage(t) for t in temperature.tolist()]),
+        "vector": converter.to_voltage_array(temperature),
+        "table": converter.to_voltage_interpolated(temperature, "linear"),
+        "cubic": converter.to_voltage_interpolated(temperature, "cubic"),
+    }
+    for path, values in forward.items():
+        if path in ("scalar", "vector"):
+            limit = FORWARD_ERROR
+        else:
+            limit = tc.VOLTAGE_TABLE_TOLERANCE
+        check(f"forward {path}", float(np.max(np.abs(values - voltage))), limit)
+
+    # Inverse conversions and round trips over temperatures in inverse range
+    low, high = converter.voltage_range
+    inside = (voltage >= low) & (voltage <= high)
+    temperature, voltage = temperature[inside], voltage[inside]
+    slope = float(np.max(np.gradient(temperature, voltage)))  # largest dT/dV
+    inverse = {
+        "scalar": (
+            np.array([converter.to_temperature(v) for v in voltage.tolist()]),
+            forward["scalar"][inside],
+        ),
+        "vector": (converter.to_temperature_array(voltage), forward["vector"][inside]),
+        "table": (
+            converter.to_temperature_interpolated(voltage, "linear"),
+            forward["table"][inside],
+        ),
+        "cubic": (
+            converter.to_temperature_interpolated(voltage, "cubic"),
+            forward["cubic"][inside],
+        ),
+    }
+    for path, (values, forward_values) in inverse.items():
+        limit = INVERSE_ERROR[tc_type]
+        if path in ("table", "cubic"):
+            limit += tc.TEMPERATURE_TABLE_TOLERANCE
+        check(f"inverse {path}", float(np.max(np.abs(values - temperature))), limit)
+        if path == "scalar":
+            round_trip = np.array(
+                [converter.to_temperature(v) for v in forward_values.tolist()]
+            )
+        elif path == "vector":
+            round_trip = converter.to_temperature_array(forward_values)
+        else:
+            round_trip = converter.to_temperature_interpolated(
+                forward_values, "linear" if path == "table" else "cubic"
+            )
+            limit += tc.VOLTAGE_TABLE_TOLERANCE * slope
+        check(
+            f"round trip {path}",
+            float(np.max(np.abs(round_trip - temperature))),
+            limit,
+        )
+
+    # Lookup tables against the polynomials they approximate, also between table nodes
+    rng = np.random.default_rng(0)
+    readings = rng.uniform(low, high, size)
+    t_low, t_high = converter.temperature_range
+    temperatures = np.append(temperature, rng.uniform(t_low, t_high, size))
+    voltages = np.append(voltage, readings)
+    for path, kind in (("table", "linear"), ("cubic", "cubic")):
+        table = converter.to_voltage_interpolated(temperatures, kind)
+        error = float(np.max(np.abs(table - converter.to_voltage_array(temperatures))))
+        check(f"forward {path}/poly", error, tc.VOLTAGE_TABLE_TOLERANCE)
+        table = converter.to_temperature_interpolated(voltages, kind)
+        error = float(np.max(np.abs(table - converter.to_temperature_array(voltages))))
+        check(f"inverse {path}/poly", error, tc.TEMPERATURE_TABLE_TOLERANCE)
+
+    # Throughput of inverse conversions, as used for logged readings
+    result["scalar /s"] = _throughput(converter.to_temperature, readings[:20000], True)
+    result["vector /s"] = _throughput(converter.to_temperature_array, readings, False)
+    result["table /s"] = _throughput(
+        converter.to_temperature_interpolated, readings, False
+    )
+    result["cubic /s"] = _throughput(
+        lambda x: converter.to_temperature_interpolated(x, "cubic"), readings, False
+    )
+    return result, failures
+
+
+def run(step: float = 0.5, size: int = 1_000_000) -> List[str]:
+    """Check and benchmark all thermocouple types.
+
+    Args:
+        step: temperature grid spacing in Celsius.
+        size: number of values converted per vectorized throughput measurement.
+
+    Returns:
+        list of failure messages, empty if all errors are within limits.
+    """
+    failures: List[str] = []
+    for tc_type in tc.THERMOCOUPLE_TYPES:
+        # Build lookup tables before timing
+        for kind in ("linear", "cubic"):
+            tc.get_converter(tc_type).temperature_table(kind)
+            tc.get_converter(tc_type).voltage_table(kind)
+        result, type_failures = check_type(tc_type, step, size)
+        failures.extend(type_failures)
+        print(f"Type {tc_type}: {'ok' if not type_failures else 'FAIL'}")
+        for name, value in result.items():
+            if name.endswith("/s"):
+                print(f"    {name:<20} {value:12.3e} conversions")
+            else:
+                print(f"    {name:<20} {value:12.3e}")
+    return failures
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run thermocouple benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-s", "--step", type=float, default=0.5, help="temperature grid spacing in C"
+    )
+    parser.add_argument(
+        "-n",
+        "--size",
+        type=int,
+        default=1_000_000,
+        help="values per vectorized throughput measurement",
+    )
+    args = parser.parse_args(argv)
+    failures = run(args.step, args.size)
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
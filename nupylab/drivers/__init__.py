@@ -1,4 +1,22 @@
-from .biologic import BiologicPotentiostat
-from .eurotherm2200 import Eurotherm2200
-from .eurotherm2400 import Eurotherm2400
-from .eurotherm3216 import Eurotherm3216
+import importlib
+
+# Driver classes available from the package, imported from their modules on first use
+_DRIVERS = {
+    "BiologicPotentiostat": ".biologic",
+    "Eurotherm2200": ".eurotherm2200",
+    "Eurotherm2400": ".eurotherm2400",
+    "Eurotherm3216": ".eurotherm3216",
+    "SimulatedEClib": ".eclib_simulator",
+}
+
+__all__ = list(_DRIVERS)
+
+
+def __getattr__(name):
+    if name in _DRIVERS:
+        return getattr(importlib.import_module(_DRIVERS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -35,6 +35,10 @@
  on **Linux**, this can be achieved by running in Wine. This requires the
  NUPyLab and Python installation to also be installed in a Wine environment.
 
+.. note :: Without an instrument, e.g. for testing and benchmarking, a
+ :class:`~nupylab.drivers.eclib_simulator.SimulatedEClib` can be passed as the
+ ``eclib`` argument in place of the DLL. This works on any platform.
+
 .. note:: All methods mentioned in the documentation are implemented unless
  mentioned in the list below:
 
@@ -43,7 +47,6 @@
  * (Communications) BL_GetUSBdeviceinfos (Not implemented)
  * (Channel information) BL_GetHardConf (N/A, only available w. SP300 series)
  * (Channel information) BL_SetHardConf (N/A, only available w. SP300 series)
- * (Technique) BL_UpdateParameters (Not implemented)
  * (Data) BL_GetFCTData (Not implemented)
  * (Misc) BL_SetExperimentInfos (Not implemented)
  * (Misc) BL_GetExperimentInfos (Not implemented)
@@ -57,6 +60,9 @@ from __future__ import annotations
 import inspect
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import sleep
 from collections import namedtuple
 from ctypes import (
     POINTER,
@@ -70,28 +76,30 @@ from ctypes import (
     c_uint8,
     cast,
     create_string_buffer,
+    memset,
+    sizeof,
+)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Tuple,
+    Type,
+    Union,
 )
-from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING, Type, Union
 
-import_err = None
 try:
     from ctypes import WinDLL
-except ImportError as e:
-    import_err = e
-if import_err is not None:
-    # Let the module continue after this fatal import error if we are running
-    # on read the docs or we can detect that sphinx is imported
-    if not (os.environ.get("READTHEDOCS", None) == "True" or "sphinx" in sys.modules):
-        raise import_err
-del import_err
-
-# Numpy is only required if it is desired to get the data as numpy arrays
-try:
-    import numpy as np
-
-    GOT_NUMPY = True
 except ImportError:
-    GOT_NUMPY = False
+    # Not on Windows, so only a simulated EClib can be used, see eclib_simulator
+    WinDLL = None
+
+import numpy as np
 
 if TYPE_CHECKING:
     from ctypes import Array
@@ -146,7 +154,12 @@ class BiologicPotentiostat:
     """
 
     def __init__(
-        self, model: str, address: str, eclib_path: Optional[str] = None
+        self,
+        model: str,
+        address: str,
+        eclib_path: Optional[str] = None,
+        check_buffer_tail: bool = False,
+        eclib: Optional[Any] = None,
     ) -> None:
         r"""Initialize the potentiostat driver.
 
@@ -159,9 +172,16 @@ class BiologicPotentiostat:
                 C:\EC-Lab Development Package\EC-Lab Development Package\.
                 If no value is given the default location will be used. The 32/64 bit
                 status is inferred for selecting the proper DLL file.
+            check_buffer_tail: Debug option to clear the data buffer before each
+                :meth:`get_data` call and assert that slots after the returned data
+                are still zero.
+            eclib: Object to use in place of the EClib DLL, e.g. a
+                :class:`~nupylab.drivers.eclib_simulator.SimulatedEClib`. If given, no
+                DLLs are loaded and the BLFind functions are unavailable.
 
         Raises:
             WindowsError: If the EClib DLL cannot be found
+            OSError: If no `eclib` is given and not running on Windows
         """
         model = "KBIO_DEV_" + model.replace("-", "").replace(" ", "").upper()
         self.model = model
@@ -174,8 +194,21 @@ class BiologicPotentiostat:
             raise ECLibCustomException(-8000, message)
 
         self.address = address
+        self.check_buffer_tail = check_buffer_tail
         self._id: Optional[c_int32] = None
         self._device_info: Optional[DeviceInfos] = None
+        # Data buffer, its pointer, DataInfos and CurrentValues, reused by channel
+        self._data_buffers: Dict[int, tuple] = {}
+        self._parse_pool: Optional[ThreadPoolExecutor] = None
+        # :Channel state as of the last data read, by channel, translate with STATES
+        self.channel_states: Dict[int, int] = {}
+
+        if eclib is not None:
+            self._eclib = eclib
+            self._blfind = None
+            return
+        if WinDLL is None:
+            raise OSError("The EClib DLL requires Windows, pass a simulated eclib.")
 
         # Load the EClib dll
         if eclib_path is None:
@@ -299,6 +332,9 @@ class BiologicPotentiostat:
         self.check_eclib_return_code(ret)
         self._id = None
         self._device_info = None
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
 
     def test_connection(self) -> None:
         """Test the connection."""
@@ -320,7 +356,8 @@ class BiologicPotentiostat:
                 NOTE: The length of the list corresponds to the number of channels
                 supported by the equipment, not the number of channels installed.
             force_reload: If True the firmware is forcefully reloaded, even if it was
-                already loaded
+                already loaded. Loading takes seconds per connection, see
+                :meth:`firmware_loaded` to skip channels that are ready.
 
         Returns:
             List of integers indicating the success of loading the firmware on the
@@ -403,6 +440,25 @@ class BiologicPotentiostat:
         out["MaxBandwidth"] = BANDWIDTHS.get(out["MaxBandwidth"])
         return out
 
+    def firmware_loaded(self, channel: int, version: Optional[int] = None) -> bool:
+        """Get whether the kernel firmware is loaded on the specified channel.
+
+        Args:
+            channel: Selected channel, zero based (0-15 on most devices).
+            version: expected firmware version, as reported in FirmwareVersion of
+                :meth:`get_channel_infos`. If None, any valid version is accepted,
+                including a stale kernel left by another program.
+
+        Returns:
+            Whether the channel reports kernel firmware with the expected version.
+        """
+        infos = self.get_channel_infos(channel)
+        if infos["FirmwareCode(translated)"] != "KBIO_FIRM_KERNEL":
+            return False
+        if version is None:
+            return infos["FirmwareVersion"] > 0
+        return infos["FirmwareVersion"] == version
+
     def get_message(self, channel: int) -> bytes:
         """Return a message from the firmware of a channel."""
         size = c_uint32(4096)
@@ -435,33 +491,86 @@ class BiologicPotentiostat:
         Raises:
             ECLibError: On errors from the EClib communications library.
         """
-        c_technique_file: bytes
-        if self.series == "sp300":
-            filename, ext = os.path.splitext(technique.technique_filename)
-            c_technique_file = (filename + "4" + ext).encode("utf-8")
-        else:
-            c_technique_file = technique.technique_filename.encode("utf-8")
-
-        # Init TECCParams
-        c_tecc_params = TECCParams()
-        # Get the array of parameter structs
         c_params = technique.c_args(self)
-        # Set the len
-        c_tecc_params.len = len(c_params)
-        p_params = cast(c_params, POINTER(TECCParam))
-        c_tecc_params.pParams = p_params
-
         ret = self._eclib.BL_LoadTechnique(
             self._id,
             channel,
-            c_technique_file,
-            c_tecc_params,
+            self._technique_file(technique),
+            self._tecc_params(c_params),
             first,
             last,
             display,
         )
         self.check_eclib_return_code(ret)
 
+    def load_techniques(
+        self, channel: int, techniques: Sequence[Technique], display: bool = False
+    ) -> None:
+        """Load a sequence of techniques on the specified channel.
+
+        Once started, the channel runs the techniques one after another without host
+        intervention. A technique can be ended early with :meth:`update_parameters`,
+        e.g. by setting the duration of an :class:`.OCV` to zero.
+
+        Args:
+            channel: the number of the channel to load the techniques onto, 0-15.
+            techniques: the techniques to load, in the order they are run.
+            display: whether to display the loading progress.
+
+        Raises:
+            ECLibError: On errors from the EClib communications library.
+        """
+        for index, technique in enumerate(techniques):
+            self.load_technique(
+                channel,
+                technique,
+                first=index == 0,
+                last=index == len(techniques) - 1,
+                display=display,
+            )
+
+    def update_parameters(
+        self, channel: int, technique_index: int, technique: Technique
+    ) -> None:
+        """Update the parameters of a technique loaded on the specified channel.
+
+        The channel keeps running, so this can be used to move a running technique
+        sequence on from the host.
+
+        Args:
+            channel: the number of the channel, 0-15.
+            technique_index: index of the technique in the loaded sequence, 0-based.
+            technique: technique of the same type as the loaded one, with the new
+                parameters.
+
+        Raises:
+            ECLibError: On errors from the EClib communications library.
+        """
+        c_params = technique.c_args(self)
+        ret = self._eclib.BL_UpdateParameters(
+            self._id,
+            channel,
+            technique_index,
+            self._tecc_params(c_params),
+            self._technique_file(technique),
+        )
+        self.check_eclib_return_code(ret)
+
+    def _technique_file(self, technique: Technique) -> bytes:
+        """Get technique filename for the instrument series."""
+        if self.series == "sp300":
+            filename, ext = os.path.splitext(technique.technique_filename)
+            return (filename + "4" + ext).encode("utf-8")
+        return technique.technique_filename.encode("utf-8")
+
+    @staticmethod
+    def _tecc_params(c_params: Array[TECCParam]) -> TECCParams:
+        """Get TECCParams structure pointing to array of parameter structs."""
+        c_tecc_params = TECCParams()
+        c_tecc_params.len = len(c_params)
+        c_tecc_params.pParams = cast(c_params, POINTER(TECCParam))
+        return c_tecc_params
+
     def define_bool_parameter(
         self, label: str, value: bool, index: int, tecc_param: TECCParam
     ) -> None:
@@ -630,11 +739,40 @@ class BiologicPotentiostat:
         Returns:
             A :class:`.KBIOData` object or None if no data was available.
         """
-        # Raw data is retrieved in an array of integers
-        c_databuffer = (c_uint32 * 1000)()
-        p_data_buffer = cast(c_databuffer, POINTER(c_uint32))
-        c_data_infos = DataInfos()
-        c_current_values = CurrentValues()
+        c_databuffer, c_data_infos, c_current_values = self._read_data(channel)
+
+        # The KBIOData will ask the appropriate techniques for which data
+        # fields they return data in
+        data: KBIOData = KBIOData(
+            c_databuffer,
+            c_data_infos,
+            c_current_values,
+            self,
+            check_tail=self.check_buffer_tail,
+        )
+        if data.technique == "KBIO_TECHID_NONE":
+            return None
+        return data
+
+    def _read_data(
+        self, channel: int
+    ) -> Tuple[Array[c_uint32], DataInfos, CurrentValues]:
+        """Read data of channel into its buffers, and record channel state."""
+        # Raw data is retrieved in an array of integers. Buffers are allocated once
+        # per channel, as KBIOData copies the values out of them.
+        if channel not in self._data_buffers:
+            c_databuffer = (c_uint32 * DATA_BUFFER_SIZE)()
+            self._data_buffers[channel] = (
+                c_databuffer,
+                cast(c_databuffer, POINTER(c_uint32)),
+                DataInfos(),
+                CurrentValues(),
+            )
+        c_databuffer, p_data_buffer, c_data_infos, c_current_values = (
+            self._data_buffers[channel]
+        )
+        if self.check_buffer_tail:
+            memset(c_databuffer, 0, sizeof(c_databuffer))
 
         ret = self._eclib.BL_GetData(
             self._id,
@@ -644,13 +782,113 @@ class BiologicPotentiostat:
             byref(c_current_values),
         )
         self.check_eclib_return_code(ret)
+        self.channel_states[channel] = c_current_values.State
+        return c_databuffer, c_data_infos, c_current_values
 
-        # The KBIOData will ask the appropriate techniques for which data
-        # fields they return data in
-        data: KBIOData = KBIOData(c_databuffer, c_data_infos, c_current_values, self)
-        if data.technique == "KBIO_TECHID_NONE":
-            return None
-        return data
+    def get_pending_data(self, channel: int) -> List[KBIOData]:
+        """Get all data waiting on the specified channel.
+
+        Reads the channel until its memory is empty and the last data buffer was not
+        full, so no points are left behind between calls.
+
+        Args:
+            channel: The number of the channel (zero based).
+
+        Returns:
+            A list of :class:`.KBIOData` objects, empty if no data was available.
+        """
+        return self.get_data_bulk((channel,))[channel]
+
+    def get_data_bulk(self, channels: Sequence[int]) -> Dict[int, List[KBIOData]]:
+        """Get all data waiting on several channels.
+
+        All channels are read in one pass, repeating the pass only for channels with
+        more data waiting, as in :meth:`get_pending_data`. The raw buffers are then
+        parsed in parallel. The state of each channel is taken from the
+        :class:`.CurrentValues` returned with its data and stored in
+        :attr:`channel_states`, so no separate :meth:`get_channel_infos` call is needed.
+
+        Args:
+            channels: The numbers of the channels (zero based).
+
+        Returns:
+            A dict of lists of :class:`.KBIOData` objects by channel, with empty lists
+            for channels without data.
+        """
+        raw: Dict[int, list] = {channel: [] for channel in channels}
+        pending = list(channels)
+        while pending:
+            waiting = []
+            for channel in pending:
+                c_databuffer, c_data_infos, c_current_values = self._read_data(channel)
+                if c_data_infos.TechniqueID == 0:
+                    continue
+                # Copy, as the buffers are reused by the next read of the channel
+                raw[channel].append(
+                    (
+                        np.frombuffer(c_databuffer, dtype=np.uint32).copy(),
+                        DataInfos.from_buffer_copy(c_data_infos),
+                        CurrentValues.from_buffer_copy(c_current_values),
+                    )
+                )
+                words = c_data_infos.NbRows * c_data_infos.NbCols
+                full = words + c_data_infos.NbCols > DATA_BUFFER_SIZE
+                if c_current_values.MemFilled > 0 or full:
+                    waiting.append(channel)
+            pending = waiting
+
+        def parse(args: tuple) -> KBIOData:
+            return KBIOData(*args, self, check_tail=self.check_buffer_tail)
+
+        blocks = [args for channel in channels for args in raw[channel]]
+        if len(blocks) > 1:
+            if self._parse_pool is None:
+                self._parse_pool = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="BiologicParse"
+                )
+            parsed = self._parse_pool.map(parse, blocks)
+        else:
+            parsed = map(parse, blocks)
+        return {channel: [next(parsed) for _ in raw[channel]] for channel in channels}
+
+    def stream_data(
+        self,
+        channel: int,
+        interval: float = 0.1,
+        min_interval: float = 0.01,
+        max_interval: float = 1.0,
+        fill_target: float = 0.5,
+        running: Optional[Callable[[], bool]] = None,
+    ) -> Iterator[KBIOData]:
+        """Stream data blocks from the specified channel, adapting the poll interval.
+
+        After each poll, the interval is scaled so that the data buffer is filled to
+        about `fill_target`. Data left in the channel memory is read immediately, see
+        :meth:`get_pending_data`.
+
+        Args:
+            channel: The number of the channel (zero based).
+            interval: Initial time between polls in seconds.
+            min_interval: Shortest time between polls in seconds.
+            max_interval: Longest time between polls in seconds.
+            fill_target: Fraction of the data buffer to fill between polls.
+            running: Function indicating whether to continue streaming. If None, stream
+                until the generator is closed.
+
+        Yields:
+            :class:`.KBIOData` objects in the order they were measured.
+        """
+        while running is None or running():
+            blocks = self.get_pending_data(channel)
+            yield from blocks
+            # Buffers' worth of data measured since the last poll
+            fill = (
+                sum(data.number_of_points * data.number_of_columns for data in blocks)
+                / DATA_BUFFER_SIZE
+            )
+            interval = interval * fill_target / fill if fill > 0 else interval * 2
+            interval = min(max(interval, min_interval), max_interval)
+            sleep(interval)
 
     def convert_numeric_into_single(self, numeric: int) -> float:
         """Convert a numeric (integer) into a float.
@@ -897,11 +1135,14 @@ class KBIOData:
     * kbio_data.Ewe
     * kbio_data.I
 
-    Provided that numpy is installed, the data can also be obtained as numpy
-    arrays by appending '_numpy' to the attribute name. E.g:
+    The data is stored as numpy arrays, which can be obtained by appending '_numpy' to
+    the attribute name. E.g:
 
     * kbio_data.Ewe_numpy
     * kbio_data.I_numpy
+
+    Arrays and lists are cached on first access and shared between accesses, so the
+    arrays are read-only.
     """
 
     def __init__(
@@ -910,6 +1151,7 @@ class KBIOData:
         c_data_infos: DataInfos,
         c_current_values: CurrentValues,
         instrument: BiologicPotentiostat,
+        check_tail: bool = False,
     ) -> None:
         """Initialize the KBIOData object.
 
@@ -919,6 +1161,7 @@ class KBIOData:
             c_data_infos: :class:`.DataInfos` structure.
             c_current_values: :class:`.CurrentValues` structure.
             instrument: Instrument instance of :class:`.BiologicPotentiostat`.
+            check_tail: Whether to assert that the buffer is blank after the data.
 
         Raises:
             ECLibCustomException: Where the error codes indicate the following:
@@ -932,6 +1175,8 @@ class KBIOData:
         """
         technique_id = c_data_infos.TechniqueID
         self.technique: str = TECHNIQUE_IDENTIFIERS[technique_id]
+        # Bytes of data still waiting in the channel memory
+        self.memory_filled: int = c_current_values.MemFilled
 
         # Technique 0 means no data, get_data checks for this, so just return
         if technique_id == 0:
@@ -948,16 +1193,11 @@ class KBIOData:
         self.number_of_columns = c_data_infos.NbCols
         self.starttime = c_data_infos.StartTime
 
-        # Make lists for the data in properties named after the field_names
-        for data_field in self.data_fields:
-            setattr(self, data_field.name, [])
-
-        # Process data fields either have `t`  or `t_high` and `t_low`
-        if not hasattr(self, "t"):
-            self.time: List[float] = []  # TODO: add time to data fields
+        # Parsed data as read-only arrays, by field name
+        self._columns: Dict[str, np.ndarray] = {}
 
         # Parse the data
-        self._parse_data(c_databuffer, c_current_values.TimeBase, instrument)
+        self._parse_data(c_databuffer, c_current_values.TimeBase, check_tail)
 
     def _init_data_fields(self, instrument: BiologicPotentiostat) -> List[DataField]:
         """Initialize the data fields property."""
@@ -1005,110 +1245,90 @@ class KBIOData:
         self,
         c_databuffer: Array[c_uint32],
         timebase: int,
-        instrument: BiologicPotentiostat,
+        check_tail: bool = False,
     ) -> None:
-        """Parse the data and write to c_databuffer.
+        """Parse the data in c_databuffer.
+
+        The buffer is decoded through a numpy view, with float fields reinterpreted
+        from their uint32 bit patterns instead of converting each value with
+        :meth:`.BiologicPotentiostat.convert_numeric_into_single`.
 
         Args:
             c_databuffer: ctypes array of :py:class:`ctypes.c_uint32` used as the data
                 buffer.
             timebase: The timebase for the time calculation in microseconds.
-            instrument: Instrument instance of :class:`.BiologicPotentiostat`.
+            check_tail: Whether to assert that the buffer is blank after the data.
         """
-        # The data is written as one long array of points with a certain
-        # amount of colums. Get the index of the first item of each point by
-        # getting the range from 0 til n_point * n_columns in jumps of
-        # n_columns
-        for index in range(
-            0, self.number_of_points * self.number_of_columns, self.number_of_columns
-        ):
-            # If there is a special time variable
-            if hasattr(self, "time"):
-                # Calculate the time
-                t_high = c_databuffer[index]
-                t_low = c_databuffer[index + 1]
-                # NOTE: The documentation uses a bitshift operation for the:
-                # ((t_high * 2 ** 32) + tlow) operation as
-                # ((thigh << 32) + tlow), but I could not be bothered to
-                # figure out exactly how a bitshift operation is defined for
-                # an int class that can change internal representation, so I
-                # just do the explicit multiplication
-                self.time.append(self.starttime + timebase * ((t_high * 2**32) + t_low))
-                # Only offset reading the rest of the variables if there is a
-                # special conversion time variable
-                time_variable_offset = 2
-            else:
-                time_variable_offset = 0
-
-            # Get remaining fields as defined in data fields
-            value: Union[int, float]
-            for field_number, data_field in enumerate(self.data_fields):
-                value = c_databuffer[index + time_variable_offset + field_number]
-                # If the type is supposed to be a float, convert the numeric to
-                # float using the convenience function
-                if data_field.type is c_float:
-                    value = instrument.convert_numeric_into_single(value)
+        # The data is written as one long array of points with a certain amount of
+        # columns
+        size = self.number_of_points * self.number_of_columns
+        raw = np.frombuffer(c_databuffer, dtype=np.uint32)
+        rows = raw[:size].reshape(self.number_of_points, self.number_of_columns)
 
-                # Append the field value to the appropriate list in a property
-                getattr(self, data_field.name).append(value)
+        # Process data fields either have `t`  or `t_high` and `t_low`
+        if "t" not in self.data_field_names:
+            # Time is (t_high << 32) + t_low ticks of the timebase after start time
+            ticks = rows[:, 0].astype(np.uint64) << np.uint64(32)
+            ticks |= rows[:, 1]
+            self._columns["time"] = self.starttime + timebase * ticks.astype(float)
+            # Only offset reading the rest of the variables if there is a special
+            # conversion time variable
+            time_variable_offset = 2
+        else:
+            time_variable_offset = 0
+
+        # Get remaining fields as defined in data fields. Floats are stored as uint32
+        # with the same bit representation, so view them as float32. Columns are
+        # copied, as the buffer is reused by the next get_data call.
+        floats = rows.view(np.float32)
+        for field_number, data_field in enumerate(self.data_fields):
+            column = time_variable_offset + field_number
+            if data_field.type is c_float:
+                values = floats[:, column].astype(float)
+            elif data_field.type is c_uint32:
+                values = rows[:, column].astype(int)
+            else:
+                message = (
+                    f"Unable to infer the numpy data type for "
+                    f"data field: {data_field.name}"
+                )
+                raise ValueError(message)
+            self._columns[data_field.name] = values
+        for values in self._columns.values():
+            values.flags.writeable = False
 
         # Check that the rest of the buffer is blank
-        for index in range(self.number_of_points * self.number_of_columns, 1000):
-            assert c_databuffer[index] == 0
+        if check_tail:
+            assert not raw[size:].any(), "Data buffer not blank after data."
 
-    def __getattr__(self, key: str) -> np.ndarray:
-        """Return generated numpy arrays for the data instead of lists, if requested.
+    def __getattr__(self, key: str) -> Union[np.ndarray, List[float]]:
+        """Return data field as a list, or as a numpy array if requested.
 
-        Requested property must be in the form field_name + '_numpy'.
+        Numpy arrays are requested in the form field_name + '_numpy'. The result is
+        cached as an instance attribute, so this is only called on first access.
 
         Args:
-            key: data field to return as numpy array.
+            key: data field to return, with '_numpy' suffix to return a numpy array.
 
         Returns:
-            numpy array of requested data field.
+            list or numpy array of requested data field.
 
         Raises:
-            RuntimeError: Unable to import numpy.
-            ValueError: Unable to infer appropriate numpy dtype for data.
             AttributeError: Key is not in data_fields.
         """
         # __getattr__ is only called after the check of whether the key is in the
-        # instance dict, therefore it is ok to raise attribute error at this point if
-        # the key does not have the special form we expect
-        if not key.endswith("_numpy"):
+        # instance dict, so the field has not been accessed yet. _columns is missing
+        # if there was no data.
+        columns = self.__dict__.get("_columns", {})
+        if key.endswith("_numpy") and key[: -len("_numpy")] in columns:
+            value: Union[np.ndarray, List[float]] = columns[key[: -len("_numpy")]]
+        elif key in columns:
+            value = columns[key].tolist()
+        else:
             message = f"{self.__class__} object has no attribute {key}"
             raise AttributeError(message)
-
-        if not GOT_NUMPY:
-            message = "The numpy module is required to get the data " "as numpy arrays."
-            raise RuntimeError(message)
-
-        # Get the requested field name e.g. Ewe
-        requested_field = key.split("_numpy")[0]
-
-        dtype: Any = None
-        if requested_field == "time":
-            dtype = float
-        if requested_field in self.data_field_names:
-            # Determine the numpy type to convert to
-            for field in self.data_fields:
-                if field.name == requested_field:
-                    correct_field = field
-                    break
-            if correct_field.type is c_float:
-                dtype = float
-            elif correct_field.type is c_uint32:
-                dtype = int
-
-            if dtype is None:
-                message = (
-                    f"Unable to infer the numpy data type for "
-                    f"requested field: {requested_field}"
-                )
-                raise ValueError(message)
-
-        # Convert the data and return the numpy array
-        return np.array(getattr(self, requested_field), dtype=dtype)
+        setattr(self, key, value)
+        return value
 
     @property
     def data_field_names(self) -> List[str]:
@@ -1150,6 +1370,13 @@ class Technique:
 
     data_fields: List[Dict[str, List[DataField]]]
 
+    # Compiled arguments shared by techniques with equal arguments, keyed by technique
+    # class, instrument series, and argument labels and values. Instruments may run in
+    # separate threads, so the cache is only accessed holding its lock.
+    _c_args_cache: Dict[tuple, Array[TECCParam]] = {}
+    _c_args_cache_size: int = 256
+    _c_args_cache_lock: Lock = Lock()
+
     def __init__(self, args: tuple, technique_filename: str) -> None:
         """Initialize a technique.
 
@@ -1172,7 +1399,8 @@ class Technique:
             instrument: Instrument instance of :class:`.BiologicPotentiostat`.
 
         Returns:
-            A ctypes array of :class:`.TECCParam`
+            A ctypes array of :class:`.TECCParam`, shared with other techniques of the
+            same class and arguments for the same instrument series.
 
         Raises:
             ECLibCustomException: Where the error codes indicate the following:
@@ -1189,7 +1417,28 @@ class Technique:
                   function
         """
         if not hasattr(self, "_c_args"):
-            self._init_c_args(instrument)
+            key = (
+                type(self),
+                instrument.series,
+                tuple(
+                    (
+                        arg.label,
+                        tuple(arg.value) if isinstance(arg.value, list) else arg.value,
+                    )
+                    for arg in self.args
+                ),
+            )
+            cache = Technique._c_args_cache
+            with Technique._c_args_cache_lock:
+                c_args = cache.get(key)
+            if c_args is not None:
+                self._c_args = c_args
+            else:
+                self._init_c_args(instrument)
+                with Technique._c_args_cache_lock:
+                    if key not in cache and len(cache) >= self._c_args_cache_size:
+                        del cache[next(iter(cache))]  # drop oldest entry
+                    cache[key] = self._c_args
         return self._c_args
 
     def _init_c_args(self, instrument: BiologicPotentiostat) -> None:
@@ -2820,6 +3069,8 @@ def reverse_dict(dict_: dict) -> dict:
 
 
 # Constants
+# :Number of uint32 values in the data buffer filled by BL_GetData
+DATA_BUFFER_SIZE = 1000
 # :Device number to device name translation dict
 DEVICE_CODES = {
     0: "KBIO_DEV_VMP",
@@ -0,0 +1,692 @@
+"""Pure-Python stand-in for the EC-Lab Development Package DLL.
+
+:class:`SimulatedEClib` implements the EClib functions used by
+:class:`~nupylab.drivers.biologic.BiologicPotentiostat`, so the driver, the NUPyLab
+instrument and the GUIs built on them can be run and benchmarked without an instrument,
+Windows, or the DLL. It is injected in place of the DLL:
+
+.. code-block:: python
+
+    from nupylab.drivers.biologic import BiologicPotentiostat, OCV, PEIS
+    from nupylab.drivers.eclib_simulator import SimulatedEClib
+
+    sp300 = BiologicPotentiostat("SP300", "USB0", eclib=SimulatedEClib("SP300"))
+    sp300.connect()
+    sp300.load_firmware((1,))
+    sp300.load_techniques(0, (OCV(duration=60), PEIS()))
+    sp300.start_channel(0)
+    blocks = sp300.get_pending_data(0)
+
+The simulated channels run OCV and PEIS techniques on a Randles cell, i.e. a series
+resistance in series with a charge transfer resistance and double layer capacitance in
+parallel.
+Data are written to the channel memory in the same raw layout as the instrument's, i.e.
+32-bit words with time as high and low words of timebase ticks and floats as their bit
+patterns, and are read out in blocks of at most
+:data:`~nupylab.drivers.biologic.DATA_BUFFER_SIZE` words holding a single technique and
+process. Loaded techniques run one after another, and :meth:`BL_UpdateParameters` can
+end a running OCV early by setting its duration to zero.
+
+Simulated time runs `speed` times faster than `clock`, which can be replaced by a manual
+clock for deterministic runs. Other techniques are rejected with the error code of a
+missing technique file.
+"""
+
+from __future__ import annotations
+
+import logging
+import struct
+import threading
+import time
+from collections import deque
+from ctypes import memmove
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from nupylab.drivers import biologic as bl
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+#: Time base of simulated channels in seconds, as stored in a c_float.
+TIME_BASE: float = float(np.float32(2e-5))
+#: Time in seconds needed per impedance point in addition to its periods.
+POINT_OVERHEAD: float = 0.1
+
+#: EClib error codes returned by the simulator, with their messages.
+ERROR_MESSAGES: Dict[int, bytes] = {
+    0: b"function succeeded",
+    -1: b"no instrument connected",
+    -3: b"selected channel(s) unplugged",
+    -4: b"invalid function parameters",
+    -13: b"cannot perform this action on a device while it is running",
+    -15: b"error while updating parameters",
+    -400: b"ECC file does not exist",
+}
+
+# Technique identifiers by technique file name, without the SP-300 series suffix
+_TECHNIQUE_FILES: Dict[str, int] = {
+    "ocv": bl.reverse_dict(bl.TECHNIQUE_IDENTIFIERS)["KBIO_TECHID_OCV"],
+    "peis": bl.reverse_dict(bl.TECHNIQUE_IDENTIFIERS)["KBIO_TECHID_PEIS"],
+}
+_OCV: int = _TECHNIQUE_FILES["ocv"]
+_PEIS: int = _TECHNIQUE_FILES["peis"]
+
+
+def _value(argument: Any) -> Any:
+    """Get Python value of argument passed by value, by reference, or as ctypes type."""
+    argument = getattr(argument, "_obj", argument)
+    return getattr(argument, "value", argument)
+
+
+class _Channel:
+    """State of one simulated channel.
+
+    Attributes:
+        firmware: whether firmware is loaded.
+        techniques: loaded technique identifiers and parameters by label.
+        running: whether the channel is running.
+        index: index of the running technique.
+        start: simulated time at which running technique started.
+        record_end: simulated time at which recording of process 0 ends.
+        end: simulated time at which running technique ends.
+        records: number of process 0 points recorded.
+        frequencies: impedance frequencies of running technique.
+        completions: simulated times at which each impedance point is complete.
+        next_point: index of next impedance point.
+        clock_start: clock time at which channel was started.
+        memory: blocks of raw data waiting to be read, as technique index, technique
+            identifier, process, start time, and 2D array of rows of 32-bit words.
+        values: latest measured values, by :class:`.CurrentValues` field.
+    """
+
+    def __init__(self) -> None:
+        self.firmware: bool = False
+        self.techniques: List[Tuple[int, Dict[str, Any]]] = []
+        self.running: bool = False
+        self.index: int = 0
+        self.start: float = 0.0
+        self.record_end: float = 0.0
+        self.end: float = 0.0
+        self.records: int = 0
+        self.frequencies: np.ndarray = np.empty(0)
+        self.completions: np.ndarray = np.empty(0)
+        self.next_point: int = 0
+        self.clock_start: float = 0.0
+        self.memory: Deque[Tuple[int, int, int, float, np.ndarray]] = deque()
+        self.values: Dict[str, float] = {"Ewe": 0.0, "I": 0.0, "Freq": 0.0}
+
+    @property
+    def memory_filled(self) -> int:
+        """Bytes of data waiting to be read."""
+        return sum(block[-1].nbytes for block in self.memory)
+
+
+class SimulatedEClib:
+    """Simulated EClib DLL, to be passed to the `eclib` argument of the driver.
+
+    Functions take and fill ctypes arguments like their DLL counterparts, and return
+    EClib error codes, see :data:`ERROR_MESSAGES`.
+
+    Attributes:
+        model: simulated device model, e.g. `SP300`.
+        series: instrument series, `sp300` or `vmp3`, which sets the data layout.
+        open_circuit_voltage: cell voltage at rest in V.
+        series_resistance: series resistance of the cell in ohm.
+        charge_transfer_resistance: charge transfer resistance of the cell in ohm.
+        capacitance: double layer capacitance of the cell in F.
+        noise: standard deviation of voltage noise in V, and of current noise relative
+            to the current.
+        speed: simulated seconds per second of `clock`.
+        clock: function returning the time in seconds.
+        firmware_loads: number of firmware loads by channel.
+    """
+
+    def __init__(
+        self,
+        model: str = "SP300",
+        channels: int = 16,
+        open_circuit_voltage: float = 0.9,
+        series_resistance: float = 10.0,
+        charge_transfer_resistance: float = 100.0,
+        capacitance: float = 1e-5,
+        noise: float = 1e-4,
+        speed: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Initialize simulated device and cell.
+
+        Args:
+            model: simulated device model, e.g. `SP300`.
+            channels: number of plugged channels.
+            open_circuit_voltage: cell voltage at rest in V.
+            series_resistance: series resistance of the cell in ohm.
+            charge_transfer_resistance: charge transfer resistance of the cell in ohm.
+            capacitance: double layer capacitance of the cell in F.
+            noise: standard deviation of voltage noise in V, and of current noise
+                relative to the current.
+            speed: simulated seconds per second of `clock`.
+            clock: function returning the time in seconds.
+            seed: seed of the noise generator.
+
+        Raises:
+            ValueError: if model is not a recognized Biologic model.
+        """
+        self.model: str = model.replace("-", "").replace(" ", "").upper()
+        device = "KBIO_DEV_" + self.model
+        if device in bl.SP300SERIES:
+            self.series: str = "sp300"
+        elif device in bl.VMP3SERIES:
+            self.series = "vmp3"
+        else:
+            raise ValueError(f"Unrecognized Biologic model {model}.")
+        self._device_code: int = bl.reverse_dict(bl.DEVICE_CODES)[device]
+        self.open_circuit_voltage: float = open_circuit_voltage
+        self.series_resistance: float = series_resistance
+        self.charge_transfer_resistance: float = charge_transfer_resistance
+        self.capacitance: float = capacitance
+        self.noise: float = noise
+        self.speed: float = speed
+        self.clock: Callable[[], float] = clock
+        self.firmware_loads: Dict[int, int] = {}
+        self._channels: Dict[int, _Channel] = {c: _Channel() for c in range(channels)}
+        self._rng: np.random.Generator = np.random.default_rng(seed)
+        self._id: Optional[int] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def impedance(self, frequency: np.ndarray) -> np.ndarray:
+        """Get complex impedance of the cell in ohm at frequencies in Hz."""
+        omega = 2 * np.pi * np.asarray(frequency, dtype=float)
+        rct = self.charge_transfer_resistance
+        return self.series_resistance + rct / (1 + 1j * omega * rct * self.capacitance)
+
+    #####################
+    # General functions #
+    #####################
+
+    def BL_GetLibVersion(self, p_version: Any, p_size: Any) -> int:
+        p_version._obj.value = b"simulated"
+        p_size._obj.value = len(b"simulated")
+        return 0
+
+    def BL_GetErrorMsg(self, error_code: int, p_message: Any, p_size: Any) -> int:
+        message = ERROR_MESSAGES.get(error_code, b"unknown error")
+        p_message._obj.value = message
+        p_size._obj.value = len(message)
+        return 0
+
+    def BL_ConvertNumericIntoSingle(self, numeric: int, p_single: Any) -> int:
+        p_single._obj.value = struct.unpack("<f", struct.pack("<I", numeric))[0]
+        return 0
+
+    ############################
+    # Communications functions #
+    ############################
+
+    def BL_Connect(
+        self, address: bytes, timeout: int, p_id: Any, p_device_info: Any
+    ) -> int:
+        self._id = 1
+        p_id._obj.value = self._id
+        info = p_device_info._obj
+        info.DeviceCode = self._device_code
+        info.NumberOfChannels = len(self._channels)
+        info.NumberOfSlots = len(self._channels)
+        info.FirmwareVersion = 1
+        log.debug("Simulated %s connected at %s.", self.model, _value(address))
+        return 0
+
+    def BL_Disconnect(self, device_id: Any) -> int:
+        if _value(device_id) != self._id:
+            return -1
+        self._id = None
+        return 0
+
+    def BL_TestConnection(self, device_id: Any) -> int:
+        return 0 if _value(device_id) == self._id else -1
+
+    def BL_LoadFirmware(
+        self,
+        device_id: Any,
+        p_channels: Any,
+        p_results: Any,
+        length: int,
+        show_gauge: bool,
+        force_reload: bool,
+        bin_file: Optional[bytes],
+        xlx_file: Optional[bytes],
+    ) -> int:
+        if _value(device_id) != self._id:
+            return -1
+        for c in range(length):
+            p_results[c] = 0
+            if not p_channels[c]:
+                continue
+            if c not in self._channels:
+                p_results[c] = -3
+                continue
+            channel = self._channels[c]
+            if channel.running:
+                p_results[c] = -13
+            elif force_reload or not channel.firmware:
+                channel.firmware = True
+                channel.techniques = []
+                self.firmware_loads[c] = self.firmware_loads.get(c, 0) + 1
+        return 0
+
+    #################################
+    # Channel information functions #
+    #################################
+
+    def BL_IsChannelPlugged(self, device_id: Any, channel: int) -> int:
+        return int(channel in self._channels)
+
+    def BL_GetChannelsPlugged(self, device_id: Any, p_status: Any, size: int) -> int:
+        if _value(device_id) != self._id:
+            return -1
+        for c in range(size):
+            p_status[c] = int(c in self._channels)
+        return 0
+
+    def BL_GetChannelInfos(self, device_id: Any, c: int, p_infos: Any) -> int:
+        if _value(device_id) != self._id:
+            return -1
+        if c not in self._channels:
+            return -3
+        with self._lock:
+            channel = self._advance(c)
+            infos = p_infos._obj
+            infos.Channel = c
+            infos.FirmwareCode = 5 if channel.firmware else 0  # KBIO_FIRM_KERNEL
+            infos.FirmwareVersion = 1 if channel.firmware else 0
+            infos.MemFilled = channel.memory_filled
+            infos.State = int(channel.running)
+            infos.MaxIRange = 10  # KBIO_IRANGE_1A
+            infos.MinIRange = 0  # KBIO_IRANGE_100pA
+            infos.MaxBandwidth = 9
+            infos.NbOfTechniques = len(channel.techniques)
+        return 0
+
+    def BL_GetMessage(
+        self, device_id: Any, channel: int, p_message: Any, p_size: Any
+    ) -> int:
+        p_message._obj.value = b""
+        p_size._obj.value = 0
+        return 0
+
+    #######################
+    # Technique functions #
+    #######################
+
+    def BL_DefineBoolParameter(
+        self, label: bytes, value: bool, index: int, p_param: Any
+    ) -> int:
+        return self._define_parameter(label, 1, int(bool(value)), index, p_param)
+
+    def BL_DefineSglParameter(
+        self, label: bytes, value: Any, index: int, p_param: Any
+    ) -> int:
+        bits = struct.unpack("<i", struct.pack("<f", _value(value)))[0]
+        return self._define_parameter(label, 2, bits, index, p_param)
+
+    def BL_DefineIntParameter(
+        self, label: bytes, value: int, index: int, p_param: Any
+    ) -> int:
+        return self._define_parameter(label, 0, int(value), index, p_param)
+
+    @staticmethod
+    def _define_parameter(
+        label: bytes, param_type: int, value: int, index: int, p_param: Any
+    ) -> int:
+        """Fill TECCParam struct, with floats stored as their bit patterns."""
+        param = p_param._obj
+        param.ParamStr = label
+        param.ParamType = param_type
+        param.ParamVal = value
+        param.ParamIndex = index
+        return 0
+
+    @staticmethod
+    def _technique(filename: bytes, tecc_params: Any) -> Tuple[int, Dict[str, Any]]:
+        """Get technique identifier and parameters of first step by label.
+
+        Raises:
+            KeyError: if technique is not simulated.
+        """
+        name = _value(filename).decode("utf-8").rsplit(".", 1)[0].lower()
+        technique_id = _TECHNIQUE_FILES[name[:-1] if name.endswith("4") else name]
+        params: Dict[str, Any] = {}
+        for i in range(tecc_params.len):
+            param = tecc_params.pParams[i]
+            if param.ParamIndex != 0:
+                continue
+            if param.ParamType == 2:
+                value = struct.unpack("<f", struct.pack("<i", param.ParamVal))[0]
+            elif param.ParamType == 1:
+                value = bool(param.ParamVal)
+            else:
+                value = param.ParamVal
+            params[param.ParamStr.decode("utf-8")] = value
+        return technique_id, params
+
+    def BL_LoadTechnique(
+        self,
+        device_id: Any,
+        c: int,
+        filename: bytes,
+        tecc_params: Any,
+        first: bool,
+        last: bool,
+        display: bool,
+    ) -> int:
+        if _value(device_id) != self._id:
+            return -1
+        if c not in self._channels:
+            return -3
+        try:
+            technique = self._technique(filename, tecc_params)
+        except KeyError:
+            return -400
+        with self._lock:
+            channel = self._advance(c)
+            if channel.running:
+                return -13
+            if first:
+                channel.techniques = []
+            channel.techniques.append(technique)
+        return 0
+
+    def BL_UpdateParameters(
+        self,
+        device_id: Any,
+        c: int,
+        technique_index: int,
+        tecc_params: Any,
+        filename: bytes,
+    ) -> int:
+        if _value(device_id) != self._id:
+            return -1
+        if c not in self._channels:
+            return -3
+        try:
+            technique_id, params = self._technique(filename, tecc_params)
+        except KeyError:
+            return -400
+        with self._lock:
+            channel = self._advance(c)
+            if (
+                not 0 <= technique_index < len(channel.techniques)
+                or channel.techniques[technique_index][0] != technique_id
+            ):
+                return -15
+            channel.techniques[technique_index][1].update(params)
+            if channel.running and technique_index == channel.index:
+                self._schedule(channel, self._now(channel))
+        return 0
+
+    ########################
+    # Start/stop functions #
+    ########################
+
+    def BL_StartChannel(self, device_id: Any, c: int) -> int:
+        if _value(device_id) != self._id:
+            return -1
+        if c not in self._channels:
+            return -3
+        with self._lock:
+            channel = self._advance(c)
+            if channel.running:
+                return -13
+            if not channel.techniques:
+                return -4
+            channel.running = True
+            channel.index = 0
+            channel.clock_start = self.clock()
+            self._begin(channel, 0.0)
+        return 0
+
+    def BL_StartChannels(
+        self, device_id: Any, p_channels: Any, p_results: Any, length: int
+    ) -> int:
+        for c in range(length):
+            p_results[c] = self.BL_StartChannel(device_id, c) if p_channels[c] else 0
+        return 0
+
+    def BL_StopChannel(self, device_id: Any, c: int) -> int:
+        if _value(device_id) != self._id:
+            return -1
+        if c not in self._channels:
+            return -3
+        with self._lock:
+            self._advance(c).running = False
+        return 0
+
+    def BL_StopChannels(
+        self, device_id: Any, p_channels: Any, p_results: Any, length: int
+    ) -> int:
+        for c in range(length):
+            p_results[c] = self.BL_StopChannel(device_id, c) if p_channels[c] else 0
+        return 0
+
+    ##################
+    # Data functions #
+    ##################
+
+    def BL_GetCurrentValues(self, device_id: Any, c: int, p_values: Any) -> int:
+        if _value(device_id) != self._id:
+            return -1
+        if c not in self._channels:
+            return -3
+        with self._lock:
+            self._current_values(self._advance(c), p_values._obj)
+        return 0
+
+    def BL_GetData(
+        self, device_id: Any, c: int, p_buffer: Any, p_infos: Any, p_values: Any
+    ) -> int:
+        if _value(device_id) != self._id:
+            return -1
+        if c not in self._channels:
+            return -3
+        infos = p_infos._obj
+        with self._lock:
+            channel = self._advance(c)
+            if channel.memory:
+                index, technique_id, process, start, rows = channel.memory.popleft()
+                fit = bl.DATA_BUFFER_SIZE // rows.shape[1]
+                if len(rows) > fit:
+                    channel.memory.appendleft(
+                        (index, technique_id, process, start, rows[fit:])
+                    )
+                    rows = rows[:fit]
+                memmove(p_buffer, rows.ctypes.data, rows.nbytes)
+                infos.NbRows, infos.NbCols = rows.shape
+                infos.TechniqueIndex = index
+                infos.TechniqueID = technique_id
+                infos.ProcessIndex = process
+                infos.StartTime = start
+            else:
+                infos.NbRows = infos.NbCols = 0
+                infos.TechniqueIndex = infos.TechniqueID = infos.ProcessIndex = 0
+                infos.StartTime = 0.0
+            infos.IRQskipped = infos.loop = 0
+            self._current_values(channel, p_values._obj)
+        return 0
+
+    ##############
+    # Simulation #
+    ##############
+
+    def _now(self, channel: _Channel) -> float:
+        """Get simulated time since channel was started."""
+        return (self.clock() - channel.clock_start) * self.speed
+
+    def _current_values(self, channel: _Channel, values: bl.CurrentValues) -> None:
+        """Fill CurrentValues struct of channel."""
+        values.State = int(channel.running)
+        values.MemFilled = channel.memory_filled
+        values.TimeBase = TIME_BASE
+        values.Ewe = channel.values["Ewe"]
+        values.EweRangeMin, values.EweRangeMax = -2.5, 2.5
+        values.EceRangeMin, values.EceRangeMax = -2.5, 2.5
+        values.I = channel.values["I"]
+        values.IRange = 12  # KBIO_IRANGE_AUTO
+        values.ElapsedTime = self._now(channel) if channel.running else 0.0
+        values.Freq = channel.values["Freq"]
+
+    def _begin(self, channel: _Channel, start: float) -> None:
+        """Start running technique of channel at simulated time `start`."""
+        channel.start = start
+        channel.records = 0
+        channel.next_point = 0
+        self._schedule(channel, start)
+
+    def _schedule(self, channel: _Channel, earliest: float) -> None:
+        """Plan running technique of channel from its start and parameters.
+
+        Args:
+            channel: running channel.
+            earliest: simulated time before which recording of process 0 cannot end,
+                e.g. the time of a parameter update.
+        """
+        technique_id, params = channel.techniques[channel.index]
+        if technique_id == _OCV:
+            duration = params["Rest_time_T"]
+        else:
+            duration = params["Duration_step"]
+        channel.record_end = max(
+            channel.start + duration, min(earliest, channel.record_end)
+        )
+        channel.end = channel.record_end
+        if technique_id != _PEIS:
+            return
+        if channel.next_point == 0:
+            low, high = params["Initial_frequency"], params["Final_frequency"]
+            number = params["Frequency_number"]
+            if params["sweep"]:
+                channel.frequencies = np.linspace(low, high, number)
+            else:
+                channel.frequencies = np.geomspace(low, high, number)
+            periods = params["Wait_for_steady"] + params["Average_N_times"]
+            durations = periods / channel.frequencies + POINT_OVERHEAD
+            channel.completions = channel.record_end + np.cumsum(durations)
+        channel.end = float(channel.completions[-1])
+
+    def _advance(self, c: int) -> _Channel:
+        """Write data measured by channel up to the current time to its memory."""
+        channel = self._channels[c]
+        if not channel.running:
+            return channel
+        now = self._now(channel)
+        while channel.running:
+            technique_id, params = channel.techniques[channel.index]
+            self._record(channel, technique_id, params, min(now, channel.record_end))
+            if technique_id == _PEIS:
+                self._sweep(channel, params, now)
+            if now < channel.end:
+                break
+            # Move on to next technique, or stop after the last one
+            channel.index += 1
+            if channel.index == len(channel.techniques):
+                channel.running = False
+                channel.index = 0
+                break
+            self._begin(channel, channel.end)
+        return channel
+
+    def _record(
+        self,
+        channel: _Channel,
+        technique_id: int,
+        params: Dict[str, Any],
+        until: float,
+    ) -> None:
+        """Record process 0 points of channel up to simulated time `until`."""
+        interval = params["Record_every_dT"] or 1.0
+        # Rounding tolerance, so a point due at `until` is not missed
+        total = int(np.floor((until - channel.start) / interval + 1e-9)) + 1
+        count = total - channel.records
+        if count <= 0:
+            return
+        times = channel.start + interval * np.arange(channel.records, total)
+        channel.records = total
+        noise = self._rng.normal(0, self.noise, count)
+        if technique_id == _OCV:
+            # Slow drift of the rest potential
+            ewe = self.open_circuit_voltage + 1e-3 * np.sin(2 * np.pi * times / 600)
+            fields = {"Ewe": ewe + noise, "Ece": np.zeros(count)}
+        else:
+            step = params["Initial_Voltage_step"]
+            resistance = self.series_resistance + self.charge_transfer_resistance
+            current = step / resistance * (1 + self._rng.normal(0, self.noise, count))
+            fields = {"Ewe": self.open_circuit_voltage + step + noise, "I": current}
+        self._store(channel, technique_id, 0, times, fields)
+        channel.values.update(Ewe=float(fields["Ewe"][-1]), I=0.0, Freq=0.0)
+        if "I" in fields:
+            channel.values["I"] = float(fields["I"][-1])
+
+    def _sweep(self, channel: _Channel, params: Dict[str, Any], now: float) -> None:
+        """Record impedance points of channel completed by simulated time `now`."""
+        stop = int(np.searchsorted(channel.completions, now, side="right"))
+        if stop <= channel.next_point:
+            return
+        points = slice(channel.next_point, stop)
+        channel.next_point = stop
+        frequency = channel.frequencies[points]
+        count = len(frequency)
+        z = self.impedance(frequency)
+        z *= 1 + self._rng.normal(0, self.noise, count)
+        amplitude = np.full(count, params["Amplitude_Voltage"])
+        ewe = self.open_circuit_voltage + params["Initial_Voltage_step"]
+        fields = {
+            "freq": frequency,
+            "abs_Ewe": amplitude,
+            "abs_I": amplitude / np.abs(z),
+            "Phase_Zwe": np.angle(z),
+            "Ewe": np.full(count, ewe),
+            "I": np.zeros(count),
+            "t": channel.completions[points] - channel.start,
+            "Irange": np.full(count, 12),  # KBIO_IRANGE_AUTO
+        }
+        self._store(channel, _PEIS, 1, channel.completions[points], fields)
+        channel.values.update(Ewe=ewe, I=0.0, Freq=float(frequency[-1]))
+
+    def _store(
+        self,
+        channel: _Channel,
+        technique_id: int,
+        process: int,
+        times: np.ndarray,
+        fields: Dict[str, np.ndarray],
+    ) -> None:
+        """Encode points as rows of 32-bit words and append them to channel memory.
+
+        Fields missing from `fields` are written as zeros.
+        """
+        technique = bl.TECHNIQUE_IDENTIFIERS_TO_CLASS[
+            bl.TECHNIQUE_IDENTIFIERS[technique_id]
+        ]
+        data_fields = technique.data_fields[process]
+        data_fields = data_fields.get("common", data_fields.get(self.series))
+        columns = []
+        if not any(field.name == "t" for field in data_fields):
+            ticks = np.rint((times - channel.start) / TIME_BASE).astype(np.uint64)
+            columns += [
+                (ticks >> np.uint64(32)).astype(np.uint32),
+                (ticks & np.uint64(0xFFFFFFFF)).astype(np.uint32),
+            ]
+        zeros = np.zeros(len(times))
+        for field in data_fields:
+            values = fields.get(field.name, zeros)
+            if field.type is bl.c_float:
+                columns.append(values.astype(np.float32).view(np.uint32))
+            else:
+                columns.append(values.astype(np.uint32))
+        rows = np.column_stack(columns)
+        memory = channel.memory
+        key = (channel.index, technique_id, process, channel.start)
+        if memory and memory[-1][:4] == key:
+            rows = np.concatenate((memory.pop()[-1], rows))
+        memory.append((*key, rows))
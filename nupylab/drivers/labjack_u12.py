@@ -29,9 +29,12 @@ import logging
 import math
 import os
 import sys
+import threading
 import time
 from struct import pack, unpack
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 try:
     import nupylab_extras
@@ -41,6 +44,10 @@ except ImportError:
 
 PLATFORM: str = sys.platform  # "win32", "darwin", "linux#", "cygwin"
 
+#: Minimum SampleInterval of AIContinuous. SampleInterval = 6000000 / samples/s, so
+#: this is the maximum continuous rate of 1200 samples/s, or 300 scans of 4 channels.
+AI_CONTINUOUS_MIN_SAMPLE_INTERVAL: int = 5000
+
 
 class U12Exception(Exception):
     """Custom Exception meant for dealing specifically with U12 Exceptions."""
@@ -327,6 +334,47 @@ class BitField(object):
         return other + self.asByte()
 
 
+def packByte(
+    byte: int = 0,
+    bit7: bool = False,
+    bit6: bool = False,
+    bit5: bool = False,
+    bit4: bool = False,
+    bit3: bool = False,
+    bit2: bool = False,
+    bit1: bool = False,
+    bit0: bool = False,
+) -> int:
+    """Set bits of a command byte, named as the bits of a default BitField.
+
+    Bits that are True are set to 1, the others keep their value in byte.
+
+    >>> packByte(0x0A, bit7=True, bit5=True)
+    170
+    """
+    return (
+        byte
+        | (bool(bit7) << 7)
+        | (bool(bit6) << 6)
+        | (bool(bit5) << 5)
+        | (bool(bit4) << 4)
+        | (bool(bit3) << 3)
+        | (bool(bit2) << 2)
+        | (bool(bit1) << 1)
+        | bool(bit0)
+    )
+
+
+def checkResponse(byte: int, expected: int, name: str, mask: int = 0xFF) -> None:
+    """Check the bits of mask in a response byte identify the expected response.
+
+    Raises:
+        U12Exception: if the response is not the expected one.
+    """
+    if (byte & mask) != expected:
+        raise U12Exception("Expected a %s response, got %s instead." % (name, byte))
+
+
 def errcheck(ret: int, *args) -> int:
     if ret == -1:
         try:
@@ -618,6 +666,35 @@ class U12:
             self._debugprint("Received: " + hexWithoutQuotes(result))
             return result
 
+    def _updateIOStates(self, dirAndStates: int, mask: int = 0x0F) -> None:
+        """Update the saved IO3-IO0 directions and states in the bits of mask."""
+        self.IO3toIO0DirAndStates.fromByte(
+            (int(self.IO3toIO0DirAndStates) & ~mask & 0xFF) | (int(dirAndStates) & mask)
+        )
+
+    def _readPackets(self, numPackets: int, timeout: int = 1000) -> np.ndarray:
+        """Read 8-byte responses into an array. Linux and Mac only.
+
+        Raises:
+            U12Exception: if a response is incomplete.
+        """
+        if self.handle is None:
+            raise U12Exception(
+                "The U12's handle is None. Please open a U12 with open()."
+            )
+        packets = np.zeros((numPackets, 8), dtype=np.uint8)
+        base = packets.ctypes.data
+        for i in range(numPackets):
+            readBytes = self._lib.LJUSB_ReadTO(
+                self.handle, ctypes.c_void_p(base + 8 * i), 8, timeout
+            )
+            if readBytes != 8:
+                raise U12Exception(
+                    "Could only read %s of 8 bytes of response %s of %s."
+                    % (readBytes, i + 1, numPackets)
+                )
+        return packets
+
     # Low-level helpers
     def rawReadSerial(self) -> int:
         """Read the serial number from internal memory.
@@ -737,37 +814,23 @@ class U12:
 
         # Bit 1: Update IO
         # Bit 0: LED State
-        bf = BitField()
-        bf.bit1 = int(UpdateIO)
-        bf.bit0 = int(LEDState)
-        command[4] = int(bf)
+        command[4] = packByte(bit1=UpdateIO, bit0=LEDState)
 
         # Bit 7-4: 1100 (Command/Response)
         # Bit 3-0: Bits for IO3 through IO0 States
-        bf.fromByte(0)
-        bf.bit7 = 1
-        bf.bit6 = 1
-
-        bf.fromByte(int(bf) | (int(IO3toIO0States) & 0xF))
-        command[5] = int(bf)
+        command[5] = packByte(int(IO3toIO0States) & 0xF, bit7=True, bit6=True)
 
         command[7] = EchoValue
 
         self.write(command)
         results = self.read()
 
-        bf = BitField()
-
-        bf.fromByte(results[0])
-
-        if bf.bit7 != 1 or bf.bit6 != 0:
-            raise U12Exception(
-                "Expected an AISample response, got %s instead." % results[0]
-            )
+        # Bits 7-6: 10 (AISample response)
+        checkResponse(results[0], 0x80, "AISample", mask=0xC0)
 
         returnDict = {
             "EchoValue": results[1],
-            "PGAOvervoltage": bool(bf.bit4),
+            "PGAOvervoltage": bool(results[0] & 0x10),
             "IO3toIO0States": BitField(
                 results[0], "IO", list(range(3, -1, -1)), "Low", "High"
             )
@@ -775,10 +838,7 @@ class U12:
 
         # Update the current IO states.
         if bool(UpdateIO):
-            self.IO3toIO0DirAndStates = BitField(
-                rawByte=(int(self.IO3toIO0DirAndStates) & 0xF0)
-                | int(IO3toIO0States & 0x0F)
-            )
+            self._updateIOStates(IO3toIO0States)
 
         channel0 = (results[2] >> 4) & 0xF
         channel1 = results[2] & 0xF
@@ -909,8 +969,7 @@ class U12:
 
         returnDict = {}
 
-        if results[0] != 87:
-            raise U12Exception("Expected a DIO response, got %s instead." % results[0])
+        checkResponse(results[0], command[5], "DIO")
 
         returnDict["D15toD8States"] = BitField(
             results[1], "D", list(range(15, 7, -1)), "Low", "High"
@@ -939,9 +998,7 @@ class U12:
 
         # Update the current IO directions and states.
         if bool(UpdateDigital):
-            self.IO3toIO0DirAndStates = BitField(
-                rawByte=(int(IO3toIO0DirectionsAndStates) & 0xFF)
-            )
+            self._updateIOStates(IO3toIO0DirectionsAndStates, 0xFF)
 
         return returnDict
 
@@ -981,27 +1038,17 @@ class U12:
         """
         command = [0] * 8
 
-        bf = BitField()
-        bf.bit1 = int(StrobeEnabled)
-        bf.bit0 = int(ResetCounter)
-
-        command[0] = int(bf)
+        command[0] = packByte(bit1=StrobeEnabled, bit0=ResetCounter)
 
-        bf.fromByte(0)
-        bf.bit6 = 1
-        bf.bit4 = 1
-        bf.bit1 = 1
-        command[5] = int(bf)
+        # 01X10010 (Counter)
+        command[5] = 0x52  # 0b01010010
 
         self.write(command)
         results = self.read()
 
         returnDict = {}
 
-        if results[0] != command[5]:
-            raise U12Exception(
-                "Expected a Counter response, got %s instead." % results[0]
-            )
+        checkResponse(results[0], command[5], "Counter")
 
         returnDict["D15toD8States"] = BitField(
             results[1], "D", list(range(15, 7, -1)), "Low", "High"
@@ -1098,23 +1145,16 @@ class U12:
         # Bits 3-0: Bits for IO3 through IO0 State
         command[4] = int(IO3toIO0DirectionsAndStates)
 
-        bf = BitField()
-        bf.bit5 = int(ResetCounter)
-        bf.bit4 = int(UpdateDigital)
-
         binPWMA = int((1023 * (float(PWMA) / 5.0)))
         binPWMB = int((1023 * (float(PWMB) / 5.0)))
 
-        bf2 = BitField()
-        bf2.fromByte(binPWMA & 3)  # 3 = 0b11
-        bf.bit3 = bf2.bit1
-        bf.bit2 = bf2.bit0
-
-        bf2.fromByte(binPWMB & 3)  # 3 = 0b11
-        bf.bit1 = bf2.bit1
-        bf.bit0 = bf2.bit0
-
-        command[5] = int(bf)
+        # Bits 3-2: 2 LSBs of PWMA
+        # Bits 1-0: 2 LSBs of PWMB
+        command[5] = packByte(
+            ((binPWMA & 3) << 2) | (binPWMB & 3),  # 3 = 0b11
+            bit5=ResetCounter,
+            bit4=UpdateDigital,
+        )
 
         command[6] = (binPWMA >> 2) & 0xFF
         command[7] = (binPWMB >> 2) & 0xFF
@@ -1136,9 +1176,7 @@ class U12:
 
         # Update the current IO directions and states.
         if bool(UpdateDigital):
-            self.IO3toIO0DirAndStates = BitField(
-                rawByte=(int(IO3toIO0DirectionsAndStates) & 0xFF)
-            )
+            self._updateIOStates(IO3toIO0DirectionsAndStates, 0xFF)
 
         counter = results[7]
         counter += results[6] << 8
@@ -1161,6 +1199,7 @@ class U12:
         FeatureReports=False,
         TriggerOn=False,
         SampleInterval=15000,
+        asLists=False,
     ):
         """
         Collect 4 channels at the specified data rate, and put data in the buffer.
@@ -1196,12 +1235,15 @@ class U12:
             TriggerOn: Use trigger to start acquisition.
             SampleInterval: = int(6000000.0/(ScanRate * NumberOfChannels))
                               must be greater than (or equal to) 733.
-
-        Returns: A dictionary with the following keys:
-            Channel0-3, A list of the readings on the channels
-            PGAOvervoltages, A list of the over-voltage flags
-            IO3toIO0State, A list of the IO states
-            IterationCounters, A list of the values of the iteration counter
+            asLists: True to return lists, with IO states as BitFields, as
+                :func:`aiPacketsToLists` does.
+
+        Returns: A dictionary of arrays, as returned by :func:`decodeAIPackets`,
+            with the following keys:
+            Channel0-3, The readings on the channels
+            PGAOvervoltages, The over-voltage flags
+            IO3toIO0States, The IO states
+            IterationCounters, The values of the iteration counter
             Backlogs, value*256 = number of packets in the backlog.
             BufferOverflowOrChecksumErrors, If True and Backlog = 31, then a buffer
                 overflow occurred. If True and Backlog = 0, then Checksum error
@@ -1209,7 +1251,9 @@ class U12:
 
         Example:
         >>> d = U12()
-        >>> d.rawAIBurst()
+        >>> d.rawAIBurst()["Channel0"]
+        array([1.484375, 1.513671875, ... , 1.46484375])
+        >>> d.rawAIBurst(asLists=True)
         {
           'Channel0': [1.484375, 1.513671875, ... , 1.46484375],
 
@@ -1237,29 +1281,10 @@ class U12:
         # Bits 6-4: PGA for 1st Channel
         # Bits 3-0: MUX command for 1st Channel
         command[0] = int(channel0PGAMUX)
-
-        tempNum = command[0] & 7  # 7 = 0b111
-        channel0Number = tempNum if (command[0] & 0xF) > 7 else tempNum + 8
-        channel0Gain = (command[0] >> 4) & 7  # 7 = 0b111
-
         command[1] = int(channel1PGAMUX)
-
-        tempNum = command[1] & 7  # 7 = 0b111
-        channel1Number = tempNum if (command[1] & 0xF) > 7 else tempNum + 8
-        channel1Gain = (command[1] >> 4) & 7  # 7 = 0b111
-
         command[2] = int(channel2PGAMUX)
-
-        tempNum = command[2] & 7  # 7 = 0b111
-        channel2Number = tempNum if (command[2] & 0xF) > 7 else tempNum + 8
-        channel2Gain = (command[2] >> 4) & 7  # 7 = 0b111
-
         command[3] = int(channel3PGAMUX)
 
-        tempNum = command[3] & 7  # 7 = 0b111
-        channel3Number = tempNum if (command[3] & 0xF) > 7 else tempNum + 8
-        channel3Gain = (command[3] >> 4) & 7  # 7 = 0b111
-
         if NumberOfScans > 1024 or NumberOfScans < 8:
             raise U12Exception(
                 "The number of scans must be between 1024 and 8 (inclusive)"
@@ -1268,26 +1293,18 @@ class U12:
         NumScansExponentMod = 10 - int(math.ceil(math.log(NumberOfScans, 2)))
         NumScans = 2 ** (10 - NumScansExponentMod)
 
-        bf = BitField(rawByte=(NumScansExponentMod << 5))
         # bits 4-3: IO to Trigger on
-        bf.bit2 = 0
-        bf.bit1 = int(bool(UpdateIO))
-        bf.bit0 = int(bool(LEDState))
-        command[4] = int(bf)
+        command[4] = packByte(NumScansExponentMod << 5, bit1=UpdateIO, bit0=LEDState)
 
-        bf2 = BitField(rawByte=int(IO3ToIO0States))
         # Bits 7-4: 1010 (Start Burst)
-        bf2.bit7 = 1
-        bf2.bit5 = 1
-        command[5] = int(bf2)
+        command[5] = packByte(int(IO3ToIO0States), bit7=True, bit5=True)
 
         if SampleInterval < 733:
             raise U12Exception("SampleInterval must be greater than 733.")
 
-        bf3 = BitField(rawByte=((SampleInterval >> 8) & 0x3F))
-        bf3.bit7 = int(bool(FeatureReports))
-        bf3.bit6 = int(bool(TriggerOn))
-        command[6] = int(bf3)
+        command[6] = packByte(
+            (SampleInterval >> 8) & 0x3F, bit7=FeatureReports, bit6=TriggerOn
+        )
 
         command[7] = SampleInterval & 0xFF
 
@@ -1297,71 +1314,14 @@ class U12:
         scanRate = 6000000.0 / (SampleInterval * 4)
         time.sleep((0.002 + (NumScans / scanRate)))
 
-        resultsList = []
-        for i in range(NumScans):
-            resultsList.append(self.read())
-
-        returnDict = {
-            "BufferOverflowOrChecksumErrors": [],
-            "PGAOvervoltages": [],
-            "IO3toIO0States": [],
-            "IterationCounters": [],
-            "Backlogs": [],
-            "Channel0": [],
-            "Channel1": [],
-            "Channel2": [],
-            "Channel3": []
-        }
-
-        for results in resultsList:
-            bf = BitField(rawByte=results[0])
-
-            if bf.bit7 != 1 or bf.bit6 != 0:
-                raise U12Exception(
-                    "Expected a AIBurst response, got %s instead." % results[0]
-                )
-
-            returnDict["BufferOverflowOrChecksumErrors"].append(bool(bf.bit5))
-            returnDict["PGAOvervoltages"].append(bool(bf.bit4))
-            returnDict["IO3toIO0States"].append(
-                BitField(results[0], "IO", list(range(3, -1, -1)), "Low", "High")
-            )
-
-            returnDict["IterationCounters"].append((results[1] >> 5))
-            returnDict["Backlogs"].append(results[1] & 0xF)
-
-            channel0 = (results[2] >> 4) & 0xF
-            channel1 = results[2] & 0xF
-            channel2 = (results[5] >> 4) & 0xF
-            channel3 = results[5] & 0xF
-
-            channel0 = (channel0 << 8) + results[3]
-            returnDict["Channel0"].append(
-                self.bitsToVolts(channel0Number, channel0Gain, channel0)
-            )
-
-            channel1 = (channel1 << 8) + results[4]
-            returnDict["Channel1"].append(
-                self.bitsToVolts(channel1Number, channel1Gain, channel1)
-            )
-
-            channel2 = (channel2 << 8) + results[6]
-            returnDict["Channel2"].append(
-                self.bitsToVolts(channel2Number, channel2Gain, channel2)
-            )
-
-            channel3 = (channel3 << 8) + results[7]
-            returnDict["Channel3"].append(
-                self.bitsToVolts(channel3Number, channel3Gain, channel3)
-            )
+        returnDict = decodeAIPackets(self._readPackets(NumScans), command[:4])
 
         # Update the current IO states.
         if bool(UpdateIO):
-            self.IO3toIO0DirAndStates = BitField(
-                rawByte=(int(self.IO3toIO0DirAndStates) & 0xF0)
-                | (int(IO3ToIO0States) & 0x0F)
-            )
+            self._updateIOStates(IO3ToIO0States)
 
+        if asLists:
+            return aiPacketsToLists(returnDict)
         return returnDict
 
     def rawAIContinuous(
@@ -1380,10 +1340,10 @@ class U12:
         """
         Continuous read on 4 channels.
 
-        Currently in development.
-
-        The function is mostly implemented, but is currently too slow to be
-        useful.
+        Yields the status of each scan as it is read, reusing the same dictionary.
+        Channel readings are not decoded. For acquiring data use
+        :meth:`rawAIStream`, which reads and decodes scans at the maximum continuous
+        rate.
         """
         command = [0] * 8
 
@@ -1394,20 +1354,12 @@ class U12:
         command[2] = int(channel2PGAMUX)
         command[3] = int(channel3PGAMUX)
 
-        bf = BitField()
-        bf.bit7 = int(bool(FeatureReports))
-        bf.bit6 = int(bool(CounterRead))
-        bf.bit1 = int(bool(UpdateIO))
-        bf.bit0 = int(bool(LEDState))
-
-        command[4] = int(bf)
+        command[4] = packByte(
+            bit7=FeatureReports, bit6=CounterRead, bit1=UpdateIO, bit0=LEDState
+        )
 
         # Bits 7-4: 1001 (Start Continuous)
-        bf2 = BitField(rawByte=int(IO3ToIO0States))
-        bf2.bit7 = 1
-        bf2.bit4 = 1
-
-        command[5] = int(bf2)
+        command[5] = packByte(int(IO3ToIO0States), bit7=True, bit4=True)
 
         command[6] = SampleInterval >> 8
         command[7] = SampleInterval & 0xFF
@@ -1419,10 +1371,7 @@ class U12:
 
         # Update the current IO states.
         if bool(UpdateIO):
-            self.IO3toIO0DirAndStates = BitField(
-                rawByte=(int(self.IO3toIO0DirAndStates) & 0xF0)
-                | (int(IO3ToIO0States) & 0x0F)
-            )
+            self._updateIOStates(IO3ToIO0States)
 
         while True:
             results = self.read()
@@ -1431,10 +1380,93 @@ class U12:
 
             returnDict["Byte0"] = byte0bf
             returnDict["IterationCounter"] = results[1] >> 5
-            returnDict["Backlog"] = results[1] & 0xF
+            returnDict["Backlog"] = results[1] & 0x1F
 
             yield returnDict
 
+    def rawAIStream(
+        self,
+        channel0PGAMUX=8,
+        channel1PGAMUX=9,
+        channel2PGAMUX=10,
+        channel3PGAMUX=11,
+        UpdateIO=False,
+        LEDState=True,
+        IO3ToIO0States=0,
+        SampleInterval=AI_CONTINUOUS_MIN_SAMPLE_INTERVAL,
+        scansPerBlock=64,
+        bufferScans=65536,
+        timeout=100,
+    ) -> AIStream:
+        """
+        Start continuous acquisition of 4 channels and stream the scans.
+
+        Sends the AIContinuous command (Section 5.6 of the User's Guide) and
+        starts an :class:`AIStream`, whose reader thread reads every scan into a
+        preallocated buffer. Iterate over the stream to get blocks of decoded
+        scans. No other command may be sent to the U12 until the stream is
+        stopped.
+
+        By default, it does single-ended readings on AI0-3 at the maximum rate
+        of 1200 samples, or 300 scans, per second.
+
+        Args:
+            channel0PGAMUX: A byte that contains channel0 information
+            channel1PGAMUX: A byte that contains channel1 information
+            channel2PGAMUX: A byte that contains channel2 information
+            channel3PGAMUX: A byte that contains channel3 information
+            UpdateIO: True if you want to update the IO/D line, False to just
+                read their values.
+            LEDState: Turns the status LED on or off.
+            IO3ToIO0States: 4 bits for IO3-0 states
+            SampleInterval: = int(6000000.0/(ScanRate * NumberOfChannels))
+                              must be greater than (or equal to) 5000.
+            scansPerBlock: minimum number of scans in each block yielded.
+            bufferScans: number of scans the stream buffers for the caller.
+            timeout: read timeout of the reader thread in ms.
+
+        Returns:
+            The started AIStream.
+
+        Example:
+        >>> d = U12()
+        >>> with d.rawAIStream() as stream:
+        ...     for block in stream:
+        ...         print(block["Channel0"].mean(), stream.maxBacklog)
+        """
+        if not AI_CONTINUOUS_MIN_SAMPLE_INTERVAL <= SampleInterval <= 0xFFFF:
+            raise U12Exception(
+                "SampleInterval must be between %s and 65535."
+                % AI_CONTINUOUS_MIN_SAMPLE_INTERVAL
+            )
+        if scansPerBlock < 1 or bufferScans < scansPerBlock:
+            raise U12Exception(
+                "bufferScans must be greater than or equal to scansPerBlock."
+            )
+
+        channelPGAMUX = [
+            int(channel0PGAMUX),
+            int(channel1PGAMUX),
+            int(channel2PGAMUX),
+            int(channel3PGAMUX),
+        ]
+        command = channelPGAMUX + [
+            packByte(bit1=UpdateIO, bit0=LEDState),
+            # Bits 7-4: 1001 (Start Continuous)
+            packByte(int(IO3ToIO0States) & 0x0F, bit7=True, bit4=True),
+            (SampleInterval >> 8) & 0xFF,
+            SampleInterval & 0xFF,
+        ]
+
+        stream = AIStream(self, channelPGAMUX, scansPerBlock, bufferScans, timeout)
+        stream.start(command)
+
+        # Update the current IO states.
+        if bool(UpdateIO):
+            self._updateIOStates(IO3ToIO0States)
+
+        return stream
+
     def rawPulseout(
         self,
         B1=10,
@@ -1485,17 +1517,9 @@ class U12:
         command[4] = int(D7ToD0PulseSelection)
 
         # 01100100 (Pulseout)
-        bf = BitField()
-        bf.bit6 = 1
-        bf.bit5 = 1
-        bf.bit2 = 1
-
-        command[5] = int(bf)
-
-        bf2 = BitField(rawByte=(NumberOfPulses >> 8))
-        bf2.bit7 = int(bool(ClearFirst))
+        command[5] = 0x64  # 0b01100100
 
-        command[6] = int(bf2)
+        command[6] = packByte((NumberOfPulses >> 8) & 0x7F, bit7=ClearFirst)
         command[7] = NumberOfPulses & 0xFF
 
         self.write(command)
@@ -1508,10 +1532,7 @@ class U12:
         timeoutMS = max(timeoutMS, 1000) + 5000
         results = self.read(timeout=timeoutMS)
 
-        if command[5] != results[5]:
-            raise U12Exception(
-                "Expected Pulseout response, got %s instead." % results[5]
-            )
+        checkResponse(results[5], command[5], "Pulseout")
 
         if results[4] != 0:
             errors = BitField(
@@ -1535,15 +1556,7 @@ class U12:
         command = [0] * 8
 
         # 0b01011111 ( Reset )
-        bf = BitField()
-        bf.bit6 = 1
-        bf.bit4 = 1
-        bf.bit3 = 1
-        bf.bit2 = 1
-        bf.bit1 = 1
-        bf.bit0 = 1
-
-        command[5] = int(bf)
+        command[5] = 0x5F
         self.write(command)
         self.close()
 
@@ -1561,9 +1574,7 @@ class U12:
         command = [0] * 8
 
         # 0b01000000 (Re-Enumerate)
-        bf = BitField()
-        bf.bit6 = 1
-        command[5] = int(bf)
+        command[5] = 0x40
         self.write(command)
         self.close()
 
@@ -1598,25 +1609,19 @@ class U12:
 
         command[0] = int(bool(IgnoreCommands))
 
-        bf = BitField()
-        bf.bit7 = int(D0Active)
-        bf.bit6 = int(D0State)
-        bf.bit5 = int(D1Active)
-        bf.bit4 = int(D1State)
-        bf.bit3 = int(D8Active)
-        bf.bit2 = int(D8State)
-        bf.bit1 = int(ResetOnTimeout)
-        bf.bit0 = int(WatchdogActive)
-
-        command[4] = int(bf)
+        command[4] = packByte(
+            bit7=D0Active,
+            bit6=D0State,
+            bit5=D1Active,
+            bit4=D1State,
+            bit3=D8Active,
+            bit2=D8State,
+            bit1=ResetOnTimeout,
+            bit0=WatchdogActive,
+        )
 
         # 01X1X011 (Watchdog)
-        bf2 = BitField()
-        bf2.bit6 = 1
-        bf2.bit4 = 1
-        bf2.bit1 = 1
-        bf2.bit0 = 1
-        command[5] = int(bf2)
+        command[5] = 0x53  # 0b01010011
 
         # Timeout is increments of 2^16 cycles.
         # 2^16 cycles is about 0.01 seconds.
@@ -1662,10 +1667,7 @@ class U12:
         command = [0] * 8
 
         # 01010000 (Read RAM)
-        bf = BitField()
-        bf.bit6 = 1
-        bf.bit4 = 1
-        command[5] = int(bf)
+        command[5] = 0x50
 
         command[6] = (Address >> 8) & 0xFF
         command[7] = Address & 0xFF
@@ -1673,8 +1675,7 @@ class U12:
         self.write(command)
         results = self.read()
 
-        if results[0] != int(bf):
-            raise U12Exception("Expected ReadRAM response, got %s" % results[0])
+        checkResponse(results[0], command[5], "ReadRAM")
 
         if (results[6] != command[6]) or (results[7] != command[7]):
             receivedAddress = (results[6] << 8) + results[7]
@@ -1725,11 +1726,7 @@ class U12:
         command[: len(Data)] = Data
 
         # 01010001 (Write RAM)
-        bf = BitField()
-        bf.bit6 = 1
-        bf.bit4 = 1
-        bf.bit0 = 1
-        command[5] = int(bf)
+        command[5] = 0x51
 
         command[6] = (Address >> 8) & 0xFF
         command[7] = Address & 0xFF
@@ -1737,8 +1734,7 @@ class U12:
         self.write(command)
         results = self.read()
 
-        if results[0] != int(bf):
-            raise U12Exception("Expected WriteRAM response, got %s" % results[0])
+        checkResponse(results[0], command[5], "WriteRAM")
 
         if (results[6] != command[6]) or (results[7] != command[7]):
             receivedAddress = (results[6] << 8) + results[7]
@@ -1818,29 +1814,19 @@ class U12:
 
         command[: len(Data)] = Data
 
-        bf = BitField()
-        bf.bit3 = int(bool(AddDelay))
-        bf.bit2 = int(bool(TimeoutActive))
-        bf.bit1 = int(bool(SetTransmitEnable))
-        bf.bit0 = int(bool(PortB))
-
-        command[4] = int(bf)
+        command[4] = packByte(
+            bit3=AddDelay, bit2=TimeoutActive, bit1=SetTransmitEnable, bit0=PortB
+        )
 
         # 01100001 (Asynch)
-        bf2 = BitField()
-        bf2.bit6 = 1
-        bf2.bit5 = 1
-        bf2.bit0 = 1
-
-        command[5] = int(bf2)
+        command[5] = 0x61
         command[6] = NumberOfBytesToWrite
         command[7] = NumberOfBytesToRead
 
         self.write(command)
         results = self.read()
 
-        if command[5] != results[5]:
-            raise U12Exception("Expected Asynch response, got %s instead." % results[5])
+        checkResponse(results[5], command[5], "Asynch")
 
         returnDict = dict()
         returnDict["DataByte3"] = results[0]
@@ -1921,10 +1907,6 @@ class U12:
         Data.reverse()
         command[: len(Data)] = Data
 
-        bf = BitField()
-        bf.bit7 = int(bool(AddMsDelay))
-        bf.bit6 = int(bool(AddHundredUsDelay))
-
         spiModes = ("A", "B", "C", "D")
         try:
             modeIndex = spiModes.index(SPIMode)
@@ -1932,30 +1914,19 @@ class U12:
             raise U12Exception(
                 "Invalid SPIMode %r, valid modes are: %r" % (SPIMode, spiModes)
             )
-        bf[7 - modeIndex] = 1
-
-        command[4] = int(bf)
+        # Bits 3-0: SPI mode D-A
+        command[4] = packByte(1 << modeIndex, bit7=AddMsDelay, bit6=AddHundredUsDelay)
 
         # 01100010 (SPI)
-        bf2 = BitField()
-        bf2.bit6 = 1
-        bf2.bit5 = 1
-        bf2.bit1 = 1
-
-        command[5] = int(bf2)
+        command[5] = 0x62
         command[6] = NumberOfBytesToWriteRead
 
-        bf3 = BitField(rawByte=CSLineNumber)
-        bf3.bit7 = int(bool(ControlCS))
-        bf3.bit6 = int(bool(StateOfActiveCS))
-
-        command[7] = int(bf3)
+        command[7] = packByte(CSLineNumber & 0x3F, bit7=ControlCS, bit6=StateOfActiveCS)
 
         self.write(command)
         results = self.read()
 
-        if results[5] != command[5]:
-            raise U12Exception("Expected SPI response, got %s instead." % results[5])
+        checkResponse(results[5], command[5], "SPI")
 
         returnDict = dict()
         returnDict["DataByte3"] = results[0]
@@ -2062,24 +2033,19 @@ class U12:
         if max(NumberOfBytesToWrite, NumberOfBytesToRead) > 4:
             raise U12Exception("Can only read/write up to 4 bytes at a time.")
 
-        bf = BitField()
-        bf.bit7 = int(bool(WaitForMeasurementReady))
-        bf.bit6 = int(bool(IssueSerialReset))
-        bf.bit5 = int(bool(Add1MsDelay))
-        bf.bit4 = int(bool(Add300UsDelay))
-        bf.bit3 = int(bool(IO3State))
-        bf.bit2 = int(bool(IO2State))
-        bf.bit1 = int(bool(IO3Direction))
-        bf.bit0 = int(bool(IO2Direction))
-
-        command[4] = int(bf)
+        command[4] = packByte(
+            bit7=WaitForMeasurementReady,
+            bit6=IssueSerialReset,
+            bit5=Add1MsDelay,
+            bit4=Add300UsDelay,
+            bit3=IO3State,
+            bit2=IO2State,
+            bit1=IO3Direction,
+            bit0=IO2Direction,
+        )
 
         # 01101000 (SHT1X)
-        bf2 = BitField()
-        bf2.bit6 = 1
-        bf2.bit5 = 1
-        bf2.bit3 = 1
-        command[5] = int(bf2)
+        command[5] = 0x68
 
         command[6] = NumberOfBytesToWrite
         command[7] = NumberOfBytesToRead
@@ -2087,16 +2053,19 @@ class U12:
         self.write(command)
         results = self.read()
 
-        if results[5] != command[5]:
-            raise U12Exception("Expected SHT1x response, got %s instead." % results[5])
+        checkResponse(results[5], command[5], "SHT1x")
 
-        self.IO3toIO0DirAndStates.bit7 = int(bool(IO3Direction))
-        self.IO3toIO0DirAndStates.bit6 = int(bool(IO2Direction))
-        self.IO3toIO0DirAndStates.bit5 = 0
-        self.IO3toIO0DirAndStates.bit4 = 1
-        self.IO3toIO0DirAndStates.bit3 = int(bool(IO3State))
-        self.IO3toIO0DirAndStates.bit2 = int(bool(IO2State))
-        self.IO3toIO0DirAndStates.bit1 = 0
+        # Bit 0, the state of IO0, is unchanged
+        self._updateIOStates(
+            packByte(
+                bit7=IO3Direction,
+                bit6=IO2Direction,
+                bit4=True,
+                bit3=IO3State,
+                bit2=IO2State,
+            ),
+            0xFE,
+        )
 
         returnDict = dict()
         returnDict["DataByte3"] = results[0]
@@ -3697,6 +3666,308 @@ class U12:
         return error_string.value
 
 
+def _channelScales(
+    channelPGAMUX: Sequence[int],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get step, span and gain converting counts of 4 channels to volts.
+
+    volts = (counts * step - span) / gain, as in :meth:`U12.bitsToVolts`.
+    """
+    step = np.empty((4, 1))
+    span = np.empty((4, 1))
+    gain = np.ones((4, 1))
+    for i, pgamux in enumerate(channelPGAMUX):
+        # MUX commands 8-15 are single-ended, 0-7 differential
+        if (pgamux & 0xF) > 7:
+            step[i], span[i] = 20.0 / 4096.0, 10.0
+        else:
+            step[i], span[i] = 40.0 / 4096.0, 20.0
+            gain[i] = U12.GainMapping[(pgamux >> 4) & 7]
+    return step, span, gain
+
+
+def decodeAIPackets(
+    packets: np.ndarray, channelPGAMUX: Sequence[int]
+) -> Dict[str, np.ndarray]:
+    """Decode AIBurst or AIContinuous responses all at once.
+
+    Channel readings are converted to volts as by :meth:`U12.bitsToVolts` with the
+    Exodriver.
+
+    Args:
+        packets: array of shape (number of scans, 8) of the 8-byte responses.
+        channelPGAMUX: the PGAMUX bytes of channels 0-3 in the command.
+
+    Returns: A dictionary of arrays, with one element per scan, and the following keys:
+        Channel0-3, the readings on the channels in volts
+        PGAOvervoltages, the over-voltage flags
+        IO3toIO0States, the IO states as 4 bits
+        IterationCounters, the values of the iteration counter
+        Backlogs, value*256 = number of packets in the backlog.
+        BufferOverflowOrChecksumErrors, If True and Backlog = 31, then a buffer
+            overflow occurred. If True and Backlog = 0, then Checksum error
+            occurred.
+
+    Raises:
+        U12Exception: if a response is not an AI response.
+    """
+    packets = np.asarray(packets, dtype=np.uint8).reshape(-1, 8)
+    status = packets[:, 0]
+    info = packets[:, 1]
+
+    # Bits 7-6: 10 (AI response)
+    invalid = (status & 0xC0) != 0x80
+    if invalid.any():
+        raise U12Exception(
+            "Expected a AI response, got %s instead." % status[invalid][0]
+        )
+
+    # Bits 11-8 of channels 0 and 1 are in byte 2, of channels 2 and 3 in byte 5
+    high = packets[:, [2, 2, 5, 5]].T.astype(np.uint16)
+    high[0::2] >>= 4
+    counts = ((high & 0xF) << 8) | packets[:, [3, 4, 6, 7]].T
+    step, span, gain = _channelScales(channelPGAMUX)
+    volts = (counts * step - span) / gain
+
+    return {
+        "BufferOverflowOrChecksumErrors": (status & 0x20) != 0,
+        "PGAOvervoltages": (status & 0x10) != 0,
+        "IO3toIO0States": status & 0x0F,
+        "IterationCounters": info >> 5,
+        "Backlogs": info & 0x1F,
+        "Channel0": volts[0],
+        "Channel1": volts[1],
+        "Channel2": volts[2],
+        "Channel3": volts[3],
+    }
+
+
+def aiPacketsToLists(decoded: Dict[str, np.ndarray]) -> Dict[str, list]:
+    """Convert responses decoded by :func:`decodeAIPackets` to lists.
+
+    This is the format :meth:`U12.rawAIBurst` returned before decoding with NumPy.
+    IO states are converted to BitFields labelled IO3-IO0, and flags to bools.
+    """
+    returnDict = {key: value.tolist() for key, value in decoded.items()}
+    returnDict["IO3toIO0States"] = [
+        BitField(states, "IO", list(range(3, -1, -1)), "Low", "High")
+        for states in returnDict["IO3toIO0States"]
+    ]
+    return returnDict
+
+
+class AIStream:
+    """
+    Continuous acquisition of 4 analog inputs of a U12.
+
+    Started by :meth:`U12.rawAIStream`. A reader thread reads the 8-byte response
+    of each scan straight into a preallocated ring buffer, keeping the backlog of
+    the U12 empty however long the caller takes to process the data. Iterating
+    over the stream yields blocks of at least `scansPerBlock` scans, decoded by
+    :func:`decodeAIPackets`, until the stream is stopped and all buffered scans
+    are read.
+
+    If the ring buffer is full, new scans are discarded and counted in
+    `droppedScans`. Scans lost before reaching the host are counted from gaps in
+    the iteration counters.
+
+    Attributes:
+        scansPerBlock: minimum number of scans in each block.
+        scans: number of scans read from the U12.
+        droppedScans: number of scans discarded because the buffer was full.
+        missedScans: number of scans missing from the iteration counters.
+        backlog: backlog of the latest scan, value*256 = number of packets.
+        maxBacklog: largest backlog since the stream started.
+        bufferOverflows: number of scans flagged with a backlog of 31, reporting a
+            U12 buffer overflow.
+        checksumErrors: number of scans flagged with a backlog of 0, reporting a
+            checksum error.
+        timeouts: number of reads that timed out.
+        error: exception that stopped the reader thread, if any.
+    """
+
+    def __init__(
+        self,
+        device: U12,
+        channelPGAMUX: Sequence[int],
+        scansPerBlock: int = 64,
+        bufferScans: int = 65536,
+        timeout: int = 100,
+    ) -> None:
+        """Create AIStream and allocate its buffer.
+
+        Args:
+            device: the opened U12.
+            channelPGAMUX: the PGAMUX bytes of channels 0-3.
+            scansPerBlock: minimum number of scans in each block.
+            bufferScans: number of scans the ring buffer holds.
+            timeout: read timeout of the reader thread in ms.
+        """
+        self._device = device
+        self._channelPGAMUX = list(channelPGAMUX)
+        self._timeout = timeout
+        self._packets = np.zeros((bufferScans, 8), dtype=np.uint8)
+        self._head = 0  # Scans written to the buffer
+        self._tail = 0  # Scans taken by the caller
+        self._reading = False
+        self._stopping = threading.Event()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+        self.scansPerBlock: int = scansPerBlock
+        self.scans: int = 0
+        self.droppedScans: int = 0
+        self.missedScans: int = 0
+        self.backlog: int = 0
+        self.maxBacklog: int = 0
+        self.bufferOverflows: int = 0
+        self.checksumErrors: int = 0
+        self.timeouts: int = 0
+        self.error: Optional[BaseException] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the reader thread is reading scans."""
+        return self._reading
+
+    def start(self, command: List[int]) -> None:
+        """Send the AIContinuous command and start the reader thread."""
+        if self._thread is not None:
+            raise U12Exception("The stream is already started.")
+        self._device.write(command)
+        self._device.streaming = True
+        self._reading = True
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._read, name="U12 AIStream", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop continuous acquisition and the reader thread.
+
+        Scans already buffered can still be read.
+        """
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+
+        # Any command stops continuous acquisition, so read the DIO states.
+        command = [0] * 8
+        command[5] = 0x57  # 0b01010111
+        self._device.write(command)
+        # Discard scans in transit, then the DIO response.
+        while self._device.read(timeout=self._timeout):
+            pass
+        self._device.streaming = False
+
+    def read(self, timeout: Optional[float] = None) -> Optional[Dict[str, np.ndarray]]:
+        """Wait for a block of scans and decode it.
+
+        Args:
+            timeout: maximum time to wait in seconds, or None to wait until a
+                block is available or the stream stops.
+
+        Returns:
+            all buffered scans, decoded by :func:`decodeAIPackets`, or None if no
+            scans are available.
+
+        Raises:
+            U12Exception: if the reader thread failed and all scans are read.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._head - self._tail >= self.scansPerBlock
+                or not self._reading,
+                timeout,
+            )
+            start, stop = self._tail, self._head
+        if start == stop:
+            if self.error is not None:
+                raise U12Exception("AIStream reader failed: %s" % self.error)
+            return None
+
+        # Copy the scans before releasing them to the reader thread
+        packets = self._packets.take(np.arange(start, stop), axis=0, mode="wrap")
+        with self._condition:
+            self._tail = stop
+        return decodeAIPackets(packets, self._channelPGAMUX)
+
+    def _read(self) -> None:
+        """Read scans into the ring buffer until stopped."""
+        readTO = self._device._lib.LJUSB_ReadTO
+        handle = self._device.handle
+        capacity = len(self._packets)
+        base = self._packets.ctypes.data
+        spare = np.zeros(8, dtype=np.uint8)
+        spareAddress = spare.ctypes.data
+        counter = None
+        try:
+            while not self._stopping.is_set():
+                # Only the caller frees space, so the buffer stays full or not
+                full = self._head - self._tail >= capacity
+                if full:
+                    slot, address = spare, spareAddress
+                else:
+                    index = self._head % capacity
+                    slot, address = self._packets[index], base + 8 * index
+                readBytes = readTO(handle, ctypes.c_void_p(address), 8, self._timeout)
+                if readBytes == 0:
+                    self.timeouts += 1
+                    continue
+                if readBytes != 8:
+                    raise U12Exception("Could only read %s of 8 bytes." % readBytes)
+
+                status, info = int(slot[0]), int(slot[1])
+                if (status & 0xC0) != 0x80:
+                    raise U12Exception(
+                        "Expected a AIContinuous response, got %s instead." % status
+                    )
+                iteration = info >> 5
+                if counter is not None:
+                    self.missedScans += (iteration - counter - 1) & 7
+                counter = iteration
+                self.backlog = info & 0x1F
+                self.maxBacklog = max(self.maxBacklog, self.backlog)
+                # Bit 5 flags an overflow if Backlog = 31, a checksum error if 0
+                if status & 0x20:
+                    if self.backlog == 0x1F:
+                        self.bufferOverflows += 1
+                    elif self.backlog == 0:
+                        self.checksumErrors += 1
+
+                with self._condition:
+                    self.scans += 1
+                    if full:
+                        self.droppedScans += 1
+                    else:
+                        self._head += 1
+                        if self._head - self._tail >= self.scansPerBlock:
+                            self._condition.notify_all()
+        except Exception as e:
+            self.error = e
+        finally:
+            with self._condition:
+                self._reading = False
+                self._condition.notify_all()
+
+    def __iter__(self):
+        """Yield blocks of decoded scans until the stream stops."""
+        while True:
+            block = self.read()
+            if block is None:
+                return
+            yield block
+
+    def __enter__(self) -> AIStream:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
 def listToCArray(list_, dataType):
     arrayType = dataType * len(list_)
     array = arrayType()
@@ -21,13 +21,12 @@ from nupylab.instruments.heater.eurotherm2400 import Eurotherm2400 as Heater
 from nupylab.instruments.mfc.rod4 import ROD4 as MFC
 from nupylab.instruments.o2_sensor.keithley2182 import Keithley2182 as PO2_Sensor
 ######################
-from nupylab.utilities import list_resources, nupylab_procedure, nupylab_window
-from pymeasure.display.Qt import QtWidgets
+from nupylab.utilities import nupylab_procedure
+from nupylab.utilities.resources import ResourceParameter
 from pymeasure.experiment import (
     BooleanParameter,
     FloatParameter,
     IntegerParameter,
-    ListParameter,
     Parameter,
 )
 
@@ -59,15 +58,17 @@ class S4Procedure(nupylab_procedure.NupylabProcedure):
         "-Z_im (ohm)",
     ]
 
-    resources = list_resources()
-
-    furnace_port = ListParameter("Eurotherm Port", choices=resources)
+    furnace_port = ResourceParameter("Eurotherm Port")
     furnace_address = IntegerParameter(
         "Eurotherm Address", minimum=1, maximum=254, step=1, default=1
     )
-    mfc_port = ListParameter("ROD-4 Port", choices=resources)
+    mfc_port = ResourceParameter("ROD-4 Port")
     potentiostat_port = Parameter("Biologic Port", default="192.109.209.128")
-    po2_sensor_port = ListParameter("Keithley Port", choices=resources)
+    # 0 reads the firmware version from the Biologic on first connection
+    potentiostat_firmware = IntegerParameter(
+        "Biologic Firmware Version", minimum=0, default=0
+    )
+    po2_sensor_port = ResourceParameter("Keithley Port")
 
     target_temperature = FloatParameter("Target Temperature", units="C")
     ramp_rate = FloatParameter("Ramp Rate", units="C/min")
@@ -105,9 +106,8 @@ class S4Procedure(nupylab_procedure.NupylabProcedure):
 
     # Entries in axes must have matches in procedure DATA_COLUMNS.
     # Number of plots is determined by the longer of X_AXIS or Y_AXIS
-    X_AXIS: List[str] = ["Z_re (ohm)", "Time (s)"]
+    X_AXIS: List[str] = ["Time (s)"]
     Y_AXIS: List[str] = [
-        "-Z_im (ohm)",
         "Furnace Temperature (degC)",
         "pO2 Sensor Temperature (degC)",
         "pO2 (atm)",
@@ -124,6 +124,7 @@ class S4Procedure(nupylab_procedure.NupylabProcedure):
         "furnace_address",
         "mfc_port",
         "potentiostat_port",
+        "potentiostat_firmware",
         "po2_sensor_port",
     ]
 
@@ -156,6 +157,7 @@ class S4Procedure(nupylab_procedure.NupylabProcedure):
                 "SP200",
                 0,
                 ("Ewe (V)", "Frequency (Hz)", "Z_re (ohm)", "-Z_im (ohm)"),
+                firmware_version=self.potentiostat_firmware or None,
             )
             po2_sensor = PO2_Sensor(
                 self.po2_sensor_port,
@@ -195,6 +197,10 @@ class S4Procedure(nupylab_procedure.NupylabProcedure):
 
 def main(*args):
     """Run S4 procedure."""
+    # Qt and the window are only needed by the GUI, not by headless runners
+    from nupylab.utilities import nupylab_window
+    from pymeasure.display.Qt import QtWidgets
+
     app = QtWidgets.QApplication(*args)
     window = nupylab_window.NupylabWindow(S4Procedure)
     window.show()
@@ -17,13 +17,12 @@ from typing import Dict, List
 from nupylab.instruments.ac_potentiostat.biologic import Biologic as Potentiostat
 from nupylab.instruments.heater.eurotherm2200 import Eurotherm2200 as Heater
 ######################
-from nupylab.utilities import list_resources, nupylab_procedure, nupylab_window
-from pymeasure.display.Qt import QtWidgets
+from nupylab.utilities import nupylab_procedure
+from nupylab.utilities.resources import ResourceParameter
 from pymeasure.experiment import (
     BooleanParameter,
     FloatParameter,
     IntegerParameter,
-    ListParameter,
     Parameter,
 )
 
@@ -36,11 +35,7 @@ class S8Procedure(nupylab_procedure.NupylabProcedure):
     `num_steps`, and `current_steps` from parent class.
     """
 
-    resources = list_resources()
-
-    furnace_port: ListParameter = ListParameter(
-        "Eurotherm Port", choices=resources, ui_class=None
-    )
+    furnace_port: ResourceParameter = ResourceParameter("Eurotherm Port", ui_class=None)
     furnace_address: IntegerParameter = IntegerParameter(
         "Eurotherm Address", minimum=1, maximum=254, step=1, default=1
     )
@@ -51,6 +46,10 @@ class S8Procedure(nupylab_procedure.NupylabProcedure):
     potentiostat_port: Parameter = Parameter(
         "Biologic Port", default="USB0", ui_class=None, group_by="eis_toggle"
     )
+    # 0 reads the firmware version from the Biologic on first connection
+    potentiostat_firmware: IntegerParameter = IntegerParameter(
+        "Biologic Firmware Version", minimum=0, default=0, group_by="eis_toggle"
+    )
     eis_toggle: BooleanParameter = BooleanParameter("Run eis")
     maximum_frequency: FloatParameter = FloatParameter("Maximum Frequency", units="Hz")
     minimum_frequency: FloatParameter = FloatParameter("Minimum Frequency", units="Hz")
@@ -82,9 +81,8 @@ class S8Procedure(nupylab_procedure.NupylabProcedure):
 
     # Entries in axes must have matches in procedure DATA_COLUMNS.
     # Number of plots is determined by the longer of X_AXIS or Y_AXIS
-    X_AXIS: List[str] = ["Z_re (ohm)", "Time (s)"]
+    X_AXIS: List[str] = ["Time (s)"]
     Y_AXIS: List[str] = [
-        "-Z_im (ohm)",
         "Ewe (V)",
         "Furnace Temperature (degC)",
     ]
@@ -94,6 +92,7 @@ class S8Procedure(nupylab_procedure.NupylabProcedure):
         "furnace_port",
         "furnace_address",
         "potentiostat_port",
+        "potentiostat_firmware",
     ]
 
     def set_instruments(self) -> None:
@@ -121,6 +120,7 @@ class S8Procedure(nupylab_procedure.NupylabProcedure):
                     "Z_re (ohm)",
                     "-Z_im (ohm)",
                 ),
+                firmware_version=self.potentiostat_firmware or None,
             )
         self.instruments = (furnace, potentiostat)
         furnace.set_parameters(self.target_temperature, self.ramp_rate, self.dwell_time)
@@ -141,6 +141,10 @@ class S8Procedure(nupylab_procedure.NupylabProcedure):
 
 def main(*args):
     """Run S8 procedure."""
+    # Qt and the window are only needed by the GUI, not by headless runners
+    from nupylab.utilities import nupylab_window
+    from pymeasure.display.Qt import QtWidgets
+
     app = QtWidgets.QApplication(*args)
     window = nupylab_window.NupylabWindow(S8Procedure)
     window.show()
@@ -25,13 +25,12 @@ from nupylab.instruments.mfc.rod4 import ROD4 as MFC
 from nupylab.instruments.scanner.keithley705 import Keithley705 as Scanner
 from nupylab.instruments.thermocouple_sensor.hp3478A import HP3478A as TC_Sensor
 ######################
-from nupylab.utilities import list_resources, nupylab_procedure, nupylab_window
-from pymeasure.display.Qt import QtWidgets
+from nupylab.utilities import nupylab_procedure
+from nupylab.utilities.resources import ResourceParameter
 from pymeasure.experiment import (
     BooleanParameter,
     FloatParameter,
     IntegerParameter,
-    ListParameter,
 )
 
 
@@ -60,18 +59,14 @@ class SAFCProcedure(nupylab_procedure.NupylabProcedure):
         "-Z_im (ohm)",
     ]
 
-    resources = list_resources()
-
-    furnace_port = ListParameter("Eurotherm Port", choices=resources, ui_class=None)
+    furnace_port = ResourceParameter("Eurotherm Port", ui_class=None)
     furnace_address = IntegerParameter(
         "Eurotherm Address", minimum=1, maximum=254, step=1, default=1
     )
-    mfc_port = ListParameter("ROD-4 Port", choices=resources, ui_class=None)
-    potentiostat_port = ListParameter(
-        "Potentiostat Port", choices=resources, ui_class=None
-    )
-    tc_sensor_port = ListParameter("TC Sensor Port", choices=resources, ui_class=None)
-    scanner_port = ListParameter("Scanner Port", choices=resources, ui_class=None)
+    mfc_port = ResourceParameter("ROD-4 Port", ui_class=None)
+    potentiostat_port = ResourceParameter("Potentiostat Port", ui_class=None)
+    tc_sensor_port = ResourceParameter("TC Sensor Port", ui_class=None)
+    scanner_port = ResourceParameter("Scanner Port", ui_class=None)
 
     target_temperature = FloatParameter("Target Temperature", units="C")
     ramp_rate = FloatParameter("Ramp Rate", units="C/min")
@@ -107,9 +102,8 @@ class SAFCProcedure(nupylab_procedure.NupylabProcedure):
 
     # Entries in axes must have matches in procedure DATA_COLUMNS.
     # Number of plots is determined by the longer of X_AXIS or Y_AXIS
-    X_AXIS: List[str] = ["Z_re (ohm)", "Time (s)"]
+    X_AXIS: List[str] = ["Time (s)"]
     Y_AXIS: List[str] = [
-        "-Z_im (ohm)",
         "Furnace Temperature (degC)",
         "1: Temperature (degC)",
         "2: Temperature (degC)",
@@ -198,6 +192,10 @@ class SAFCProcedure(nupylab_procedure.NupylabProcedure):
 
 def main(*args):
     """Run SAFC procedure."""
+    # Qt and the window are only needed by the GUI, not by headless runners
+    from nupylab.utilities import nupylab_window
+    from pymeasure.display.Qt import QtWidgets
+
     app = QtWidgets.QApplication(*args)
     window = nupylab_window.NupylabWindow(SAFCProcedure)
     window.show()
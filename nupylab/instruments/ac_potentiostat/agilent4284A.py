@@ -3,10 +3,11 @@
 from typing import Sequence, List, Optional, Callable
 
 import numpy as np
-from pymeasure.instruments.agilent import agilent4284A
-from nupylab.utilities import DataTuple, NupylabError
+from nupylab.utilities import DataTuple, LazyImport, NupylabError
 from nupylab.utilities.nupylab_instrument import NupylabInstrument
 
+agilent4284A = LazyImport("pymeasure.instruments.agilent.agilent4284A")
+
 
 class Agilent4284A(NupylabInstrument):
     """Agilent 4284A instrument class. Abstracts driver for NUPyLab procedures.
@@ -1,20 +1,70 @@
 """Adapts Biologic driver to NUPylab instrument class for use with NUPyLab GUIs."""
 from __future__ import annotations
-import importlib
-from typing import Sequence, Union, TYPE_CHECKING, Optional, List, Type, Callable
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Type,
+    Union,
+)
 
 import numpy as np
-from nupylab.drivers.biologic import BiologicPotentiostat, OCV
-from nupylab.utilities import DataTuple, NupylabError
+from nupylab.utilities import DataTuple, LazyImport, NupylabError
 from nupylab.utilities.nupylab_instrument import NupylabInstrument
 
+# The driver defines many ctypes structures, so only import it
+# once a Biologic is actually used
+biologic_driver = LazyImport("nupylab.drivers.biologic")
+
 if TYPE_CHECKING:
-    from nupylab.drivers.biologic import Technique
+    from nupylab.drivers.biologic import (
+        BiologicPotentiostat,
+        KBIOData,
+        OCV,
+        Technique,
+    )
+
+
+class _ChannelRun:
+    """Techniques, trigger condition, and progress of one Biologic channel.
+
+    Attributes:
+        ocv: OCV technique run until `eis_condition` is met.
+        ocv_end: same OCV with no rest time, sent to the running channel to end OCV.
+        eis: eis technique run after OCV.
+        eis_condition: function indicating whether to begin eis measurement.
+        started: whether the techniques have been started on the channel.
+        measuring_ocv: whether the channel is measuring OCV.
+        finished: whether the channel has finished eis.
+    """
+
+    def __init__(
+        self,
+        ocv: OCV,
+        ocv_end: OCV,
+        eis: Technique,
+        eis_condition: Callable[[], bool],
+    ) -> None:
+        self.ocv: OCV = ocv
+        self.ocv_end: OCV = ocv_end
+        self.eis: Technique = eis
+        self.eis_condition: Callable[[], bool] = eis_condition
+        self.started: bool = False
+        self.measuring_ocv: bool = False
+        self.finished: bool = False
 
 
 class Biologic(NupylabInstrument):
     """Biologic instrument class. Abstracts driver for NUPyLab procedures.
 
+    Each channel runs its own technique, eis condition, and completion state, so the
+    channels of a multichannel instrument can be set, started, and finished
+    independently, see :meth:`set_parameters` and :meth:`start`.
+
     Attributes:
         data_label: labels for DataTuples.
         name: name of instrument.
@@ -31,6 +81,8 @@ class Biologic(NupylabInstrument):
         data_label: Sequence[str],
         name: str = "Biologic",
         eclib_path: Optional[str] = None,
+        eclib: Optional[Any] = None,
+        firmware_version: Optional[int] = None,
     ) -> None:
         """Initialize Biologic data labels, name, and connection parameters.
 
@@ -39,11 +91,18 @@ class Biologic(NupylabInstrument):
             model: Biologic model, e.g. `SP200` or `SP300`.
             channels: Biologic channels to measure, zero-based.
             data_label: labels for DataTuples. :meth:`get_data` returns four results
-                for each channel (E_we, frequency, Z_re, and -Z_im), and corresponding
-                labels should match entries in DATA_COLUMNS.
+                for each channel (E_we, frequency, Z_re, and -Z_im), labelled with
+                four consecutive entries per channel in the order of `channels`, and
+                corresponding labels should match entries in DATA_COLUMNS.
             name: name of instrument.
             eclib_path: path to the directory containing the EClib DLL. If None, default
                 is used.
+            eclib: object to use in place of the EClib DLL, e.g. a simulated EClib from
+                :mod:`nupylab.drivers.eclib_simulator`.
+            firmware_version: version of the kernel firmware loaded by EClib. If given,
+                :meth:`connect` skips loading firmware on channels already running this
+                version and reloads it on the others. If None, the version is read
+                from the channels after the first connection.
 
         Raises:
             ValueError: if `data_label` does not contain 4 entries per channel.
@@ -52,27 +111,48 @@ class Biologic(NupylabInstrument):
             channels = (channels,)
         if len(channels) * 4 != len(data_label):
             raise ValueError("data_label must contain 4 entries per channel.")
-        model = model.replace("-", "").replace(" ", "").upper()
-        self.biologic: BiologicPotentiostat = BiologicPotentiostat(
-            model, port, eclib_path
-        )
-        self.ocv = None
+        self.biologic: Optional[BiologicPotentiostat] = None
+        self._model: str = model.replace("-", "").replace(" ", "").upper()
+        self._port: str = port
+        self._eclib_path: Optional[str] = eclib_path
+        self._eclib: Optional[Any] = eclib
+        self._firmware_version: Optional[int] = firmware_version
         self.channels = channels
         self._chan_bool: List[int] = [
             0,
         ] * 16  # for multi-channel operations
         for c in self.channels:
             self._chan_bool[c] = 1
-        self._measuring_ocv: bool = False
-        self._finished: bool = False
-        self._eis_condition = None
+        self._runs: Dict[int, _ChannelRun] = {}
         super().__init__(data_label, name)
 
     def connect(self) -> None:
-        """Connect to Biologic."""
+        """Connect to Biologic, loading the EClib DLL on first connection.
+
+        Firmware is only loaded on channels that do not already run the expected
+        firmware version, e.g. after reconnecting. Without an expected version, EClib
+        loads firmware on channels without a kernel, and the version it reports is
+        expected on later connections.
+        """
         with self.lock:
+            if self.biologic is None:
+                self.biologic = biologic_driver.BiologicPotentiostat(
+                    self._model, self._port, self._eclib_path, eclib=self._eclib
+                )
             self.biologic.connect()
-            self.biologic.load_firmware(self._chan_bool)
+            if self._firmware_version is None:
+                mask = self._mask(self.channels)
+                self.biologic.load_firmware(mask, force_reload=False)
+                infos = self.biologic.get_channel_infos(self.channels[0])
+                self._firmware_version = infos["FirmwareVersion"]
+            else:
+                unloaded = [
+                    c
+                    for c in self.channels
+                    if not self.biologic.firmware_loaded(c, self._firmware_version)
+                ]
+                if unloaded:
+                    self.biologic.load_firmware(self._mask(unloaded))
             self._connected = True
 
     def _initialize_eis(
@@ -85,7 +165,7 @@ class Biologic(NupylabInstrument):
         technique: str,
         eis: Type[Technique],
         **kwargs,
-    ) -> None:
+    ) -> Technique:
         freq_steps: int = round((np.log10(max_freq) - np.log10(min_freq)) * ppd) + 1
         technique_dict: dict = globals()[technique + "_DICT"].copy()
         technique_dict.update(
@@ -106,7 +186,7 @@ class Biologic(NupylabInstrument):
                     f"Biologic technique {technique} does not contain "
                     f"keyword argument {key}"
                 )
-        self._eis = eis(**technique_dict)
+        return eis(**technique_dict)
 
     def set_parameters(
         self,
@@ -117,6 +197,7 @@ class Biologic(NupylabInstrument):
         points_per_decade: int,
         technique: str,
         eis_condition: Callable[[], bool],
+        channel: Optional[int] = None,
         **kwargs,
     ) -> None:
         """Set measurement parameters and prepare eis technique.
@@ -131,27 +212,33 @@ class Biologic(NupylabInstrument):
             technique: eis technique to run, must be `PEIS`, `GEIS`, `SPEIS`, or
                 `SGEIS`. Defaults to `PEIS`.
             eis_condition: function indicating whether to begin eis measurement.
+            channel: channel to set, zero-based. If None, all channels are set.
             **kwargs: additional kwargs to pass to `technique`.
 
         Raises:
             KeyError: if `technique` is not supported.
+            ValueError: if `channel` is not an active measurement channel.
         """
         technique = technique.upper()
         if technique not in ("PEIS", "GEIS", "SPEIS", "SGEIS"):
             raise KeyError(
                 f"Technique {technique} must be `PEIS`, `GEIS`, `SPEIS`, or `SGEIS`."
             )
-        eis: Type[Technique] = getattr(
-            importlib.import_module("nupylab.drivers.biologic"), technique
-        )
-        self.ocv: OCV = OCV(
+        channels = self._select(channel)
+        eis: Type[Technique] = getattr(biologic_driver, technique)
+        ocv: OCV = biologic_driver.OCV(
             duration=24 * 60 * 60,
             record_every_de=0.1,
             record_every_dt=record_time,
             e_range="KBIO_ERANGE_AUTO",
         )
-        self._eis_condition = eis_condition
-        self._initialize_eis(
+        ocv_end: OCV = biologic_driver.OCV(
+            duration=0,
+            record_every_de=0.1,
+            record_every_dt=record_time,
+            e_range="KBIO_ERANGE_AUTO",
+        )
+        eis_technique = self._initialize_eis(
             maximum_frequency,
             minimum_frequency,
             amplitude,
@@ -161,98 +248,185 @@ class Biologic(NupylabInstrument):
             eis,
             **kwargs,
         )
-        self._finished = False
+        for c in channels:
+            self._runs[c] = _ChannelRun(ocv, ocv_end, eis_technique, eis_condition)
         self._parameters = True  # Placeholder just to indicate parameters are set.
 
-    def start(self) -> None:
+    def start(self, channel: Optional[int] = None) -> None:
         """Start OCV measurement on Biologic channel(s).
 
+        OCV and eis are loaded as one sequence, so the channel moves on to eis on the
+        instrument once OCV is ended by :meth:`get_data`.
+
+        Args:
+            channel: channel to start, zero-based. If None, all channels with
+                parameters set since they were last started are started.
+
         Raises:
             NupylabError: if `start` method is called before `set_parameters`.
+            ValueError: if `channel` is not an active measurement channel.
         """
-        if self._parameters is None:
+        if channel is None:
+            channels = [
+                c
+                for c in self.channels
+                if c in self._runs and not self._runs[c].started
+            ]
+        else:
+            channels = [c for c in self._select(channel) if c in self._runs]
+        if not channels:
             raise NupylabError(
                 f"`{self.__class__.__name__}` method `set_parameters` "
                 "must be called before calling its `start` method."
             )
         with self.lock:
-            for c in self.channels:
-                self.biologic.load_technique(c, self.ocv, first=True, last=True)
-            if len(self.channels) == 1:
-                self.biologic.start_channel(self.channels[0])
+            for c in channels:
+                run = self._runs[c]
+                self.biologic.load_techniques(c, (run.ocv, run.eis))
+            if len(channels) == 1:
+                self.biologic.start_channel(channels[0])
             else:
-                self.biologic.start_channels(self._chan_bool)
-        self._measuring_ocv = True
-        self._parameters = None
+                self.biologic.start_channels(self._mask(channels))
+        for c in channels:
+            run = self._runs[c]
+            run.started = run.measuring_ocv = True
+            run.finished = False
+        if all(run.started for run in self._runs.values()):
+            self._parameters = None
 
     def get_data(self) -> List[DataTuple]:
-        """Get OCV or eis data for each channel.
+        """Get OCV or eis data for each started channel.
+
+        Once the `eis_condition` of a channel is met, OCV is ended on that channel,
+        which then starts the preloaded eis technique without stopping.
 
         Returns:
             DataTuples in the order E_we, frequency, Z_re, and -Z_im for each
-            channel if measuring eis, E_we only if measuring OCV.
+            channel if measuring eis, E_we only if measuring OCV, labelled with the
+            channel's entries of `data_label`. Points measured without frequency are
+            NaN in frequency and impedance columns.
         """
+        channels = [
+            c for c in self.channels if c in self._runs and self._runs[c].started
+        ]
+        if not channels:
+            return []
+        # Evaluate external conditions, like furnace program complete, before locking
+        switches = [c for c in channels if self.channel_eis_condition(c)]
         with self.lock:
-            all_data = [self.biologic.get_data(c) for c in self.channels]
-            if not self._measuring_ocv:
-                self._finished = all(
-                    self.biologic.get_channel_infos(c)["State"] == 0 for c in self.channels
-                )
-            # Switch from OCV to eis upon external condition, like furnace program complete
-            if self.eis_condition:
-                if len(self.channels) == 1:
-                    channel = self.channels[0]
-                    self.biologic.stop_channel(channel)
-                    self.biologic.load_technique(channel, self._eis, first=True, last=True)
-                    self.biologic.start_channel(channel)
-                else:
-                    self.biologic.stop_channels(self._chan_bool)
-                    for c in self.channels:
-                        self.biologic.load_technique(c, self._eis, first=True, last=True)
-                    self.biologic.start_channels(self._chan_bool)
-                self._measuring_ocv = False
+            # Read every waiting block of all channels in one pass, so no points are
+            # lost between polls. Channel states are returned with the data.
+            bulk_data = self.biologic.get_data_bulk(channels)
+            for c in channels:
+                run = self._runs[c]
+                if not run.measuring_ocv:
+                    run.finished = self.biologic.channel_states[c] == 0
+            for c in switches:
+                self.biologic.update_parameters(c, 0, self._runs[c].ocv_end)
+                self._runs[c].measuring_ocv = False
 
         data = []
-        for kbio_data, c in zip(all_data, self.channels):
-            if kbio_data is None:
+        for c in channels:
+            blocks = bulk_data[c]
+            if not blocks:
                 continue
-
-            if "freq" in kbio_data.data_field_names:  # Measuring PEIS
-                abs_z = kbio_data.abs_Ewe_numpy / kbio_data.abs_I_numpy
-                z_phase = kbio_data.Phase_Zwe_numpy
-                z_re = abs_z * np.cos(z_phase)
-                z_im = abs_z * np.sin(z_phase)
-                data.append((
-                    DataTuple(self.data_label[0], kbio_data.Ewe),
-                    DataTuple(self.data_label[1], kbio_data.freq),
-                    DataTuple(self.data_label[2], z_re),
-                    DataTuple(self.data_label[3], -z_im),)
+            label = self.data_label[4 * self.channels.index(c) :]
+            ewe = self._join(blocks, "Ewe")
+            if not any("freq" in block.data_field_names for block in blocks):
+                data.append(DataTuple(label[0], ewe))
+                continue
+            # Measuring PEIS
+            abs_z = self._join(blocks, "abs_Ewe") / self._join(blocks, "abs_I")
+            z_phase = self._join(blocks, "Phase_Zwe")
+            z_re = abs_z * np.cos(z_phase)
+            z_im = abs_z * np.sin(z_phase)
+            data.append(
+                (
+                    DataTuple(label[0], ewe),
+                    DataTuple(label[1], self._join(blocks, "freq")),
+                    DataTuple(label[2], z_re),
+                    DataTuple(label[3], -z_im),
                 )
-            else:
-                data.append(DataTuple(self.data_label[0], kbio_data.Ewe))
+            )
         return data
 
+    @staticmethod
+    def _join(blocks: List[KBIOData], field: str) -> np.ndarray:
+        """Join one data field of all blocks, with NaN for blocks without field."""
+        return np.concatenate(
+            [
+                (
+                    getattr(block, field + "_numpy")
+                    if field in block.data_field_names
+                    else np.full(block.number_of_points, np.nan)
+                )
+                for block in blocks
+            ]
+        )
+
+    def _select(self, channel: Optional[int]) -> Sequence[int]:
+        """Get `channel` as a sequence, or all channels if None.
+
+        Raises:
+            ValueError: if `channel` is not an active measurement channel.
+        """
+        if channel is None:
+            return self.channels
+        if channel not in self.channels:
+            raise ValueError(f"Channel {channel} is not a measurement channel.")
+        return (channel,)
+
+    @staticmethod
+    def _mask(channels: Sequence[int]) -> List[int]:
+        """Get channel selection for multi-channel operations."""
+        mask = [0] * 16
+        for c in channels:
+            mask[c] = 1
+        return mask
+
+    def channel_eis_condition(self, channel: int) -> bool:
+        """Get whether to begin eis measurement on channel."""
+        run = self._runs.get(channel)
+        if run is None or not run.measuring_ocv:  # Prevents unnecessary calls
+            return False
+        return run.eis_condition()
+
+    def channel_finished(self, channel: int) -> bool:
+        """Get whether Biologic channel is finished."""
+        run = self._runs.get(channel)
+        return run is not None and run.started and run.finished
+
     @property
     def eis_condition(self) -> bool:
-        """Get whether to begin eis measurement."""
-        if not self._measuring_ocv:  # Prevents unnecessary function calls
-            return False
-        return self._eis_condition()
+        """Get whether to begin eis measurement on any channel."""
+        return any(self.channel_eis_condition(c) for c in self._runs)
 
     @property
     def finished(self) -> bool:
-        """Get whether Biologic channels are finished."""
-        if self._measuring_ocv:  # Never finished if measuring OCV
+        """Get whether all started Biologic channels are finished."""
+        started = [c for c, run in self._runs.items() if run.started]
+        if not started:
             return False
-        return self._finished
+        return all(self.channel_finished(c) for c in started)
+
+    def stop_measurement(self, channel: Optional[int] = None) -> None:
+        """Stop measurement on Biologic channel(s).
+
+        Args:
+            channel: channel to stop, zero-based. If None, all channels are stopped.
 
-    def stop_measurement(self) -> None:
-        """Stop measurement on all Biologic channels."""
+        Raises:
+            ValueError: if `channel` is not an active measurement channel.
+        """
+        channels = self._select(channel)
         with self.lock:
-            if len(self.channels) == 1:
-                self.biologic.stop_channel(self.channels[0])
+            if len(channels) == 1:
+                self.biologic.stop_channel(channels[0])
             else:
                 self.biologic.stop_channels(self._chan_bool)
+        for c in channels:
+            if c in self._runs:
+                self._runs[c].started = self._runs[c].measuring_ocv = False
 
     def shutdown(self) -> None:
         """Disconnect from Biologic."""
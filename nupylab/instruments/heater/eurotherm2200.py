@@ -1,9 +1,10 @@
 """Adapts Eurotherm2200 driver to NUPylab instrument class for use with NUPyLab GUIs."""
 
-from nupylab.drivers import eurotherm2200
-from nupylab.utilities import DataTuple, NupylabError
+from nupylab.utilities import DataTuple, LazyImport, NupylabError
 from nupylab.utilities.nupylab_instrument import NupylabInstrument
 
+eurotherm2200 = LazyImport("nupylab.drivers.eurotherm2200")
+
 
 class Eurotherm2200(NupylabInstrument):
     """Eurotherm 2200 instrument class. Abstracts driver for NUPyLab procedures.
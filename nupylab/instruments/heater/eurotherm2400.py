@@ -1,9 +1,10 @@
 """Adapts Eurotherm2400 driver to NUPylab instrument class for use with NUPyLab GUIs."""
 
-from nupylab.drivers import eurotherm2400
-from nupylab.utilities import DataTuple, NupylabError
+from nupylab.utilities import DataTuple, LazyImport, NupylabError
 from nupylab.utilities.nupylab_instrument import NupylabInstrument
 
+eurotherm2400 = LazyImport("nupylab.drivers.eurotherm2400")
+
 
 class Eurotherm2400(NupylabInstrument):
     """Eurotherm 2400 instrument class. Abstracts driver for NUPyLab procedures.
@@ -1,9 +1,10 @@
 """Adapts Eurotherm3216 driver to NUPylab instrument class for use with NUPyLab GUIs."""
 
-from nupylab.drivers import eurotherm3216
-from nupylab.utilities import DataTuple, NupylabError
+from nupylab.utilities import DataTuple, LazyImport, NupylabError
 from nupylab.utilities.nupylab_instrument import NupylabInstrument
 
+eurotherm3216 = LazyImport("nupylab.drivers.eurotherm3216")
+
 
 class Eurotherm3216(NupylabInstrument):
     """Eurotherm 3216 instrument class. Abstracts driver for NUPyLab procedures.
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from typing import List, Optional, Sequence, TYPE_CHECKING, Union
 
-from nupylab.utilities import DataTuple, NupylabError
+from nupylab.utilities import DataTuple, LazyImport, NupylabError
 from nupylab.utilities.nupylab_instrument import NupylabInstrument
-from nupylab.drivers import aera_mfc
+
+aera_mfc = LazyImport("nupylab.drivers.aera_mfc")
 
 if TYPE_CHECKING:
     from nupylab.drivers.aera_mfc import AeraChannel
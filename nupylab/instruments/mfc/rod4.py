@@ -2,10 +2,11 @@
 
 from typing import List, Sequence
 
-from nupylab.utilities import DataTuple, NupylabError
-from pymeasure.instruments.proterial import rod4
+from nupylab.utilities import DataTuple, LazyImport, NupylabError
 from nupylab.utilities.nupylab_instrument import NupylabInstrument
 
+rod4 = LazyImport("pymeasure.instruments.proterial.rod4")
+
 
 class ROD4(NupylabInstrument):
     """ROD-4(A) instrument class. Abstracts ROD-4 driver for NUPyLab procedures.
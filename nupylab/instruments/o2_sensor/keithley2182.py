@@ -2,10 +2,11 @@
 
 from typing import Sequence, List
 
-from pymeasure.instruments.keithley import keithley2182
-from nupylab.utilities import DataTuple
+from nupylab.utilities import DataTuple, LazyImport
 from nupylab.utilities.nupylab_instrument import NupylabInstrument
 
+keithley2182 = LazyImport("pymeasure.instruments.keithley.keithley2182")
+
 
 class Keithley2182(NupylabInstrument):
     """Keithley 2182 pO2 sensor instrument class. Abstracts driver for NUPyLab procedures.
@@ -1,10 +1,11 @@
 """Adapts Keithley 705 driver to NUPylab instrument class for use with NUPyLab GUIs."""
 
 from typing import Union, Sequence, Dict, Tuple, List, Optional, Callable
-from nupylab.drivers import keithley705
-from nupylab.utilities import DataTuple, NupylabError
+from nupylab.utilities import DataTuple, LazyImport, NupylabError
 from nupylab.utilities.nupylab_instrument import NupylabInstrument
 
+keithley705 = LazyImport("nupylab.drivers.keithley705")
+
 
 class Keithley705(NupylabInstrument):
     """Keithley 705 instrument class. Adapts driver to NUPyLab scanner.
@@ -2,10 +2,11 @@
 
 from typing import Optional
 
-from pymeasure.instruments.hp import hp3478A
-from nupylab.utilities import DataTuple, thermocouples
+from nupylab.utilities import DataTuple, LazyImport, thermocouples
 from nupylab.utilities.nupylab_instrument import NupylabInstrument
 
+hp3478A = LazyImport("pymeasure.instruments.hp.hp3478A")
+
 
 class HP3478A(NupylabInstrument):
     """HP 3478A instrument class. Adapts driver to NUPyLab thermocouple sensor.
@@ -37,7 +38,9 @@ class HP3478A(NupylabInstrument):
         self.cj_temp: float = 23
         self.cj_flag: bool = False
         self.hp3478a: Optional[hp3478A.HP3478A] = None
-        self._tc_type: str = "K"
+        self._converter: thermocouples.ThermocoupleConverter = (
+            thermocouples.get_converter("K")
+        )
         super().__init__(data_label, name)
 
     def connect(self) -> None:
@@ -54,14 +57,11 @@ class HP3478A(NupylabInstrument):
 
         Valid options are `B`, `E`, `J`, `K`, `N`, `R`, `S`, or `T`.
         """
-        return self._tc_type
+        return self._converter.tc_type
 
     @tc_type.setter
     def tc_type(self, tc_type: str) -> None:
-        tc_type = tc_type.upper()
-        if tc_type not in ("B", "E", "J", "K", "N", "R", "S", "T"):
-            raise ValueError(f"Invalid thermocouple type: `{tc_type}`.")
-        self._tc_type = tc_type
+        self._converter = thermocouples.get_converter(tc_type)
 
     def start(self) -> None:
         """Start multimeter measurement. Not implemented."""
@@ -77,8 +77,8 @@ class HP3478A(NupylabInstrument):
             self.cj_temp = 30 - 1000 * voltage
             self.cj_flag = False
             return
-        temp: float = thermocouples.calculate_temperature(
-            voltage * 1000, self.tc_type, self.cj_temp
+        temp: float = self._converter.calculate_temperature(
+            voltage * 1000, self.cj_temp
         )
         return DataTuple(self.data_label, temp)
 
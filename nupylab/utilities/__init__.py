@@ -1,7 +1,21 @@
+from __future__ import annotations
+
+import importlib
 import sys
-from typing import NamedTuple, Sequence, Tuple, Union
+from threading import Lock
+from typing import (
+    Any,
+    Dict,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
-import pyvisa
+if TYPE_CHECKING:
+    import pyvisa
 
 
 class DataTuple(NamedTuple):
@@ -15,6 +29,82 @@ class NupylabError(Exception):
     """General exception class for errors in NUPyLab library."""
 
 
+class LazyImport:
+    """Module, or attribute of a module, that is imported on first use.
+
+    Stands in for a module-level import so that importing a GUI or instrument module
+    does not load drivers that a station configuration never uses. The import happens
+    when the object is first called or one of its attributes is accessed, e.g.::
+
+        Heater = LazyImport("nupylab.instruments.heater.eurotherm2400", "Eurotherm2400")
+        eurotherm2400 = LazyImport("nupylab.drivers.eurotherm2400")
+    """
+
+    def __init__(self, module: str, attribute: Optional[str] = None) -> None:
+        """Record what to import without importing it.
+
+        Args:
+            module: absolute name of module to import.
+            attribute: name of module attribute to import. If None, the proxy stands
+                in for the module itself.
+        """
+        self._module: str = module
+        self._attribute: Optional[str] = attribute
+        self._target: Any = None
+
+    def resolve(self) -> Any:
+        """Import and return the module or attribute."""
+        if self._target is None:
+            target = importlib.import_module(self._module)
+            if self._attribute is not None:
+                target = getattr(target, self._attribute)
+            self._target = target
+        return self._target
+
+    def __call__(self, *args, **kwargs) -> Any:
+        """Import target and call it, e.g. to instantiate a lazily imported class."""
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """Import target and get its attribute."""
+        if name in ("_module", "_attribute", "_target"):
+            raise AttributeError(name)  # not yet initialized, e.g. while copying
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        """Represent proxy by its import path."""
+        path = self._module
+        if self._attribute is not None:
+            path += f":{self._attribute}"
+        state = "imported" if self._target is not None else "not imported"
+        return f"<{self.__class__.__name__} {path} ({state})>"
+
+
+_resource_managers: Dict[Optional[str], pyvisa.ResourceManager] = {}
+_resource_manager_lock = Lock()
+
+
+def resource_manager(backend: Optional[str] = None) -> pyvisa.ResourceManager:
+    """Get PyVISA resource manager shared by all NUPyLab procedures in this process.
+
+    Args:
+        backend: PyVISA backend, e.g. `@ivi` or `@py`. Optional, defaults to PyVISA
+            default.
+
+    Returns:
+        PyVISA resource manager, created on first call for each backend.
+    """
+    import pyvisa  # deferred, importing pyvisa is slow
+
+    with _resource_manager_lock:
+        if backend not in _resource_managers:
+            if backend is not None:
+                _resource_managers[backend] = pyvisa.ResourceManager(backend)
+            else:
+                _resource_managers[backend] = pyvisa.ResourceManager()
+        return _resource_managers[backend]
+
+
 def list_resources(query: str = "?*::INSTR", backend: str = None) -> Tuple[str, ...]:
     """Get PyVISA resource manager list. Provided for compatibility with Sphinx.
 
@@ -27,9 +117,5 @@ def list_resources(query: str = "?*::INSTR", backend: str = None) -> Tuple[str,
         Tuple of PyVISA resources.
     """
     if "sphinx" not in sys.modules:
-        if backend is not None:
-            rm = pyvisa.ResourceManager(backend)
-        else:
-            rm = pyvisa.ResourceManager()
-        return rm.list_resources(query)
+        return resource_manager(backend).list_resources(query)
     return ()
@@ -0,0 +1,256 @@
+"""Headless batch runner for NUPyLab station procedures.
+
+Runs every row of a parameters table as one procedure step, exactly as the station
+GUIs do when the parameters table is queued, but without creating any Qt widgets.
+Each step is written to its own results file and log messages are written to the
+console and to a log file in the results directory.
+
+Run from the command line with, e.g.:
+
+.. code-block:: bash
+
+    nupylab-batch s8 parameters.csv -d C:/data -i furnace_port=ASRL3::INSTR
+
+or equivalently ``python -m nupylab.utilities.batch_runner``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import logging
+import os
+import sys
+from datetime import datetime
+from threading import Event, Thread
+from typing import Dict, List, Optional, Sequence, TYPE_CHECKING, Type
+
+import pandas as pd
+
+from nupylab.utilities import NupylabError
+from nupylab.utilities.nupylab_procedure import (
+    convert_parameter_table,
+    step_filename,
+)
+from pymeasure.experiment import Procedure, Results, Worker
+
+if TYPE_CHECKING:
+    from nupylab.utilities.nupylab_procedure import NupylabProcedure
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+#: Station names and the procedure classes they run, as `module:class` strings.
+STATIONS: Dict[str, str] = {
+    "s4": "nupylab.gui.s4_gui:S4Procedure",
+    "s8": "nupylab.gui.s8_gui:S8Procedure",
+    "safc": "nupylab.gui.safc_gui:SAFCProcedure",
+}
+
+# Match the format of the GUI log widget
+LOG_FORMAT = "%(asctime)s : %(message)s (%(levelname)s)"
+LOG_DATE_FORMAT = "%m/%d/%Y %I:%M:%S %p"
+
+
+def load_procedure_class(station: str) -> Type[NupylabProcedure]:
+    """Import procedure class by station name or `module:class` path.
+
+    Args:
+        station: key of :data:`STATIONS`, e.g. `s8`, or import path of the form
+            `package.module:ProcedureClass`.
+
+    Returns:
+        NUPyLab procedure class.
+
+    Raises:
+        ValueError: if `station` is not a known station or import path.
+    """
+    path = STATIONS.get(station.lower(), station)
+    if ":" not in path:
+        raise ValueError(
+            f"Unknown station `{station}`. Use one of {list(STATIONS)} or a "
+            "`module:ProcedureClass` path."
+        )
+    module_name, class_name = path.split(":", 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def read_parameters(procedure_class: Type[NupylabProcedure], path: str) -> pd.DataFrame:
+    """Read and convert a parameters table saved from the GUI or written by hand.
+
+    Args:
+        procedure_class: NUPyLab procedure class the table parameters belong to.
+        path: path to parameters .csv file.
+
+    Returns:
+        parameters table with columns converted to parameter types.
+    """
+    table_df = pd.read_csv(path, dtype=str)
+    return convert_parameter_table(procedure_class, table_df)
+
+
+def make_procedures(
+    procedure_class: Type[NupylabProcedure],
+    table_df: pd.DataFrame,
+    inputs: Optional[Dict[str, str]] = None,
+) -> List[NupylabProcedure]:
+    """Create one chained procedure per row of the parameters table.
+
+    Args:
+        procedure_class: NUPyLab procedure class to run.
+        table_df: converted parameters table.
+        inputs: values of procedure parameters that are not in the table, such as
+            `record_time` and instrument ports, in place of the GUI input widgets.
+
+    Returns:
+        list of procedures, each linked to the procedure of the previous step.
+    """
+    num_steps: int = table_df.shape[0]
+    procedures: List[NupylabProcedure] = []
+    previous_procedure = None
+    for current_step, table_row in enumerate(table_df.itertuples(index=False), start=1):
+        procedure: NupylabProcedure = procedure_class()
+        if inputs:
+            procedure.set_parameters(inputs)
+        procedure.num_steps = num_steps
+        procedure.current_step = current_step
+        for i, parameter in enumerate(procedure.TABLE_PARAMETERS.values()):
+            setattr(procedure, parameter, table_row[i])
+        procedure.refresh_parameters()
+        procedure.previous_procedure = previous_procedure
+        procedures.append(procedure)
+        previous_procedure = procedure
+    return procedures
+
+
+def run_procedures(
+    procedures: Sequence[NupylabProcedure],
+    directory: str,
+    filename_base: str = "DATA",
+    log_level: int = logging.INFO,
+    stop_event: Optional[Event] = None,
+    name: Optional[str] = None,
+) -> bool:
+    """Run procedure steps sequentially, saving each step to a results file.
+
+    Remaining steps are skipped if a step fails or is aborted, since the procedure
+    shuts down all instruments in that case.
+
+    Args:
+        procedures: chained procedures, as returned by :func:`make_procedures`.
+        directory: directory to save results in.
+        filename_base: results filename prefix.
+        log_level: logging level for worker threads.
+        stop_event: optional event that aborts the running step when set.
+        name: name used for worker threads in log messages. Defaults to the
+            procedure class name.
+
+    Returns:
+        True if all steps finished.
+    """
+    for procedure in procedures:
+        filename = step_filename(directory, filename_base, procedure)
+        results = Results(procedure, filename)
+        worker = Worker(results, log_level=log_level)
+        worker.is_last = lambda p=procedure: p.current_step == p.num_steps
+        worker.name = (
+            f"{name or procedure.__class__.__name__} step {procedure.current_step}"
+        )
+        log.info("Saving step %d to %s.", procedure.current_step, filename)
+        worker.start()
+        try:
+            # StoppableThread.join stops the worker on timeout, so wait on Thread.join
+            while worker.is_alive():
+                Thread.join(worker, 1)
+                if stop_event is not None and stop_event.is_set():
+                    worker.stop()
+        except KeyboardInterrupt:
+            log.warning("User stopped batch run, shutting down.")
+            worker.stop()
+            Thread.join(worker)
+        if procedure.status != Procedure.FINISHED:
+            log.error(
+                "Step %d / %d did not finish, skipping remaining steps.",
+                procedure.current_step,
+                procedure.num_steps,
+            )
+            return False
+    return True
+
+
+def _parse_inputs(items: Sequence[str]) -> Dict[str, str]:
+    inputs: Dict[str, str] = {}
+    for item in items:
+        name, sep, value = item.partition("=")
+        if not sep:
+            raise NupylabError(f"Input `{item}` must have the form NAME=VALUE.")
+        inputs[name.strip()] = value.strip()
+    return inputs
+
+
+def _setup_logging(directory: str, filename_base: str, log_level: int) -> str:
+    os.makedirs(directory, exist_ok=True)
+    log_filename = os.path.join(
+        directory, f"{filename_base}_{datetime.now():%Y-%m-%d_%H%M%S}.log"
+    )
+    formatter = logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
+    root = logging.getLogger()
+    root.setLevel(log_level)
+    for handler in (logging.StreamHandler(), logging.FileHandler(log_filename)):
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+    return log_filename
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run station procedure from the command line.
+
+    Args:
+        argv: command line arguments, defaults to `sys.argv[1:]`.
+
+    Returns:
+        exit code, 0 if all steps finished.
+    """
+    parser = argparse.ArgumentParser(
+        prog="nupylab-batch",
+        description="Run a NUPyLab station procedure from a parameters table "
+        "without the GUI.",
+    )
+    parser.add_argument(
+        "station",
+        help=f"station name ({', '.join(STATIONS)}) or module:ProcedureClass path",
+    )
+    parser.add_argument("parameters", help="parameters table .csv file")
+    parser.add_argument(
+        "-d", "--directory", default=".", help="directory to save results in"
+    )
+    parser.add_argument(
+        "-f", "--filename", default="DATA", help="results filename prefix"
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="procedure input, e.g. record_time=2 or furnace_port=ASRL3::INSTR",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="log debug messages"
+    )
+    args = parser.parse_args(argv)
+
+    log_level = logging.DEBUG if args.verbose else logging.INFO
+    log_filename = _setup_logging(args.directory, args.filename, log_level)
+    log.info("Logging to %s.", log_filename)
+
+    procedure_class = load_procedure_class(args.station)
+    table_df = read_parameters(procedure_class, args.parameters)
+    procedures = make_procedures(procedure_class, table_df, _parse_inputs(args.input))
+    log.info("Running %d steps of %s.", len(procedures), procedure_class.__name__)
+    finished = run_procedures(procedures, args.directory, args.filename, log_level)
+    return 0 if finished else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
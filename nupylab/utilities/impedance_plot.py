@@ -0,0 +1,361 @@
+"""Impedance plot widget for NUPyLab GUIs.
+
+Plotting `-Z_im` against `Z_re` with a generic results curve draws one line through
+every row of the results file, most of which are empty between spectra. Instead,
+:class:`ImpedanceWidget` stores each impedance spectrum as its own arrays, keyed by
+data file, procedure step and sweep number, and shows them as Nyquist or Bode plots.
+Only the spectrum currently being acquired is redrawn as new data arrives; completed
+spectra are drawn once from cached arrays.
+"""
+
+from __future__ import annotations
+
+import logging
+from math import nan
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pyqtgraph as pg
+
+from pymeasure.display.Qt import QtCore, QtGui, QtWidgets
+from pymeasure.display.widgets import TabWidget
+from pymeasure.display.widgets.plot_frame import PlotFrame
+from pymeasure.experiment import Procedure, Results
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+#: Default frequency, real impedance, and negative imaginary impedance data columns.
+IMPEDANCE_COLUMNS: Tuple[str, str, str] = (
+    "Frequency (Hz)",
+    "Z_re (ohm)",
+    "-Z_im (ohm)",
+)
+
+
+def _nyquist(f: np.ndarray, z_re: np.ndarray, neg_z_im: np.ndarray) -> tuple:
+    return z_re, neg_z_im
+
+
+def _bode_magnitude(f: np.ndarray, z_re: np.ndarray, neg_z_im: np.ndarray) -> tuple:
+    return f, np.hypot(z_re, neg_z_im)
+
+
+def _bode_phase(f: np.ndarray, z_re: np.ndarray, neg_z_im: np.ndarray) -> tuple:
+    return f, np.degrees(np.arctan2(neg_z_im, z_re))
+
+
+# Plot type: (transform, x label, x units, y label, y units, log x, log y)
+PLOT_TYPES: Dict[str, tuple] = {
+    "Nyquist": (_nyquist, "Z_re", "ohm", "-Z_im", "ohm", False, False),
+    "Bode |Z|": (_bode_magnitude, "Frequency", "Hz", "|Z|", "ohm", True, True),
+    "Bode Phase": (_bode_phase, "Frequency", "Hz", "-Phase", "deg", True, False),
+}
+
+
+class Spectrum:
+    """Impedance spectrum of a single sweep.
+
+    Attributes:
+        frequency: measured frequencies in Hz.
+        z_re: real impedance in ohm.
+        neg_z_im: negative imaginary impedance in ohm.
+    """
+
+    def __init__(self) -> None:
+        """Create empty spectrum."""
+        self.frequency: np.ndarray = np.empty(0)
+        self.z_re: np.ndarray = np.empty(0)
+        self.neg_z_im: np.ndarray = np.empty(0)
+        self._cache: Dict[str, tuple] = {}
+
+    def __len__(self) -> int:
+        """Get number of points in spectrum."""
+        return self.frequency.size
+
+    def extend(
+        self, frequency: np.ndarray, z_re: np.ndarray, neg_z_im: np.ndarray
+    ) -> None:
+        """Append points to spectrum.
+
+        Args:
+            frequency: frequencies in Hz.
+            z_re: real impedance in ohm.
+            neg_z_im: negative imaginary impedance in ohm.
+        """
+        self.frequency = np.concatenate((self.frequency, frequency))
+        self.z_re = np.concatenate((self.z_re, z_re))
+        self.neg_z_im = np.concatenate((self.neg_z_im, neg_z_im))
+        self._cache.clear()
+
+    def xy(self, plot_type: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Get plot coordinates of spectrum, cached until the spectrum changes.
+
+        Args:
+            plot_type: key of :data:`PLOT_TYPES`.
+
+        Returns:
+            x and y arrays.
+        """
+        if plot_type not in self._cache:
+            transform: Callable[..., tuple] = PLOT_TYPES[plot_type][0]
+            self._cache[plot_type] = transform(self.frequency, self.z_re, self.neg_z_im)
+        return self._cache[plot_type]
+
+
+class ImpedanceCurve:
+    """Impedance spectra of one experiment, plotted as one plot item per sweep.
+
+    Sweeps are expected to run from high to low frequency, as configured by NUPyLab
+    impedance instruments, so a rise in frequency marks the start of a new sweep.
+
+    Attributes:
+        results: results of experiment.
+        wdg: impedance widget the curve belongs to.
+        columns: frequency, real impedance, and negative imaginary impedance columns.
+        pen: pen used for all sweeps.
+        color: pen color.
+        spectra: spectra in order of acquisition.
+        items: plot items, one per spectrum.
+    """
+
+    def __init__(
+        self,
+        results: Results,
+        wdg: ImpedanceWidget,
+        columns: Tuple[str, str, str],
+        pen: QtGui.QPen,
+    ) -> None:
+        """Create curve without reading results."""
+        self.results: Results = results
+        self.wdg: ImpedanceWidget = wdg
+        self.columns: Tuple[str, str, str] = columns
+        self.pen = pen
+        self.color = pen.color()
+        self.spectra: List[Spectrum] = []
+        self.items: List[pg.PlotDataItem] = []
+        self._plot: Optional[pg.PlotItem] = None
+        self._rows: int = 0
+        self._last_frequency: float = nan
+
+    @property
+    def step(self) -> int:
+        """Get procedure step of experiment."""
+        return getattr(self.results.procedure, "current_step", None) or 1
+
+    def attach(self, plot: Optional[pg.PlotItem]) -> None:
+        """Add plot items to `plot`, or remove them from the current plot if None."""
+        for item in self.items:
+            if self._plot is not None:
+                self._plot.removeItem(item)
+            if plot is not None:
+                plot.addItem(item)
+        self._plot = plot
+
+    def update_data(self) -> None:
+        """Read new rows of results and redraw only spectra that changed."""
+        data = self.results.data
+        if len(data) <= self._rows:
+            return
+        try:
+            arrays = [
+                data[column].iloc[self._rows :].to_numpy(dtype=float)
+                for column in self.columns
+            ]
+        except KeyError:
+            return
+        self._rows = len(data)
+        frequency, z_re, neg_z_im = arrays
+        valid = np.isfinite(frequency) & np.isfinite(z_re) & np.isfinite(neg_z_im)
+        if not valid.any():
+            return
+        frequency, z_re, neg_z_im = frequency[valid], z_re[valid], neg_z_im[valid]
+
+        previous = np.concatenate(([self._last_frequency], frequency[:-1]))
+        starts = np.flatnonzero(~(frequency <= previous))  # True if previous is NaN
+        self._last_frequency = frequency[-1]
+        changed = set()
+        pieces = zip(*(np.split(a, starts) for a in (frequency, z_re, neg_z_im)))
+        for i, piece in enumerate(pieces):
+            if i > 0:
+                self._new_spectrum()
+            if piece[0].size:
+                self.spectra[-1].extend(*piece)
+                changed.add(len(self.spectra) - 1)
+        for index in changed:
+            self.items[index].setData(*self.spectra[index].xy(self.wdg.plot_type))
+
+    def redraw(self) -> None:
+        """Redraw all spectra, e.g. after the plot type changes."""
+        for spectrum, item in zip(self.spectra, self.items):
+            item.setData(*spectrum.xy(self.wdg.plot_type))
+
+    def set_color(self, color) -> None:
+        """Set color of all sweeps."""
+        self.pen.setColor(color)
+        self.color = self.pen.color()
+        for item in self.items:
+            item.setPen(self.pen)
+            item.setSymbolPen(self.pen)
+
+    def _new_spectrum(self) -> None:
+        item = pg.PlotDataItem(
+            pen=self.pen,
+            symbol="o",
+            symbolSize=4,
+            symbolPen=self.pen,
+            symbolBrush=None,
+            antialias=False,
+        )
+        self.spectra.append(Spectrum())
+        self.items.append(item)
+        if self._plot is not None:
+            self._plot.addItem(item)
+
+
+class ImpedanceWidget(TabWidget, QtWidgets.QWidget):
+    """Widget for displaying impedance spectra as Nyquist or Bode plots.
+
+    Attributes:
+        columns: frequency, real impedance, and negative imaginary impedance columns.
+        curves: loaded curves, one per experiment.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        columns: Tuple[str, str, str] = IMPEDANCE_COLUMNS,
+        refresh_time: float = 0.2,
+        check_status: bool = True,
+        linewidth: int = 1,
+        parent=None,
+    ) -> None:
+        """Create impedance widget.
+
+        Args:
+            name: name of widget tab.
+            columns: frequency, real impedance, and negative imaginary impedance data
+                columns.
+            refresh_time: time in seconds between plot updates.
+            check_status: if True, only update curves of running experiments.
+            linewidth: line width of curves.
+            parent: parent widget.
+        """
+        super().__init__(name, parent)
+        self.columns: Tuple[str, str, str] = tuple(columns)
+        self.refresh_time: float = refresh_time
+        self.check_status: bool = check_status
+        self.linewidth: int = linewidth
+        self.curves: List[ImpedanceCurve] = []
+        self._setup_ui()
+        self._layout()
+        self.change_plot_type(0)
+
+    def _setup_ui(self) -> None:
+        self.plot_type_label = QtWidgets.QLabel("Plot:", self)
+        self.plot_type_label.setMaximumSize(QtCore.QSize(45, 16777215))
+        self.plot_types = QtWidgets.QComboBox(self)
+        self.plot_types.addItems(list(PLOT_TYPES))
+        self.plot_types.activated.connect(self.change_plot_type)
+
+        self.plot_widget = pg.PlotWidget(self, background="#ffffff")
+        self.plot = self.plot_widget.getPlotItem()
+        self.plot.showGrid(x=True, y=True, alpha=0.2)
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.update_curves)
+        self.timer.start(int(self.refresh_time * 1e3))
+
+    def _layout(self) -> None:
+        vbox = QtWidgets.QVBoxLayout(self)
+        vbox.setSpacing(0)
+        hbox = QtWidgets.QHBoxLayout()
+        hbox.setSpacing(10)
+        hbox.setContentsMargins(-1, 6, -1, 6)
+        hbox.addWidget(self.plot_type_label)
+        hbox.addWidget(self.plot_types)
+        vbox.addLayout(hbox)
+        vbox.addWidget(self.plot_widget)
+        self.setLayout(vbox)
+
+    def sizeHint(self) -> QtCore.QSize:
+        return QtCore.QSize(300, 600)
+
+    @property
+    def plot_type(self) -> str:
+        """Get selected plot type."""
+        return self.plot_types.currentText()
+
+    @property
+    def spectra(self) -> Dict[Tuple[str, int, int], Spectrum]:
+        """Get spectra of loaded experiments, keyed by data file, step and sweep."""
+        return {
+            (curve.results.data_filename, curve.step, sweep): spectrum
+            for curve in self.curves
+            for sweep, spectrum in enumerate(curve.spectra, start=1)
+        }
+
+    def spectrum(self, data_filename: str, step: int, sweep: int = 1) -> Spectrum:
+        """Get spectrum of a loaded experiment.
+
+        Args:
+            data_filename: data file of experiment results.
+            step: procedure step.
+            sweep: sweep number within step, starting from 1.
+
+        Returns:
+            impedance spectrum.
+
+        Raises:
+            KeyError: if no spectrum exists for `data_filename`, `step` and `sweep`.
+        """
+        return self.spectra[(data_filename, step, sweep)]
+
+    def change_plot_type(self, index: int) -> None:
+        """Switch plot type and redraw all spectra from cache."""
+        self.plot_types.setCurrentIndex(index)
+        _, x_label, x_units, y_label, y_units, log_x, log_y = PLOT_TYPES[self.plot_type]
+        self.plot.setLogMode(x=log_x, y=log_y)
+        self.plot.setAspectLocked(self.plot_type == "Nyquist")
+        self.plot.setLabel("bottom", x_label, units=x_units, **PlotFrame.LABEL_STYLE)
+        self.plot.setLabel("left", y_label, units=y_units, **PlotFrame.LABEL_STYLE)
+        for curve in self.curves:
+            curve.redraw()
+        self.plot.enableAutoRange()
+
+    def update_curves(self) -> None:
+        """Read new data into curves of running experiments."""
+        for curve in self.curves:
+            if (
+                not self.check_status
+                or curve.results.procedure.status == Procedure.RUNNING
+            ):
+                curve.update_data()
+
+    def new_curve(self, results: Results, color=pg.intColor(0), **kwargs):
+        """Create impedance curve for experiment results."""
+        pen = kwargs.get("pen", pg.mkPen(color=color, width=self.linewidth))
+        return ImpedanceCurve(results, self, self.columns, pen)
+
+    def load(self, curve: ImpedanceCurve) -> None:
+        """Add curve to widget."""
+        if curve not in self.curves:
+            self.curves.append(curve)
+        curve.attach(self.plot)
+        curve.update_data()
+        curve.redraw()
+
+    def remove(self, curve: ImpedanceCurve) -> None:
+        """Remove curve from widget."""
+        curve.attach(None)
+        if curve in self.curves:
+            self.curves.remove(curve)
+
+    def set_color(self, curve: ImpedanceCurve, color) -> None:
+        """Change color of curve."""
+        curve.set_color(color)
+
+    def clear_widget(self) -> None:
+        """Remove all curves."""
+        for curve in self.curves[:]:
+            self.remove(curve)
@@ -2,19 +2,38 @@
 
 from __future__ import annotations
 
+import inspect
 import logging
+import os
 from datetime import datetime
 from math import nan
 from queue import Empty, SimpleQueue
 from threading import Thread
 from time import monotonic, sleep
-from typing import Callable, Dict, List, Optional, Sequence, TYPE_CHECKING, Union
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Type,
+    Union,
+)
 
 from nupylab.utilities import DataTuple, NupylabError
-from pymeasure.experiment import FloatParameter, IntegerParameter, Procedure
+from pymeasure.experiment import (
+    BooleanParameter,
+    FloatParameter,
+    IntegerParameter,
+    Procedure,
+    unique_filename,
+)
 
 if TYPE_CHECKING:
+    import pandas as pd
     from nupylab.utilities.nupylab_instrument import NupylabInstrument
+    from nupylab.utilities.scheduler import AcquisitionScheduler
 
 
 log = logging.getLogger(__name__)
@@ -26,7 +45,10 @@ class NupylabProcedure(Procedure):
 
     Subclass procedures must define `DATA_COLUMNS` and `TABLE_PARAMETERS` attributes, as
     well as a `set_instruments` method. Attributes `X_AXIS`, `Y_AXIS`, and `INPUTS` are
-    expected but not strictly required.
+    expected but not strictly required. Procedures measuring impedance may set
+    `IMPEDANCE_COLUMNS` to the frequency, real impedance, and negative imaginary
+    impedance columns shown in the impedance plot, if they differ from
+    :data:`~nupylab.utilities.impedance_plot.IMPEDANCE_COLUMNS`.
 
     Running this procedure or its subclasses calls startup, execute, and shutdown
     methods sequentially.
@@ -34,6 +56,8 @@ class NupylabProcedure(Procedure):
     Attrs:
         previous_procedure: Nupylab Procedure class from previous step. Maintains
             previous instrument connections.
+        scheduler: optional shared acquisition scheduler. If None, each active
+            instrument is read in its own thread.
     """
 
     # Parameters common to all NUPyLab procedures
@@ -55,6 +79,7 @@ class NupylabProcedure(Procedure):
         self.previous_procedure: Optional[NupylabProcedure] = None
         self.instruments: Sequence[NupylabInstrument] = ()
         self.active_instruments: Sequence[NupylabInstrument] = ()
+        self.scheduler: Optional[AcquisitionScheduler] = None
 
         super().__init__()
 
@@ -123,7 +148,14 @@ class NupylabProcedure(Procedure):
         for instrument in self.active_instruments:
             queue = SimpleQueue()
             queues.append(queue)
-            thread = Thread(target=self._sub_loop, args=(instrument.get_data, queue))
+            if self.scheduler is None:
+                thread = Thread(
+                    target=self._sub_loop, args=(instrument.get_data, queue)
+                )
+            else:
+                thread = self.scheduler.job(
+                    instrument.get_data, queue, self.record_time, self._acquiring
+                )
             threads.append(thread)
 
         self._start_time = monotonic()
@@ -178,6 +210,10 @@ class NupylabProcedure(Procedure):
                 return False
         return True
 
+    def _acquiring(self) -> bool:
+        """Get whether instruments should continue to be read."""
+        return not self.should_stop() and not self.finished
+
     def _sub_loop(
         self, process: Callable[..., None], queue: SimpleQueue, *args
     ) -> None:
@@ -191,7 +227,7 @@ class NupylabProcedure(Procedure):
             *args: additional args to pass to `process`
         """
         counter: int = 0
-        while not self.should_stop() and not self.finished:
+        while self._acquiring():
             if counter != self._counter:
                 queue.put(process(*args))
                 counter = self._counter
@@ -259,3 +295,102 @@ class NupylabProcedure(Procedure):
             self._data.update(self._data_defaults)  # reset data to defaults
         self.emit("progress", self.progress)
         return filled_queues
+
+
+# Python types that table parameters are cast to, by parameter class
+PARAMETER_TYPES: dict = {
+    BooleanParameter: bool,
+    FloatParameter: float,
+    IntegerParameter: int,
+}
+
+
+def convert_parameter_table(
+    procedure_class: Type[NupylabProcedure],
+    table_df: pd.DataFrame,
+    parameter_types: Optional[dict] = None,
+) -> pd.DataFrame:
+    """Verify shape of parameters table and attempt to convert datatype.
+
+    Args:
+        procedure_class: NUPyLab procedure class the table parameters belong to.
+        table_df: Pandas dataframe representing parameters table in string format
+        parameter_types: mapping of parameter class to Python type. Defaults to
+            :data:`PARAMETER_TYPES`.
+
+    Returns:
+        converted_df: parameters table with each column converted to the dtype
+            specified in `parameter_types`
+
+    Raises:
+        IndexError: if the number of columns in the parameter table does not match
+            the number of expected columns.
+        ValueError: if the parameters table cannot be converted to the types listed
+            in `parameter_types`
+    """
+    if parameter_types is None:
+        parameter_types = PARAMETER_TYPES
+    if len(procedure_class.TABLE_PARAMETERS) != table_df.shape[1]:
+        raise IndexError(
+            f"Expected {len(procedure_class.TABLE_PARAMETERS)} parameters, but "
+            f"parameters table has {table_df.shape[1]} columns."
+        )
+
+    converted_df: pd.DataFrame = table_df.copy()
+    bool_map: Dict[str, bool] = {
+        "true": True,
+        "yes": True,
+        "1": True,
+        "false": False,
+        "no": False,
+        "0": False,
+    }
+    cast_dict: dict = {}
+    for param_name, column in zip(
+        procedure_class.TABLE_PARAMETERS.values(), converted_df.columns
+    ):
+        for name, value in inspect.getmembers(procedure_class):
+            if name == param_name:
+                # non-empty strings evaluate to True
+                # apply map instead for boolean columns
+                param_cast = parameter_types[type(value)]
+                if param_cast is bool:
+                    converted_df[column] = (
+                        converted_df[column].str.casefold().map(bool_map)
+                    )
+                cast_dict.update({column: param_cast})
+    converted_df = converted_df.astype(cast_dict)
+    return converted_df
+
+
+def step_filename(
+    directory: str, filename_base: str, procedure: NupylabProcedure
+) -> str:
+    """Get unique results filename for a procedure step.
+
+    Filenames have the form `<filename_base>_<date>_<step>.csv`, with an additional
+    index appended if the file already exists.
+
+    Args:
+        directory: directory to save results in.
+        filename_base: filename prefix, may contain procedure placeholders.
+        procedure: procedure with `current_step` set.
+
+    Returns:
+        absolute path of results file.
+    """
+    filename: str = unique_filename(
+        directory,
+        prefix=filename_base + "_",
+        suffix="_{Current Step}",
+        ext="csv",
+        dated_folder=False,
+        index=False,
+        procedure=procedure,
+    )
+    index: int = 2
+    basename: str = filename.split(".csv")[0]
+    while os.path.exists(filename):
+        filename = f"{basename}_{index}.csv"
+        index += 1
+    return filename
@@ -4,18 +4,20 @@ from __future__ import annotations
 
 import inspect
 import logging
-import os
-from typing import Dict, TYPE_CHECKING, Type
-
+from threading import Thread
+from typing import List, Optional, TYPE_CHECKING, Tuple, Type
+
+from nupylab.utilities import resources
+from nupylab.utilities.impedance_plot import IMPEDANCE_COLUMNS, ImpedanceWidget
+from nupylab.utilities.nupylab_procedure import (
+    PARAMETER_TYPES,
+    convert_parameter_table,
+    step_filename,
+)
 from nupylab.utilities.parameter_table import ParameterTableWidget
+from pymeasure.display.Qt import QtCore, QtGui
 from pymeasure.display.windows.managed_dock_window import ManagedDockWindow
-from pymeasure.experiment import (
-    BooleanParameter,
-    FloatParameter,
-    IntegerParameter,
-    Results,
-    unique_filename,
-)
+from pymeasure.experiment import Results
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -32,11 +34,10 @@ class NupylabWindow(ManagedDockWindow):
     **MUST MATCH** the order of the corresponding table column labels.
     """
 
-    parameter_types: dict = {
-        BooleanParameter: bool,
-        FloatParameter: float,
-        IntegerParameter: int,
-    }
+    parameter_types: dict = PARAMETER_TYPES
+
+    # Emitted from the resource scanning thread, delivered in the GUI thread
+    resources_found = QtCore.Signal(object)
 
     def __init__(
         self,
@@ -58,16 +59,92 @@ class NupylabWindow(ManagedDockWindow):
         if hasattr(procedure_class, "INPUTS"):
             kwargs.setdefault("inputs", procedure_class.INPUTS)
         table_column_labels = list(procedure_class.TABLE_PARAMETERS)
+        widget_list: tuple = (
+            ParameterTableWidget("Experiment Parameters", table_column_labels),
+        )
+        impedance_columns = getattr(
+            procedure_class, "IMPEDANCE_COLUMNS", IMPEDANCE_COLUMNS
+        )
+        if all(column in procedure_class.DATA_COLUMNS for column in impedance_columns):
+            widget_list += (
+                ImpedanceWidget(
+                    "Impedance",
+                    impedance_columns,
+                    linewidth=kwargs["linewidth"],
+                ),
+            )
         super().__init__(
             procedure_class,
             inputs_in_scrollarea=True,
-            widget_list=(
-                ParameterTableWidget("Experiment Parameters", table_column_labels),
-            ),
+            widget_list=widget_list,
             **kwargs,
         )
         self.setWindowTitle(f"{procedure_class.__name__}")
 
+        self._scanning: bool = False
+        self.resources_found.connect(self._update_resources)
+        refresh_action = QtGui.QAction("Refresh instrument ports", self)
+        refresh_action.triggered.connect(lambda: self.refresh_resources())
+        self.menuBar().addMenu("&Instruments").addAction(refresh_action)
+        if any(
+            resources.cache_expired(query, backend)
+            for query, backend in self._resource_queries()
+        ):
+            self.refresh_resources()
+
+    def _resource_parameters(self) -> List[Tuple[str, resources.ResourceParameter]]:
+        """Get names and class attributes of all VISA resource parameters."""
+        return [
+            (name, parameter)
+            for name, parameter in inspect.getmembers(self.procedure_class)
+            if isinstance(parameter, resources.ResourceParameter)
+        ]
+
+    def _resource_queries(self) -> List[Tuple[str, Optional[str]]]:
+        """Get unique VISA query and backend pairs used by resource parameters."""
+        queries = []
+        for _, parameter in self._resource_parameters():
+            if (parameter.query, parameter.backend) not in queries:
+                queries.append((parameter.query, parameter.backend))
+        return queries
+
+    def refresh_resources(self) -> None:
+        """Rescan VISA resources in a background thread.
+
+        Port choices are updated once the scan completes, without blocking the GUI.
+        """
+        if self._scanning:
+            return
+        self._scanning = True
+        queries = self._resource_queries()
+        log.info("Scanning for instrument ports.")
+
+        def scan() -> None:
+            found = {}
+            try:
+                for query, backend in queries:
+                    found[(query, backend)] = resources.refresh_resources(
+                        query, backend
+                    )
+            except Exception as e:
+                log.warning("Error scanning for instrument ports: %s", e)
+            self.resources_found.emit(found)
+
+        Thread(target=scan, daemon=True).start()
+
+    def _update_resources(self, found: dict) -> None:
+        """Update port choices of procedure class and input widgets."""
+        self._scanning = False
+        for name, parameter in self._resource_parameters():
+            key = (parameter.query, parameter.backend)
+            if key not in found:
+                continue
+            parameter.set_choices(found[key])
+            element = getattr(self.inputs, name, None)
+            if element is not None:
+                element.parameter.set_choices(found[key])
+                element.set_parameter(element.parameter)
+
     def new_curve(self, wdg, results, color=None, **kwargs):
         kwargs.setdefault("connect", "finite")
         return super().new_curve(wdg, results, color=None, **kwargs)
@@ -88,37 +165,9 @@ class NupylabWindow(ManagedDockWindow):
             ValueError: if the parameters table cannot be converted to the types listed
                 in :attr:`parameter_types`
         """
-        if len(self.procedure_class.TABLE_PARAMETERS) != table_df.shape[1]:
-            raise IndexError(
-                f"Expected {len(self.parameter_types)} parameters, but "
-                f"parameters table has {table_df.shape[1]} columns."
-            )
-
-        converted_df: pd.DataFrame = table_df.copy()
-        bool_map: Dict[str, bool] = {
-            "true": True,
-            "yes": True,
-            "1": True,
-            "false": False,
-            "no": False,
-            "0": False,
-        }
-        cast_dict: dict = {}
-        for param_name, column in zip(
-            self.procedure_class.TABLE_PARAMETERS.values(), converted_df.columns
-        ):
-            for name, value in inspect.getmembers(self.procedure_class):
-                if name == param_name:
-                    # non-empty strings evaluate to True
-                    # apply map instead for boolean columns
-                    param_cast = self.parameter_types[type(value)]
-                    if param_cast is bool:
-                        converted_df[column] = (
-                            converted_df[column].str.casefold().map(bool_map)
-                        )
-                    cast_dict.update({column: param_cast})
-        converted_df = converted_df.astype(cast_dict)
-        return converted_df
+        return convert_parameter_table(
+            self.procedure_class, table_df, self.parameter_types
+        )
 
     def queue(self, procedure=None) -> None:
         """Queue all rows in parameters table. Overwrites parent method."""
@@ -140,20 +189,9 @@ class NupylabWindow(ManagedDockWindow):
             procedure.refresh_parameters()
             procedure.previous_procedure = previous_procedure
             current_step += 1
-            filename: str = unique_filename(
-                self.directory,
-                prefix=self.file_input.filename_base + "_",
-                suffix="_{Current Step}",
-                ext="csv",
-                dated_folder=False,
-                index=False,
-                procedure=procedure,
+            filename: str = step_filename(
+                self.directory, self.file_input.filename_base, procedure
             )
-            index: int = 2
-            basename: str = filename.split(".csv")[0]
-            while os.path.exists(filename):
-                filename = f"{basename}_{index}.csv"
-                index += 1
 
             results = Results(procedure, filename)
             experiment = self.new_experiment(results)
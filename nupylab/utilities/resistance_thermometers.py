@@ -0,0 +1,197 @@
+"""Resistance thermometer equations.
+
+Platinum RTDs such as Pt100 follow the Callendar-Van Dusen equation, with IEC 60751
+coefficients by default. Thermistors follow the Steinhart-Hart equation, with
+coefficients from the datasheet or fitted to three calibration points by
+:meth:`Thermistor.from_calibration`.
+
+Like the array conversions of :mod:`~nupylab.utilities.thermocouples`, all conversions
+accept NumPy arrays, e.g. a block of resistance readings, and return arrays of the same
+shape. Scalars are accepted and returned as 0-d arrays. NaN values are returned as NaN.
+All temperatures are in Celsius and resistances in ohms.
+"""
+
+from typing import Sequence, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+#: IEC 60751 Callendar-Van Dusen coefficients of platinum RTDs.
+IEC_60751_A: float = 3.9083e-3
+IEC_60751_B: float = -5.775e-7
+IEC_60751_C: float = -4.183e-12
+
+ZERO_CELSIUS: float = 273.15
+
+
+class RTD:
+    """Platinum resistance thermometer following the Callendar-Van Dusen equation.
+
+    R(T) = R0 (1 + A T + B T^2 + C (T - 100) T^3), where C is zero above 0 C.
+
+    Attributes:
+        r0: resistance at 0 C in ohms, e.g. 100 for Pt100.
+        a: A coefficient in 1/C.
+        b: B coefficient in 1/C^2.
+        c: C coefficient in 1/C^4.
+        temperature_range: lower and upper limits of temperature in Celsius.
+        resistance_range: lower and upper limits of resistance in ohms.
+    """
+
+    def __init__(
+        self,
+        r0: float = 100,
+        a: float = IEC_60751_A,
+        b: float = IEC_60751_B,
+        c: float = IEC_60751_C,
+        temperature_range: Tuple[float, float] = (-200, 850),
+    ) -> None:
+        """Initialize RTD.
+
+        Args:
+            r0: resistance at 0 C in ohms.
+            a: A coefficient in 1/C.
+            b: B coefficient in 1/C^2.
+            c: C coefficient in 1/C^4.
+            temperature_range: lower and upper limits of temperature in Celsius.
+        """
+        self.r0: float = r0
+        self.a: float = a
+        self.b: float = b
+        self.c: float = c
+        self.temperature_range: Tuple[float, float] = temperature_range
+        self.resistance_range: Tuple[float, float] = tuple(
+            self.to_resistance(temperature_range).tolist()
+        )
+
+    def __repr__(self) -> str:
+        return f"RTD(r0={self.r0}, a={self.a}, b={self.b}, c={self.c})"
+
+    def to_resistance(self, temperature: ArrayLike) -> np.ndarray:
+        """Convert temperatures in Celsius to resistances in ohms.
+
+        Raises:
+            ValueError if any temperature is outside applicable RTD range.
+        """
+        t = np.asarray(temperature, dtype=float)
+        low, high = self.temperature_range
+        if np.any(t < low) or np.any(t > high):
+            raise ValueError("temperature out of valid range for RTD")
+        ratio = 1 + t * (self.a + t * self.b)
+        ratio = ratio + np.where(t < 0, self.c * (t - 100) * t**3, 0.0)
+        return np.asarray(self.r0 * ratio)
+
+    def to_temperature(self, resistance: ArrayLike) -> np.ndarray:
+        """Convert resistances in ohms to temperatures in Celsius.
+
+        Above 0 C the quadratic equation is solved exactly. Below 0 C its solution is
+        refined with Newton's method.
+
+        Raises:
+            ValueError if any resistance is outside applicable RTD range.
+        """
+        r = np.asarray(resistance, dtype=float)
+        low, high = self.resistance_range
+        if np.any(r < low) or np.any(r > high):
+            raise ValueError("resistance out of valid range for RTD")
+        ratio = r / self.r0
+        with np.errstate(invalid="ignore"):
+            t = (-self.a + np.sqrt(self.a**2 - 4 * self.b * (1 - ratio))) / (2 * self.b)
+        below = ratio < 1
+        if np.any(below):
+            tb = t
+            for _ in range(10):
+                error = 1 + tb * (self.a + tb * self.b) + self.c * (tb - 100) * tb**3
+                slope = self.a + 2 * self.b * tb + self.c * (4 * tb - 300) * tb**2
+                step = np.where(below, (error - ratio) / slope, 0.0)
+                tb = tb - step
+                if not np.any(np.abs(step) > 1e-10):
+                    break
+            t = np.where(below, tb, t)
+        return np.asarray(t)
+
+
+class Thermistor:
+    """Thermistor following the Steinhart-Hart equation.
+
+    1 / T = A + B ln(R) + C ln(R)^3, with T in Kelvin and R in ohms.
+
+    Attributes:
+        a: A coefficient in 1/K.
+        b: B coefficient in 1/K.
+        c: C coefficient in 1/K.
+    """
+
+    def __init__(self, a: float, b: float, c: float) -> None:
+        """Initialize thermistor.
+
+        Args:
+            a: A coefficient in 1/K.
+            b: B coefficient in 1/K.
+            c: C coefficient in 1/K.
+        """
+        self.a: float = a
+        self.b: float = b
+        self.c: float = c
+
+    def __repr__(self) -> str:
+        return f"Thermistor(a={self.a}, b={self.b}, c={self.c})"
+
+    @classmethod
+    def from_calibration(
+        cls, temperatures: Sequence[float], resistances: Sequence[float]
+    ) -> "Thermistor":
+        """Fit Steinhart-Hart coefficients to three calibration points.
+
+        Args:
+            temperatures: three calibration temperatures in Celsius.
+            resistances: resistances in ohms at calibration temperatures.
+
+        Returns:
+            thermistor with fitted coefficients.
+
+        Raises:
+            ValueError if not given exactly three calibration points.
+        """
+        if len(temperatures) != 3 or len(resistances) != 3:
+            raise ValueError("Steinhart-Hart fit requires three calibration points.")
+        log_r = np.log(np.asarray(resistances, dtype=float))
+        matrix = np.column_stack((np.ones(3), log_r, log_r**3))
+        inverse_t = 1 / (np.asarray(temperatures, dtype=float) + ZERO_CELSIUS)
+        a, b, c = np.linalg.solve(matrix, inverse_t)
+        return cls(float(a), float(b), float(c))
+
+    def to_temperature(self, resistance: ArrayLike) -> np.ndarray:
+        """Convert resistances in ohms to temperatures in Celsius.
+
+        Raises:
+            ValueError if any resistance is not positive.
+        """
+        r = np.asarray(resistance, dtype=float)
+        if np.any(r <= 0):
+            raise ValueError("resistance out of valid range for thermistor")
+        log_r = np.log(r)
+        return np.asarray(
+            1 / (self.a + log_r * (self.b + self.c * log_r**2)) - ZERO_CELSIUS
+        )
+
+    def to_resistance(self, temperature: ArrayLike) -> np.ndarray:
+        """Convert temperatures in Celsius to resistances in ohms.
+
+        Uses the closed-form inverse of the Steinhart-Hart equation.
+
+        Raises:
+            ValueError if any temperature is not above absolute zero.
+        """
+        t = np.asarray(temperature, dtype=float)
+        if np.any(t <= -ZERO_CELSIUS):
+            raise ValueError("temperature out of valid range for thermistor")
+        x = (self.a - 1 / (t + ZERO_CELSIUS)) / self.c
+        y = np.sqrt((self.b / (3 * self.c)) ** 3 + x**2 / 4)
+        return np.asarray(np.exp(np.cbrt(y - x / 2) - np.cbrt(y + x / 2)))
+
+
+#: IEC 60751 Pt100 RTD.
+PT100: RTD = RTD(100)
+#: IEC 60751 Pt1000 RTD.
+PT1000: RTD = RTD(1000)
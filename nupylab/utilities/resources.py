@@ -0,0 +1,212 @@
+"""Lazy, disk-cached discovery of VISA resources for NUPyLab procedures.
+
+Scanning every VISA bus can take several seconds when GPIB interfaces are present, so
+station procedures do not scan at import time. Instead, port parameters are declared
+with :class:`ResourceParameter`, whose choices are resolved on first use from a
+cache file that is refreshed after :data:`RESOURCE_CACHE_TTL` seconds.
+"""
+
+import json
+import logging
+import os
+import sys
+from threading import Lock
+from time import time
+from typing import Dict, Optional, Sequence, Tuple
+
+from nupylab.utilities import list_resources
+from pymeasure.experiment import ListParameter
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+#: Time in seconds after which cached resources are considered stale.
+RESOURCE_CACHE_TTL: float = 60 * 60
+#: Location of the on-disk resource cache.
+RESOURCE_CACHE_FILE: str = os.path.join(
+    os.path.expanduser("~"), ".nupylab", "visa_resources.json"
+)
+
+_cache_lock = Lock()
+_memory_cache: Dict[str, Tuple[float, Tuple[str, ...]]] = {}
+
+
+def _cache_key(query: str, backend: Optional[str]) -> str:
+    return f"{backend or ''}|{query}"
+
+
+def _read_cache_file() -> dict:
+    try:
+        with open(RESOURCE_CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_cache_file(key: str, timestamp: float, resources: Tuple[str, ...]) -> None:
+    cache = _read_cache_file()
+    cache[key] = {"timestamp": timestamp, "resources": list(resources)}
+    temp_file = RESOURCE_CACHE_FILE + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(RESOURCE_CACHE_FILE), exist_ok=True)
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(temp_file, RESOURCE_CACHE_FILE)
+    except OSError as e:
+        log.warning(
+            "Unable to write VISA resource cache %s: %s", RESOURCE_CACHE_FILE, e
+        )
+
+
+def _lookup(key: str) -> Optional[Tuple[float, Tuple[str, ...]]]:
+    with _cache_lock:
+        if key in _memory_cache:
+            return _memory_cache[key]
+        entry = _read_cache_file().get(key)
+        if entry is None:
+            return None
+        try:
+            cached = (float(entry["timestamp"]), tuple(entry["resources"]))
+        except (KeyError, TypeError, ValueError):
+            return None
+        _memory_cache[key] = cached
+        return cached
+
+
+def cache_expired(
+    query: str = "?*::INSTR",
+    backend: Optional[str] = None,
+    ttl: float = RESOURCE_CACHE_TTL,
+) -> bool:
+    """Get whether cached resources for `query` are missing or older than `ttl`.
+
+    Args:
+        query: VISA Resource Regular Expression syntax for finding devices.
+        backend: PyVISA backend, e.g. `@ivi` or `@py`. Optional, defaults to PyVISA
+            default.
+        ttl: time in seconds after which the cache is stale.
+
+    Returns:
+        True if resources should be rescanned.
+    """
+    cached = _lookup(_cache_key(query, backend))
+    return cached is None or time() - cached[0] > ttl
+
+
+def refresh_resources(
+    query: str = "?*::INSTR", backend: Optional[str] = None
+) -> Tuple[str, ...]:
+    """Scan VISA buses and update the resource cache.
+
+    Args:
+        query: VISA Resource Regular Expression syntax for finding devices.
+        backend: PyVISA backend, e.g. `@ivi` or `@py`. Optional, defaults to PyVISA
+            default.
+
+    Returns:
+        Tuple of PyVISA resources.
+    """
+    resources: Tuple[str, ...] = tuple(list_resources(query, backend))
+    if "sphinx" in sys.modules:
+        return resources
+    key = _cache_key(query, backend)
+    timestamp = time()
+    with _cache_lock:
+        _memory_cache[key] = (timestamp, resources)
+        _write_cache_file(key, timestamp, resources)
+    log.info("Found %d VISA resources matching `%s`.", len(resources), query)
+    return resources
+
+
+def cached_resources(
+    query: str = "?*::INSTR",
+    backend: Optional[str] = None,
+    ttl: float = RESOURCE_CACHE_TTL,
+    allow_stale: bool = False,
+) -> Tuple[str, ...]:
+    """Get VISA resources from the cache, scanning only if necessary.
+
+    Args:
+        query: VISA Resource Regular Expression syntax for finding devices.
+        backend: PyVISA backend, e.g. `@ivi` or `@py`. Optional, defaults to PyVISA
+            default.
+        ttl: time in seconds after which the cache is stale.
+        allow_stale: if True, return expired cache entries instead of rescanning. A
+            scan is still performed if nothing has been cached yet.
+
+    Returns:
+        Tuple of PyVISA resources.
+    """
+    cached = _lookup(_cache_key(query, backend))
+    if cached is not None and (allow_stale or time() - cached[0] <= ttl):
+        return cached[1]
+    return refresh_resources(query, backend)
+
+
+class ResourceParameter(ListParameter):
+    """:class:`ListParameter` whose choices are discovered VISA resources.
+
+    Choices are resolved lazily from :func:`cached_resources` the first time they are
+    needed, so defining a procedure class does not touch hardware.
+
+    Attributes:
+        query: VISA Resource Regular Expression syntax for finding devices.
+        backend: PyVISA backend, or None for the PyVISA default.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        query: str = "?*::INSTR",
+        backend: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        """Create resource parameter without scanning VISA buses.
+
+        Args:
+            name: the parameter name.
+            query: VISA Resource Regular Expression syntax for finding devices.
+            backend: PyVISA backend, e.g. `@ivi` or `@py`. Optional, defaults to PyVISA
+                default.
+            **kwargs: optional keyword arguments passed to :class:`ListParameter`.
+        """
+        self.query: str = query
+        self.backend: Optional[str] = backend
+        self._rescanned: bool = False
+        super().__init__(name, choices=None, **kwargs)
+
+    @property
+    def choices(self) -> Tuple[str, ...]:
+        """Get resource choices, loading them from the cache if not yet resolved."""
+        self._resolve_choices()
+        return super().choices
+
+    def _resolve_choices(self) -> None:
+        if self._choices is None:
+            self.set_choices(
+                cached_resources(self.query, self.backend, allow_stale=True)
+            )
+
+    def set_choices(self, choices: Sequence[str]) -> None:
+        """Replace resource choices, keeping the current value selectable.
+
+        Args:
+            choices: sequence of VISA resource names.
+        """
+        choices = tuple(choices)
+        if self.is_set() and self._value not in choices:
+            choices += (self._value,)
+        self._choices = {str(c): c for c in choices}
+
+    def convert(self, value):
+        """Convert value to a resource name, rescanning once if it is unknown."""
+        self._resolve_choices()
+        try:
+            return super().convert(value)
+        except ValueError:
+            if self._rescanned or value is None:
+                raise
+        self._rescanned = True
+        self.set_choices(refresh_resources(self.query, self.backend))
+        return super().convert(value)
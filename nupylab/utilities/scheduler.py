@@ -0,0 +1,191 @@
+"""Shared acquisition scheduler for NUPyLab procedures.
+
+By default, :class:`~nupylab.utilities.nupylab_procedure.NupylabProcedure` reads each
+active instrument in its own polling thread. When several procedures run in one
+process, their instrument reads can instead be registered with a single
+:class:`AcquisitionScheduler`, which times every read from one thread and executes
+reads in a bounded worker pool.
+"""
+
+import heapq
+import itertools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from math import floor
+from queue import SimpleQueue
+from threading import Condition, Event, Thread
+from time import monotonic
+from typing import Any, Callable, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class AcquisitionJob:
+    """Periodic instrument read registered with an :class:`AcquisitionScheduler`.
+
+    Jobs mirror the interface of :class:`threading.Thread` used by procedures, so they
+    are started with :meth:`start` and waited on with :meth:`join`.
+
+    Attributes:
+        process: function to call periodically, typically an instrument read.
+        queue: queue to place results in.
+        interval: time between reads in seconds.
+        active: function returning whether to keep reading.
+        start_time: monotonic time of first read.
+    """
+
+    def __init__(
+        self,
+        scheduler: "AcquisitionScheduler",
+        process: Callable[[], Any],
+        queue: SimpleQueue,
+        interval: float,
+        active: Callable[[], bool],
+    ) -> None:
+        """Create unscheduled acquisition job.
+
+        Args:
+            scheduler: scheduler that will execute the job.
+            process: function to call periodically, typically an instrument read.
+            queue: queue to place results in.
+            interval: time between reads in seconds.
+            active: function returning whether to keep reading.
+        """
+        self.process: Callable[[], Any] = process
+        self.queue: SimpleQueue = queue
+        self.interval: float = interval
+        self.active: Callable[[], bool] = active
+        self.start_time: float = 0
+        self._scheduler = scheduler
+        self._done = Event()
+
+    def start(self) -> None:
+        """Schedule first read immediately and subsequent reads every `interval`."""
+        self.start_time = monotonic()
+        self._scheduler._push(self.start_time, self)
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait until job is finished."""
+        self._done.wait(timeout)
+
+    @property
+    def done(self) -> bool:
+        """Get whether job is finished."""
+        return self._done.is_set()
+
+    def _next_time(self) -> float:
+        """Get time of next read, aligned to the job's `interval` grid."""
+        elapsed: float = monotonic() - self.start_time
+        return self.start_time + self.interval * (floor(elapsed / self.interval) + 1)
+
+
+class AcquisitionScheduler:
+    """Time instrument reads for any number of procedures from one thread.
+
+    Reads that are due are executed in a thread pool of at most `max_workers`
+    threads, and each job has at most one read in progress at a time.
+    """
+
+    def __init__(self, max_workers: int = 8) -> None:
+        """Initialize scheduler. Call :meth:`start` before starting jobs.
+
+        Args:
+            max_workers: maximum number of simultaneous instrument reads.
+        """
+        self.max_workers: int = max_workers
+        self._heap: List[Tuple[float, int, AcquisitionJob]] = []
+        self._sequence = itertools.count()
+        self._condition = Condition()
+        self._running: bool = False
+        self._thread: Optional[Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def job(
+        self,
+        process: Callable[[], Any],
+        queue: SimpleQueue,
+        interval: float,
+        active: Callable[[], bool] = lambda: True,
+    ) -> AcquisitionJob:
+        """Create acquisition job. Reads begin when the job is started.
+
+        Args:
+            process: function to call periodically, typically an instrument read.
+            queue: queue to place results in.
+            interval: time between reads in seconds.
+            active: function returning whether to keep reading.
+
+        Returns:
+            unstarted acquisition job.
+        """
+        return AcquisitionJob(self, process, queue, interval, active)
+
+    def start(self) -> None:
+        """Start scheduling thread and worker pool."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="acquisition"
+            )
+            self._thread = Thread(target=self._run, name="scheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop scheduling, wait for reads in progress, and finish all jobs."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        with self._condition:
+            for _, _, job in self._heap:
+                job._done.set()
+            self._heap.clear()
+
+    @property
+    def running(self) -> bool:
+        """Get whether scheduler is running."""
+        return self._running
+
+    def _push(self, time: float, job: AcquisitionJob) -> None:
+        with self._condition:
+            if not self._running:
+                job._done.set()
+                return
+            heapq.heappush(self._heap, (time, next(self._sequence), job))
+            self._condition.notify()
+
+    def _run(self) -> None:
+        """Dispatch jobs to the worker pool as they come due."""
+        while True:
+            with self._condition:
+                while self._running:
+                    if self._heap:
+                        wait_time: float = self._heap[0][0] - monotonic()
+                        if wait_time <= 0:
+                            break
+                        self._condition.wait(wait_time)
+                    else:
+                        self._condition.wait()
+                if not self._running:
+                    return
+                _, _, job = heapq.heappop(self._heap)
+            if not job.active():
+                job._done.set()
+                continue
+            self._executor.submit(self._execute, job)
+
+    def _execute(self, job: AcquisitionJob) -> None:
+        """Read once and reschedule job."""
+        try:
+            job.queue.put(job.process())
+        except Exception:
+            log.exception("Error reading from %r, stopping acquisition.", job.process)
+            job._done.set()
+            return
+        self._push(job._next_time(), job)
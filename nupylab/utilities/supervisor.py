@@ -0,0 +1,237 @@
+"""Single-process supervisor for running several NUPyLab stations concurrently.
+
+Each station runs its parameters table step by step, as with the
+:mod:`~nupylab.utilities.batch_runner`, but all stations share one process and one
+:class:`~nupylab.utilities.scheduler.AcquisitionScheduler` for instrument reads.
+Instruments open their own connections, but within one process PyVISA returns the
+same ``ResourceManager`` for each VISA library, so all stations already share one
+resource manager, the one :func:`nupylab.utilities.resource_manager` returns.
+
+Stations are described in a JSON file containing a list of entries such as:
+
+.. code-block:: json
+
+    [
+        {
+            "station": "s4",
+            "parameters": "C:/data/s4/parameters.csv",
+            "directory": "C:/data/s4",
+            "filename": "S4",
+            "inputs": {"record_time": 2, "furnace_port": "ASRL3::INSTR"}
+        },
+        {
+            "station": "s8",
+            "parameters": "C:/data/s8/parameters.csv",
+            "directory": "C:/data/s8"
+        }
+    ]
+
+and run from the command line with ``nupylab-supervisor stations.json``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+from threading import Event, Thread
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING, Type, Union
+
+from nupylab.utilities import NupylabError
+from nupylab.utilities.batch_runner import (
+    LOG_DATE_FORMAT,
+    load_procedure_class,
+    make_procedures,
+    read_parameters,
+    run_procedures,
+)
+from nupylab.utilities.scheduler import AcquisitionScheduler
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from nupylab.utilities.nupylab_procedure import NupylabProcedure
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# Include thread name, which identifies the station and step of each message
+LOG_FORMAT = "%(asctime)s : [%(threadName)s] %(message)s (%(levelname)s)"
+
+
+class StationSupervisor:
+    """Run multiple station procedures concurrently in one process.
+
+    Attributes:
+        scheduler: acquisition scheduler shared by all stations.
+        results: whether each station finished all steps, by station name. Filled in
+            by :meth:`run`.
+    """
+
+    def __init__(self, max_workers: int = 8) -> None:
+        """Initialize supervisor with a shared scheduler.
+
+        Args:
+            max_workers: maximum number of simultaneous instrument reads across all
+                stations.
+        """
+        self.scheduler: AcquisitionScheduler = AcquisitionScheduler(max_workers)
+        self.results: Dict[str, bool] = {}
+        self._stations: Dict[str, tuple] = {}
+        self._stop_event = Event()
+
+    def add_station(
+        self,
+        procedure_class: Union[str, Type[NupylabProcedure]],
+        parameters: Union[str, pd.DataFrame],
+        directory: str,
+        filename_base: Optional[str] = None,
+        inputs: Optional[Dict[str, Any]] = None,
+        name: Optional[str] = None,
+    ) -> str:
+        """Add station to run.
+
+        Args:
+            procedure_class: NUPyLab procedure class, or station name or
+                `module:ProcedureClass` path accepted by
+                :func:`~nupylab.utilities.batch_runner.load_procedure_class`.
+            parameters: path to parameters table .csv file, or converted parameters
+                table.
+            directory: directory to save results in.
+            filename_base: results filename prefix. Defaults to station name.
+            inputs: values of procedure parameters that are not in the table.
+            name: unique station name. Defaults to procedure class name.
+
+        Returns:
+            station name.
+
+        Raises:
+            NupylabError: if a station with the same name was already added.
+        """
+        if isinstance(procedure_class, str):
+            procedure_class = load_procedure_class(procedure_class)
+        if isinstance(parameters, str):
+            parameters = read_parameters(procedure_class, parameters)
+        name = name or procedure_class.__name__
+        if name in self._stations:
+            raise NupylabError(f"Station `{name}` was already added to supervisor.")
+        procedures: List[NupylabProcedure] = make_procedures(
+            procedure_class, parameters, inputs
+        )
+        for procedure in procedures:
+            procedure.scheduler = self.scheduler
+        self._stations[name] = (procedures, directory, filename_base or name)
+        return name
+
+    def run(self) -> Dict[str, bool]:
+        """Run all stations concurrently and wait until they are done.
+
+        Returns:
+            whether each station finished all steps, by station name.
+        """
+        if not self._stations:
+            raise NupylabError("No stations added to supervisor.")
+        self._stop_event.clear()
+        self.results = {}
+        self.scheduler.start()
+        threads = [
+            Thread(target=self._run_station, args=(name,), name=name)
+            for name in self._stations
+        ]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(1)
+        except KeyboardInterrupt:
+            log.warning("User stopped supervisor, shutting down all stations.")
+            self.stop()
+            for thread in threads:
+                thread.join()
+        finally:
+            self.scheduler.stop()
+        return self.results
+
+    def stop(self) -> None:
+        """Abort running steps and skip remaining steps on all stations."""
+        self._stop_event.set()
+
+    def _run_station(self, name: str) -> None:
+        procedures, directory, filename_base = self._stations[name]
+        log.info("Running %d steps on station %s.", len(procedures), name)
+        try:
+            self.results[name] = run_procedures(
+                procedures,
+                directory,
+                filename_base,
+                logging.getLogger().level,
+                stop_event=self._stop_event,
+                name=name,
+            )
+        except Exception:
+            log.exception("Station %s stopped with an error.", name)
+            self.results[name] = False
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run stations listed in a JSON file from the command line.
+
+    Args:
+        argv: command line arguments, defaults to `sys.argv[1:]`.
+
+    Returns:
+        exit code, 0 if all stations finished.
+    """
+    parser = argparse.ArgumentParser(
+        prog="nupylab-supervisor",
+        description="Run several NUPyLab stations concurrently in one process.",
+    )
+    parser.add_argument("stations", help="JSON file listing stations to run")
+    parser.add_argument(
+        "-l", "--log", default=None, help="log file, in addition to the console"
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=8,
+        help="maximum number of simultaneous instrument reads",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="log debug messages"
+    )
+    args = parser.parse_args(argv)
+
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+    handlers: List[logging.Handler] = [logging.StreamHandler()]
+    if args.log is not None:
+        handlers.append(logging.FileHandler(args.log))
+    for handler in handlers:
+        handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
+        root.addHandler(handler)
+
+    with open(args.stations, "r", encoding="utf-8") as f:
+        stations = json.load(f)
+    supervisor = StationSupervisor(max_workers=args.workers)
+    for station in stations:
+        directory = station.get("directory", ".")
+        os.makedirs(directory, exist_ok=True)
+        supervisor.add_station(
+            station["station"],
+            station["parameters"],
+            directory,
+            filename_base=station.get("filename"),
+            inputs=station.get("inputs"),
+            name=station.get("name"),
+        )
+    results = supervisor.run()
+    for name, finished in results.items():
+        log.info("Station %s %s.", name, "finished" if finished else "did not finish")
+    return 0 if all(results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
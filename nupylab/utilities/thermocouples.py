@@ -4,9 +4,24 @@ TYPE tuples are coefficients for converting T in Celsius to millivolts.
 INVERSE tuples are coefficients for converting millivolts to T in Celsius.
 First two values in tuple indicate lower and upper limits of equation validity,
 in Celsius for TYPE tuples and in millivolts for INVERSE tuples.
+
+Scalar conversions are provided by :func:`convert_to_temperature` and
+:func:`convert_to_voltage`. :func:`convert_to_temperature_array` and
+:func:`convert_to_voltage_array` accept NumPy arrays, e.g. a full scanner or DAQ log.
+Repeated conversions of one thermocouple type should use the precompiled converter
+returned by :func:`get_converter`. :func:`interpolate_temperature` and
+:func:`interpolate_voltage` trade a bounded error for speed using lookup tables.
+:func:`calculate_temperature_array` applies cold junction correction to arrays of
+readings, calculating the voltage of each distinct cold junction temperature once.
 """
 
-from math import exp
+from bisect import bisect_left
+from functools import lru_cache
+from math import exp, nan
+from typing import Dict, List, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
 
 TYPE_B = (
     (0.0,
@@ -388,7 +403,7 @@ TYPE_S = (
      0.00334509311344,
      6.54805192818e-06,
      -1.64856259209e-09,
-     1.29989605174-14),
+     1.29989605174e-14),
     (1664.5,
      1768.1,
      146.628232636,
@@ -494,6 +509,490 @@ INVERSE_T = (
 )
 
 
+THERMOCOUPLE_TYPES: Tuple[str, ...] = ("B", "E", "J", "K", "N", "R", "S", "T")
+
+#: Default maximum error of interpolated temperatures, in Celsius.
+TEMPERATURE_TABLE_TOLERANCE: float = 0.01
+#: Default maximum error of interpolated voltages, in millivolts.
+VOLTAGE_TABLE_TOLERANCE: float = 1e-4
+
+
+class _Polynomial:
+    """Piecewise polynomial compiled from a TYPE or INVERSE tuple.
+
+    Segment limits and coefficients are unpacked once, with coefficients stored in
+    order of decreasing power for Horner's scheme.
+    """
+
+    def __init__(self, table: tuple, exponential: bool, quantity: str) -> None:
+        """Compile piecewise polynomial.
+
+        Args:
+            table: TYPE or INVERSE tuple of segments.
+            exponential: whether the last 3 coefficients of each segment are the type K
+                exponential term.
+            quantity: name of converted quantity for error messages.
+        """
+        self.lower: float = table[0][0]
+        self.upper: float = table[-1][1]
+        self.upper_limits: Tuple[float, ...] = tuple(subset[1] for subset in table)
+        self.coefficients: Tuple[Tuple[float, ...], ...] = tuple(
+            tuple(reversed(subset[2:-3] if exponential else subset[2:]))
+            for subset in table
+        )
+        self.exponential: Tuple[Tuple[float, float, float], ...] = (
+            tuple(tuple(subset[-3:]) for subset in table) if exponential else ()
+        )
+        self.quantity: str = quantity
+
+    def __call__(self, x: float) -> float:
+        """Evaluate polynomial at scalar `x`."""
+        if x < self.lower or x > self.upper:
+            raise ValueError(f"{self.quantity} out of valid range for TC")
+        # First segment whose upper limit is not below x, as segments may overlap
+        segment = bisect_left(self.upper_limits, x)
+        result = 0.0
+        for c in self.coefficients[segment]:
+            result = result * x + c
+        if self.exponential:
+            a0, a1, a2 = self.exponential[segment]
+            result += a0 * exp(a1 * (x - a2) ** 2)
+        return result
+
+    def evaluate_array(self, values: ArrayLike) -> np.ndarray:
+        """Evaluate polynomial on an array. NaN values are returned as NaN."""
+        x = np.asarray(values, dtype=float)
+        if np.any(x < self.lower) or np.any(x > self.upper):
+            raise ValueError(f"{self.quantity} out of valid range for TC")
+        segment = np.searchsorted(self.upper_limits, x)
+        result = np.full_like(x, nan)
+        for i in range(len(self.coefficients)):
+            mask = segment == i
+            if mask.any():
+                result[mask] = self.evaluate_segment(i, x[mask])
+        return result
+
+    def evaluate_segment(self, segment: int, x: np.ndarray) -> np.ndarray:
+        """Evaluate polynomial of one segment on an array, without range checks."""
+        coefficients = self.coefficients[segment]
+        result = np.full_like(x, coefficients[0])
+        for c in coefficients[1:]:
+            result *= x
+            result += c
+        if self.exponential:
+            a0, a1, a2 = self.exponential[segment]
+            result += a0 * np.exp(a1 * (x - a2) ** 2)
+        return result
+
+    def derivative_segment(self, segment: int, x: np.ndarray) -> np.ndarray:
+        """Evaluate derivative of one segment's polynomial on an array."""
+        coefficients = self.coefficients[segment]
+        degree = len(coefficients) - 1
+        result = np.zeros_like(x)
+        for power, c in zip(range(degree, 0, -1), coefficients):
+            result *= x
+            result += power * c
+        if self.exponential:
+            a0, a1, a2 = self.exponential[segment]
+            result += 2 * a0 * a1 * (x - a2) * np.exp(a1 * (x - a2) ** 2)
+        return result
+
+    def segment_domains(self) -> List[Tuple[float, float]]:
+        """Get interval over which each segment is used.
+
+        Where segments overlap, values are assigned to the first matching segment.
+        """
+        domains = []
+        lower = self.lower
+        for upper in self.upper_limits:
+            domains.append((lower, upper))
+            lower = upper
+        return domains
+
+
+class InterpolationTable:
+    """Dense lookup table approximating a thermocouple polynomial.
+
+    Each polynomial segment is tabulated on its own uniform grid, so segment
+    boundaries are exact table nodes. The number of grid intervals is doubled until
+    the interpolation error, checked at 8 points per interval, is at most half of
+    `tolerance`. A table that cannot meet `tolerance` is never returned.
+
+    Attributes:
+        kind: `linear`, or `cubic` for cubic Hermite interpolation using exact
+            derivatives.
+        tolerance: maximum allowed deviation from the polynomial, in output units.
+        max_error: largest deviation found while verifying the table.
+        size: total number of table intervals.
+    """
+
+    def __init__(self, polynomial: _Polynomial, kind: str, tolerance: float) -> None:
+        """Build and verify table.
+
+        Args:
+            polynomial: compiled polynomial to tabulate.
+            kind: `linear` or `cubic`.
+            tolerance: maximum allowed deviation from the polynomial.
+
+        Raises:
+            ValueError if `kind` is not `linear` or `cubic`, or if `tolerance` cannot be
+            met, e.g. because it is below floating point resolution.
+        """
+        if kind not in ("linear", "cubic"):
+            raise ValueError(f"Interpolation kind must be `linear` or `cubic`: {kind}")
+        self.kind: str = kind
+        self.tolerance: float = tolerance
+        self.max_error: float = 0.0
+        self._polynomial = polynomial
+        starts, steps, offsets, tables = [], [], [], []
+        offset = 0
+        for segment, domain in enumerate(polynomial.segment_domains()):
+            table, error = self._tabulate(segment, domain)
+            starts.append(domain[0])
+            steps.append((domain[1] - domain[0]) / len(table))
+            offsets.append(offset)
+            tables.append(table)
+            offset += len(table)
+            self.max_error = max(self.max_error, error)
+        # Table position of x is x * scale + shift, within rows first to last
+        steps_array = np.array(steps)
+        self._scales = 1 / steps_array
+        self._shifts = np.array(offsets) - np.array(starts) / steps_array
+        self._first = np.array(offsets)
+        self._last = self._first + [len(table) - 1 for table in tables]
+        # One contiguous array per coefficient, for fast gathers
+        self._table = np.ascontiguousarray(np.concatenate(tables).T)
+        self.size: int = offset
+
+    def _tabulate(
+        self, segment: int, domain: Tuple[float, float]
+    ) -> Tuple[np.ndarray, float]:
+        """Get interpolation coefficients of one segment within tolerance.
+
+        Returns:
+            array of shape (intervals, 2 or 4) with coefficients in increasing power of
+            the normalized position within each interval, and the verified error.
+
+        Raises:
+            ValueError if `tolerance` is not met with 2**22 intervals.
+        """
+        lower, upper = domain
+        intervals = 16
+        check = np.linspace(0, 1, 9)[1:-1]
+        while True:
+            nodes = np.linspace(lower, upper, intervals + 1)
+            y = self._polynomial.evaluate_segment(segment, nodes)
+            y0, y1 = y[:-1], y[1:]
+            if self.kind == "linear":
+                table = np.column_stack((y0, y1 - y0))
+            else:
+                step = (upper - lower) / intervals
+                dy = step * self._polynomial.derivative_segment(segment, nodes)
+                m0, m1 = dy[:-1], dy[1:]
+                table = np.column_stack(
+                    (y0, m0, 3 * (y1 - y0) - 2 * m0 - m1, 2 * (y0 - y1) + m0 + m1)
+                )
+            x = (nodes[:-1, None] + check * (nodes[1] - nodes[0])).ravel()
+            t = np.broadcast_to(check, (intervals, check.size)).ravel()
+            rows = np.repeat(np.arange(intervals), check.size)
+            error = float(
+                np.max(
+                    np.abs(
+                        self._interpolate(table.T, rows, t)
+                        - self._polynomial.evaluate_segment(segment, x)
+                    )
+                )
+            )
+            if error <= self.tolerance / 2:
+                return table, error
+            if intervals >= 2**22:
+                if error <= self.tolerance:
+                    return table, error
+                raise ValueError(
+                    f"Interpolation table error {error:.3g} exceeds tolerance "
+                    f"{self.tolerance:.3g} at {intervals} intervals per segment"
+                )
+            intervals *= 2
+
+    @staticmethod
+    def _interpolate(table: np.ndarray, rows: np.ndarray, t: np.ndarray) -> np.ndarray:
+        result = table[-1].take(rows)
+        for column in table[-2::-1]:
+            result *= t
+            result += column.take(rows)
+        return result
+
+    def __call__(self, values: ArrayLike) -> np.ndarray:
+        """Interpolate table at `values`. NaN values are returned as NaN.
+
+        Raises:
+            ValueError if any value is outside applicable TC range.
+        """
+        x = np.asarray(values, dtype=float)
+        polynomial = self._polynomial
+        if np.any(x < polynomial.lower) or np.any(x > polynomial.upper):
+            raise ValueError(f"{polynomial.quantity} out of valid range for TC")
+        flat = x.ravel()
+        # Few segments, so comparisons are faster than searchsorted
+        segment = np.zeros(flat.shape, dtype=np.intp)
+        for upper in polynomial.upper_limits[:-1]:
+            segment += flat > upper
+        position = flat * self._scales.take(segment)
+        position += self._shifts.take(segment)
+        with np.errstate(invalid="ignore"):
+            index = position.astype(np.intp)
+        np.maximum(index, self._first.take(segment), out=index)
+        np.minimum(index, self._last.take(segment), out=index)
+        position -= index
+        return self._interpolate(self._table, index, position).reshape(x.shape)
+
+
+class ThermocoupleConverter:
+    """Precompiled voltage and temperature conversions for one thermocouple type.
+
+    Obtain instances with :func:`get_converter`, which caches one converter per type.
+
+    Attributes:
+        tc_type: thermocouple type.
+        temperature_range: lower and upper temperature limits in Celsius.
+        voltage_range: lower and upper voltage limits in millivolts.
+    """
+
+    def __init__(self, tc_type: str) -> None:
+        """Compile conversions for `tc_type`.
+
+        Args:
+            tc_type: thermocouple type.
+
+        Raises:
+            ValueError if `tc_type` is not a supported thermocouple type.
+        """
+        tc_type = tc_type.upper()
+        if tc_type not in THERMOCOUPLE_TYPES:
+            raise ValueError(f"Invalid thermocouple type: `{tc_type}`.")
+        self.tc_type: str = tc_type
+        self._to_voltage = _Polynomial(
+            globals()[f"TYPE_{tc_type}"], tc_type == "K", "temperature"
+        )
+        self._to_temperature = _Polynomial(
+            globals()[f"INVERSE_{tc_type}"], False, "voltage"
+        )
+        self.temperature_range: Tuple[float, float] = (
+            self._to_voltage.lower,
+            self._to_voltage.upper,
+        )
+        self.voltage_range: Tuple[float, float] = (
+            self._to_temperature.lower,
+            self._to_temperature.upper,
+        )
+        self._tables: Dict[tuple, InterpolationTable] = {}
+        # Cold junction temperature changes rarely, so reuse its voltage
+        self._cold_junction_voltage = lru_cache(maxsize=256)(self._to_voltage)
+
+    def __repr__(self) -> str:
+        """Represent converter by thermocouple type."""
+        return f"<{self.__class__.__name__} type {self.tc_type}>"
+
+    def to_temperature(self, millivoltage: float) -> float:
+        """Convert voltage in millivolts to temperature in Celsius."""
+        return self._to_temperature(millivoltage)
+
+    def to_voltage(self, temperature: float) -> float:
+        """Convert temperature in Celsius to voltage in millivolts."""
+        return self._to_voltage(temperature)
+
+    def to_temperature_array(self, millivoltage: ArrayLike) -> np.ndarray:
+        """Convert array of voltages in millivolts to temperatures in Celsius."""
+        return self._to_temperature.evaluate_array(millivoltage)
+
+    def to_voltage_array(self, temperature: ArrayLike) -> np.ndarray:
+        """Convert array of temperatures in Celsius to voltages in millivolts."""
+        return self._to_voltage.evaluate_array(temperature)
+
+    def temperature_table(
+        self, kind: str = "linear", tolerance: float = TEMPERATURE_TABLE_TOLERANCE
+    ) -> InterpolationTable:
+        """Get voltage to temperature lookup table, building it on first use.
+
+        Args:
+            kind: `linear` or `cubic` interpolation.
+            tolerance: maximum error in Celsius relative to the NIST polynomials.
+
+        Returns:
+            cached interpolation table.
+
+        Raises:
+            ValueError if `kind` is not `linear` or `cubic`, or if `tolerance` cannot be
+            met.
+        """
+        return self._table(self._to_temperature, kind, tolerance)
+
+    def voltage_table(
+        self, kind: str = "linear", tolerance: float = VOLTAGE_TABLE_TOLERANCE
+    ) -> InterpolationTable:
+        """Get temperature to voltage lookup table, building it on first use.
+
+        Args:
+            kind: `linear` or `cubic` interpolation.
+            tolerance: maximum error in millivolts relative to the NIST polynomials.
+
+        Returns:
+            cached interpolation table.
+
+        Raises:
+            ValueError if `kind` is not `linear` or `cubic`, or if `tolerance` cannot be
+            met.
+        """
+        return self._table(self._to_voltage, kind, tolerance)
+
+    def _table(
+        self, polynomial: _Polynomial, kind: str, tolerance: float
+    ) -> InterpolationTable:
+        key = (polynomial.quantity, kind, tolerance)
+        if key not in self._tables:
+            self._tables[key] = InterpolationTable(polynomial, kind, tolerance)
+        return self._tables[key]
+
+    def to_temperature_interpolated(
+        self,
+        millivoltage: ArrayLike,
+        kind: str = "linear",
+        tolerance: float = TEMPERATURE_TABLE_TOLERANCE,
+    ) -> np.ndarray:
+        """Convert voltages in millivolts to temperatures in Celsius by table lookup.
+
+        Args:
+            millivoltage: array of voltages in millivolts.
+            kind: `linear` or `cubic` interpolation.
+            tolerance: maximum error in Celsius relative to the NIST polynomials.
+
+        Returns:
+            array of temperatures in Celsius.
+        """
+        return self.temperature_table(kind, tolerance)(millivoltage)
+
+    def to_voltage_interpolated(
+        self,
+        temperature: ArrayLike,
+        kind: str = "linear",
+        tolerance: float = VOLTAGE_TABLE_TOLERANCE,
+    ) -> np.ndarray:
+        """Convert temperatures in Celsius to voltages in millivolts by table lookup.
+
+        Args:
+            temperature: array of temperatures in Celsius.
+            kind: `linear` or `cubic` interpolation.
+            tolerance: maximum error in millivolts relative to the NIST polynomials.
+
+        Returns:
+            array of voltages in millivolts.
+        """
+        return self.voltage_table(kind, tolerance)(temperature)
+
+    def calculate_temperature(
+        self, millivoltage: float, cold_junction_temp: float = 23
+    ) -> float:
+        """Calculate temperature with cold junction correction.
+
+        Args:
+            millivoltage: measured reading in millivolts.
+            cold_junction_temp: cold junction temperature in Celsius.
+
+        Returns:
+            corrected thermocouple temperature in Celsius.
+
+        Raises:
+            ValueError if millivoltage or cold_junction_temp are outside applicable TC
+            range.
+        """
+        return self._to_temperature(
+            millivoltage + self._cold_junction_voltage(cold_junction_temp)
+        )
+
+    def calculate_voltage(
+        self, temperature: float, cold_junction_temp: float = 23
+    ) -> float:
+        """Calculate measured voltage with cold junction correction.
+
+        Args:
+            temperature: hot junction temperature in Celsius.
+            cold_junction_temp: cold junction temperature in Celsius.
+
+        Returns:
+            measured voltage in millivolts.
+
+        Raises:
+            ValueError if temperature or cold_junction_temp are outside applicable TC
+            range.
+        """
+        return self._to_voltage(temperature) - self._cold_junction_voltage(
+            cold_junction_temp
+        )
+
+    def cold_junction_voltages(self, cold_junction_temp: ArrayLike) -> np.ndarray:
+        """Get voltages of cold junction temperatures.
+
+        The voltage of each distinct temperature is calculated once and memoized, as
+        cold junction temperatures typically change only once per scan.
+
+        Args:
+            cold_junction_temp: array of cold junction temperatures in Celsius.
+
+        Returns:
+            array of voltages in millivolts with the shape of `cold_junction_temp`.
+
+        Raises:
+            ValueError if any temperature is outside applicable TC range.
+        """
+        temperature = np.asarray(cold_junction_temp, dtype=float)
+        distinct, inverse = np.unique(temperature, return_inverse=True)
+        voltages = np.fromiter(
+            (self._cold_junction_voltage(float(t)) for t in distinct),
+            dtype=float,
+            count=distinct.size,
+        )
+        return voltages[inverse].reshape(temperature.shape)
+
+    def calculate_temperature_array(
+        self, millivoltage: ArrayLike, cold_junction_temp: ArrayLike = 23
+    ) -> np.ndarray:
+        """Calculate temperatures with cold junction correction.
+
+        Args:
+            millivoltage: array of measured readings in millivolts. NaN values are
+                returned as NaN.
+            cold_junction_temp: cold junction temperatures in Celsius, either one value
+                or an array broadcastable to `millivoltage`.
+
+        Returns:
+            array of corrected thermocouple temperatures in Celsius.
+
+        Raises:
+            ValueError if any millivoltage or cold_junction_temp are outside applicable
+            TC range.
+        """
+        return self._to_temperature.evaluate_array(
+            np.asarray(millivoltage, dtype=float)
+            + self.cold_junction_voltages(cold_junction_temp)
+        )
+
+
+@lru_cache(maxsize=None)
+def get_converter(tc_type: str) -> ThermocoupleConverter:
+    """Get cached converter for a thermocouple type.
+
+    Args:
+        tc_type: thermocouple type, `B`, `E`, `J`, `K`, `N`, `R`, `S`, or `T`.
+
+    Returns:
+        converter compiled on first request for each type.
+
+    Raises:
+        ValueError if `tc_type` is not a supported thermocouple type.
+    """
+    return ThermocoupleConverter(tc_type)
+
+
 def calculate_temperature(
     millivoltage: float, tc_type: str, cold_junction_temp: float = 23
 ) -> float:
@@ -511,8 +1010,9 @@ def calculate_temperature(
         ValueError if millivoltage or cold_junction_temp are outside applicable TC
         range.
     """
-    cj_voltage = convert_to_voltage(cold_junction_temp, tc_type)
-    return convert_to_temperature(millivoltage + cj_voltage, tc_type)
+    return get_converter(tc_type).calculate_temperature(
+        millivoltage, cold_junction_temp
+    )
 
 
 def calculate_voltage(
@@ -532,47 +1032,118 @@ def calculate_voltage(
          ValueError if temperature or cold_junction_temp are outside applicable TC
          range.
     """
-    cj_voltage = convert_to_voltage(cold_junction_temp, tc_type)
-    hj_voltage = convert_to_voltage(temperature, tc_type)
-    return hj_voltage - cj_voltage
+    return get_converter(tc_type).calculate_voltage(temperature, cold_junction_temp)
+
+
+def calculate_temperature_array(
+    millivoltage: ArrayLike, tc_type: str, cold_junction_temp: ArrayLike = 23
+) -> np.ndarray:
+    """Calculate temperatures with cold junction correction.
+
+    Voltages of distinct cold junction temperatures are calculated once and memoized.
+
+    Args:
+        millivoltage: array of measured readings in millivolts. NaN values are returned
+            as NaN.
+        tc_type: thermocouple type.
+        cold_junction_temp: cold junction temperatures in Celsius, either one value or
+            an array broadcastable to `millivoltage`.
+
+    Returns:
+        array of corrected thermocouple temperatures in Celsius.
+
+    Raises:
+        ValueError if any millivoltage or cold_junction_temp are outside applicable TC
+        range.
+    """
+    return get_converter(tc_type).calculate_temperature_array(
+        millivoltage, cold_junction_temp
+    )
 
 
 def convert_to_temperature(millivoltage: float, tc_type: str) -> float:
     """Convert voltage in millivolts to temperature in Celsius."""
-    coeff = None
-    table = globals()[f"INVERSE_{tc_type.upper()}"]
-    if millivoltage < table[0][0] or millivoltage > table[-1][1]:
-        raise ValueError("voltage out of valid range for TC")
-    for subset in table:
-        if subset[0] <= millivoltage <= subset[1]:
-            coeff = subset
-            break
-        else:
-            continue
-    temperature = 0
-    for index, c in enumerate(coeff[2:]):
-        temperature += c * millivoltage**index
-    return temperature
+    return get_converter(tc_type).to_temperature(millivoltage)
 
 
 def convert_to_voltage(temperature: float, tc_type: str) -> float:
     """Convert temperature in Celsius to voltage in millivolts."""
-    coeff = None
-    table = globals()[f"TYPE_{tc_type.upper()}"]
-    if temperature < table[0][0] or temperature > table[-1][1]:
-        raise ValueError("temperature out of valid range for TC")
-    for subset in table:
-        if subset[0] <= temperature <= subset[1]:
-            coeff = subset
-            break
-        else:
-            continue
-    millivoltage = 0
-    if tc_type.upper() != 'K':
-        for index, c in enumerate(coeff[2:]):
-            millivoltage += c * temperature**index
-    else:
-        for index, c in enumerate(coeff[2:-3]):
-            millivoltage += c * temperature**index
-        millivoltage += coeff[-3] * exp(coeff[-2] * (temperature - coeff[-1])**2)
-    return millivoltage
+    return get_converter(tc_type).to_voltage(temperature)
+
+
+def convert_to_temperature_array(millivoltage: ArrayLike, tc_type: str) -> np.ndarray:
+    """Convert voltages in millivolts to temperatures in Celsius.
+
+    Args:
+        millivoltage: array of voltages in millivolts. NaN values are returned as NaN.
+        tc_type: thermocouple type.
+
+    Returns:
+        array of temperatures in Celsius with the shape of `millivoltage`.
+
+    Raises:
+        ValueError if any voltage is outside applicable TC range.
+    """
+    return get_converter(tc_type).to_temperature_array(millivoltage)
+
+
+def convert_to_voltage_array(temperature: ArrayLike, tc_type: str) -> np.ndarray:
+    """Convert temperatures in Celsius to voltages in millivolts.
+
+    Args:
+        temperature: array of temperatures in Celsius. NaN values are returned as NaN.
+        tc_type: thermocouple type.
+
+    Returns:
+        array of voltages in millivolts with the shape of `temperature`.
+
+    Raises:
+        ValueError if any temperature is outside applicable TC range.
+    """
+    return get_converter(tc_type).to_voltage_array(temperature)
+
+
+def interpolate_temperature(
+    millivoltage: ArrayLike, tc_type: str, kind: str = "linear"
+) -> np.ndarray:
+    """Convert voltages in millivolts to temperatures in Celsius by table lookup.
+
+    Faster than :func:`convert_to_temperature_array` for large arrays, within
+    :data:`TEMPERATURE_TABLE_TOLERANCE` of the NIST polynomials. The table is built on
+    first use.
+
+    Args:
+        millivoltage: array of voltages in millivolts. NaN values are returned as NaN.
+        tc_type: thermocouple type.
+        kind: `linear` or `cubic` interpolation.
+
+    Returns:
+        array of temperatures in Celsius with the shape of `millivoltage`.
+
+    Raises:
+        ValueError if any voltage is outside applicable TC range.
+    """
+    return get_converter(tc_type).to_temperature_interpolated(millivoltage, kind)
+
+
+def interpolate_voltage(
+    temperature: ArrayLike, tc_type: str, kind: str = "linear"
+) -> np.ndarray:
+    """Convert temperatures in Celsius to voltages in millivolts by table lookup.
+
+    Faster than :func:`convert_to_voltage_array` for large arrays, within
+    :data:`VOLTAGE_TABLE_TOLERANCE` of the NIST polynomials. The table is built on
+    first use.
+
+    Args:
+        temperature: array of temperatures in Celsius. NaN values are returned as NaN.
+        tc_type: thermocouple type.
+        kind: `linear` or `cubic` interpolation.
+
+    Returns:
+        array of voltages in millivolts with the shape of `temperature`.
+
+    Raises:
+        ValueError if any temperature is outside applicable TC range.
+    """
+    return get_converter(tc_type).to_voltage_interpolated(temperature, kind)